@@ -16,15 +16,61 @@ class AlgorithmConfig:
     # Número máximo de iteraciones permitidas
     MAX_ITERATIONS: Final[int] = 100
 
-    # Iteraciones de seguridad antes de advertir sobre posible loop infinito
+    # Iteraciones de una fase a partir de las cuales se advierte sobre un posible loop infinito
     SAFETY_ITERATION_LIMIT: Final[int] = 50
 
+    # Bases recientes que se recuerdan durante una racha de pivoteos degenerados: si una
+    # se repite (ciclado) se activa la regla de Bland sin esperar al contador de pivoteos
+    # degenerados. 0 desactiva la detección
+    CYCLE_DETECTION_WINDOW: Final[int] = 64
+
     # Tolerancia numérica para comparaciones de punto flotante
     NUMERICAL_TOLERANCE: Final[float] = 1e-10
 
     # Tolerancia para detectar pivotes casi nulos
     PIVOT_TOLERANCE: Final[float] = 1e-10
 
+    # Tipo de dato del tableau: "float64" (por defecto) o "float32", que reduce a la mitad
+    # la memoria que recorre cada pivoteo a cambio de menor precisión. La solución, el
+    # valor óptimo y el análisis de sensibilidad se calculan siempre en float64
+    TABLEAU_DTYPE: Final[str] = "float64"
+
+    # Tolerancia numérica usada en lugar de NUMERICAL_TOLERANCE con un tableau float32
+    FLOAT32_TOLERANCE: Final[float] = 1e-4
+
+    # Tamaño mínimo del tableau (filas × columnas) para usar el pivoteo paralelo
+    PARALLEL_PIVOT_MIN_CELLS: Final[int] = 50_000
+
+    # Número mínimo de filas del tableau para usar el pivoteo paralelo
+    PARALLEL_PIVOT_MIN_ROWS: Final[int] = 64
+
+    # Número máximo de hilos utilizados por los kernels paralelos
+    MAX_PIVOT_THREADS: Final[int] = 8
+
+    # Pivoteo por bloques de columnas (solo compensa en tableaus muy grandes, >1000×1000)
+    TILED_TABLEAU: Final[bool] = False
+
+    # Ancho de los bloques de columnas usados por el pivoteo por bloques
+    TABLEAU_TILE_SIZE: Final[int] = 64
+
+    # Tamaño mínimo del tableau (filas × columnas) para resolver cada fase con el bucle
+    # compilado run_phase (requiere Numba)
+    COMPILED_PHASE_MIN_CELLS: Final[int] = 2_000
+
+    # Iteraciones que el kernel compilado de fase ejecuta por llamada antes de volver a
+    # Python para registrar los pasos
+    COMPILED_PHASE_CHUNK: Final[int] = 256
+
+    # Número mínimo de variables de decisión (rangos de optimalidad) o de restricciones
+    # (rangos de factibilidad) para calcular los rangos con los kernels paralelos
+    # (requiere Numba)
+    PARALLEL_SENSITIVITY_MIN_VARS: Final[int] = 2_000
+
+    # Búsqueda de soluciones alternativas en paralelo (un hilo por variable candidata):
+    # mínimo de candidatas y tamaño mínimo del tableau (filas × columnas)
+    PARALLEL_ALTERNATIVES_MIN_CANDIDATES: Final[int] = 2
+    PARALLEL_ALTERNATIVES_MIN_CELLS: Final[int] = 50_000
+
 
 # ===== CONFIGURACIÓN DE VALIDACIÓN =====
 
@@ -57,6 +103,9 @@ class FileConfig:
     # Codificación por defecto para archivos
     DEFAULT_ENCODING: Final[str] = "utf-8"
 
+    # Tamaño del búfer de lectura de archivos de problemas (bytes)
+    READ_BUFFER_SIZE: Final[int] = 64 * 1024
+
     # Palabras clave reconocidas para maximización
     MAXIMIZE_KEYWORDS: Final[tuple] = ("MAXIMIZE", "MAXIMIZAR", "MAX")
 
@@ -82,6 +131,11 @@ class LoggingConfig:
     # Nombre de la base de datos de logs
     LOG_DATABASE_NAME: Final[str] = "simplex_logs.db"
 
+    # Nivel mínimo de los eventos que se registran (DEBUG, INFO, WARNING, ERROR, CRITICAL);
+    # se puede cambiar con la variable de entorno SIMPLEX_LOG_LEVEL, por ejemplo DEBUG
+    # para registrar cada iteración del solver
+    MIN_LEVEL: Final[str] = os.getenv("SIMPLEX_LOG_LEVEL", "INFO").strip().upper()
+
     # Niveles de verbosidad
     class VerbosityLevel:
         SILENT: Final[int] = 0
@@ -3,12 +3,17 @@ Core Simplex algorithm implementation.
 Contains the main SimplexSolver class following Single Responsibility Principle.
 """
 
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List
 import numpy as np
 from simplex_solver.utils.tableau import Tableau
-from simplex_solver.logging_system import logger
+from simplex_solver.utils import kernels
+from simplex_solver.logging_system import logger, LogLevel
 from simplex_solver.config import AlgorithmConfig
-from simplex_solver.core.sensitivity import SensitivityAnalyzer
+from simplex_solver.core.sensitivity import SensitivityAnalyzer, LazySensitivityAnalysis
+from simplex_solver.core.history import StepHistory
 
 
 class SimplexSolver:
@@ -25,12 +30,17 @@ class SimplexSolver:
         """
         self.tableau = Tableau()
         self.max_iterations = AlgorithmConfig.MAX_ITERATIONS
-        self.steps = []  # Historial de pasos para la generación de reportes en PDF
+        self.steps = StepHistory()  # Historial de pasos para la generación de reportes en PDF
+        # Si es True cada paso guarda una copia de su tableau; si no, se reconstruye al consultarlo
+        self.record_full_tableaux = False
         self.verbose_level = 0  # Nivel de verbosidad para registrar iteraciones
         self._last_result = None  # Almacena el último resultado para análisis de sensibilidad
         self._original_c = None  # Coeficientes originales de la función objetivo
         self._original_b = None  # Valores originales del lado derecho de las restricciones
+        self._num_constraints = 0  # Número de restricciones del último problema
         self._find_alternative_solutions = True  # Flag para buscar soluciones alternativas
+        self._var_names: tuple = ()  # Nombres de las variables originales (x1, x2, ...)
+        self._log_iter = self._skip_iteration_log  # Registro de la solución intermedia
 
     def _get_basic_solution(self, maximize: bool) -> tuple:
         """
@@ -43,9 +53,9 @@ class SimplexSolver:
             tuple: Un diccionario con las variables básicas y su valor, y el valor óptimo.
         """
         try:
-            sol, val = self.tableau.get_solution(maximize)
-            # Asegura un orden consistente de las variables (x1, x2, ...)
-            ordered = {k: sol.get(k, 0.0) for k in sorted(sol.keys(), key=lambda s: int(s[1:]))}
+            x, val = self.tableau.get_solution_vector()
+            # Los nombres (x1, x2, ...) se generan una vez por solve y ya están en orden
+            ordered = dict(zip(self._var_names, x.tolist()))
             return ordered, float(val)
         except Exception as e:
             # Manejo de errores para evitar interrupciones en la ejecución
@@ -57,6 +67,32 @@ class SimplexSolver:
             except Exception:
                 return {}, 0.0
 
+    def _skip_iteration_log(self, iteration: int, maximize: bool) -> None:
+        """Registro de iteración vacío, usado con verbose_level <= 1."""
+
+    def _format_and_log_iter(self, iteration: int, maximize: bool) -> None:
+        """
+        Registra la solución básica y el valor actual tras una iteración (verbose_level > 1).
+
+        Args:
+            iteration: Número de iteración recién completada.
+            maximize: True para maximización, False para minimización.
+        """
+        # Extraer y formatear la solución solo si el nivel INFO se registra
+        if not logger.is_enabled_for(LogLevel.INFO):
+            return
+        try:
+            solution_dict, current_value = self._get_basic_solution(maximize)
+            solution_str = ", ".join(["%s=%.4f" % item for item in solution_dict.items()])
+            logger.info(
+                "Iteración %d - Solución básica: %s, Valor actual: %.4f",
+                iteration,
+                solution_str,
+                current_value,
+            )
+        except Exception as e:
+            logger.debug(f"No se pudo registrar solución intermedia: {e}")
+
     def _solve_phase(self, maximize: bool) -> Dict[str, Any]:
         """
         Resuelve una fase del método Simplex.
@@ -68,24 +104,55 @@ class SimplexSolver:
             dict: Un diccionario con el estado, número de iteraciones y mensajes opcionales.
         """
         iteration = 0
-        logger.debug(f"Iniciando fase del método Simplex (maximize={maximize})")
-
-        while iteration < self.max_iterations - 1:
+        # Pivoteos degenerados consecutivos (RHS de la fila saliente ~ 0); si superan el
+        # número de variables básicas se activa la regla de Bland para evitar ciclos
+        degenerate_count = 0
+        self.tableau.use_bland = False
+        self.steps.start_phase(self.tableau.basic_vars, self.tableau.tableau, self.tableau.tol)
+        logger.debug("Iniciando fase del método Simplex (maximize=%s)", maximize)
+
+        # En modo silencioso, las fases de tableaus medianos y grandes se resuelven con el
+        # bucle compilado; el historial con una copia del tableau por paso (depuración)
+        # usa siempre el bucle en Python
+        if (
+            self.verbose_level == 0
+            and not (self.steps.enabled and self.steps.record_full_tableaux)
+            and kernels.use_compiled_phase(*self.tableau.tableau.shape)
+        ):
+            return self._solve_phase_jit(maximize)
+
+        # Constantes del bucle ligadas a variables locales; el arreglo del tableau y la
+        # base se modifican en el lugar, por lo que las referencias siguen siendo válidas
+        # toda la fase
+        tab = self.tableau
+        steps = self.steps
+        T = tab.tableau
+        basic_vars = tab.basic_vars
+        num_basic = len(basic_vars)
+        verbose = self.verbose_level
+        max_iter = self.max_iterations - 1
+        safety_limit = AlgorithmConfig.SAFETY_ITERATION_LIMIT
+        tol = tab.tol
+        # Bases visitadas desde el último pivoteo no degenerado, para detectar ciclos
+        recent_bases = deque([basic_vars.tobytes()], maxlen=AlgorithmConfig.CYCLE_DETECTION_WINDOW)
+
+        while iteration < max_iter:
             iteration += 1
-            logger.debug(f"Iteración {iteration}: Verificando optimalidad")
+            logger.debug("Iteración %d: Verificando optimalidad", iteration)
 
-            # Verifica si la solución actual es óptima
-            is_optimal = self.tableau.is_optimal(maximize)
+            # Verifica si la solución actual es óptima y elige la variable entrante
+            # (una sola lectura de la fila objetivo)
+            entering_col, is_optimal = tab.optimality_and_entering(maximize)
 
             if is_optimal:
                 logger.info(f"Solución óptima encontrada en la iteración {iteration}")
 
-                if self.verbose_level > 0:
+                if verbose > 0:
                     logger.info(
                         "Condición de optimalidad alcanzada: no hay coeficientes en la fila objetivo que mejoren la función"
                     )
 
-                if self.verbose_level > 1:
+                if verbose > 1 and logger.is_enabled_for(LogLevel.INFO):
                     try:
                         final_solution, final_value = self._get_basic_solution(maximize)
                         solution_str = ", ".join(
@@ -99,19 +166,16 @@ class SimplexSolver:
 
                 return {"status": "optimal", "iterations": iteration}
 
-            # Encuentra la variable entrante
-            entering_col = self.tableau.get_entering_variable(maximize)
-
             if entering_col == -1:
                 logger.info("No se encontró variable entrante - solución óptima")
                 return {"status": "optimal", "iterations": iteration}
 
-            logger.debug(f"Variable entrante: columna {entering_col + 1}")
-            if self.verbose_level > 1:
-                logger.info(f"Variable entrante: columna {entering_col + 1}")
+            logger.debug("Variable entrante: columna %d", entering_col + 1)
+            if verbose > 1:
+                logger.info("Variable entrante: columna %d", entering_col + 1)
 
             # Verifica si el problema es no acotado
-            if self.tableau.is_unbounded(entering_col):
+            if tab.is_unbounded(entering_col):
                 logger.warning(f"Problema no acotado detectado en la iteración {iteration}")
                 return {
                     "status": "unbounded",
@@ -120,7 +184,7 @@ class SimplexSolver:
                 }
 
             # Encuentra la variable saliente
-            leaving_row, pivot = self.tableau.get_leaving_variable(entering_col)
+            leaving_row, pivot = tab.get_leaving_variable(entering_col)
 
             if leaving_row == -1:
                 logger.error(f"No se pudo encontrar variable saliente en la iteración {iteration}")
@@ -130,49 +194,177 @@ class SimplexSolver:
                     "iterations": iteration,
                 }
 
-            logger.debug(f"Variable saliente: fila {leaving_row + 1}, pivote: {pivot:.4f}")
-            if self.verbose_level > 1:
-                logger.info(f"Variable saliente: fila {leaving_row + 1}, pivote: {pivot:.4f}")
+            logger.debug("Variable saliente: fila %d, pivote: %.4f", leaving_row + 1, pivot)
+            if verbose > 1:
+                logger.info("Variable saliente: fila %d, pivote: %.4f", leaving_row + 1, pivot)
+
+            # Detección de ciclado: la regla de Bland garantiza terminación finita
+            if T[leaving_row, -1] < tol:
+                degenerate_count += 1
+                if degenerate_count > num_basic and not tab.use_bland:
+                    logger.debug(
+                        "%d pivoteos degenerados consecutivos, activando regla de Bland",
+                        degenerate_count,
+                    )
+                    tab.use_bland = True
+            else:
+                degenerate_count = 0
+                tab.use_bland = False
 
             # Almacena el paso para el reporte en PDF
-            self.steps.append(
-                {
-                    "iteration": iteration,
-                    "tableau": (
-                        self.tableau.tableau.copy() if self.tableau.tableau is not None else None
-                    ),
-                    "basic_vars": self.tableau.basic_vars.copy(),
-                    "entering_var": entering_col,
-                    "leaving_var": self.tableau.basic_vars[leaving_row],
-                    "pivot_coords_next": {
-                        "entering_col": entering_col,
-                        "leaving_row": leaving_row,
-                    },
-                }
+            steps.record(
+                iteration,
+                T,
+                entering_var=entering_col,
+                leaving_row=leaving_row,
+                leaving_var=basic_vars[leaving_row],
             )
 
             # Realiza el pivoteo
-            self.tableau.pivot(entering_col, leaving_row)
-            logger.debug(f"Pivote completado: [{leaving_row}, {entering_col}]")
-
-            # Registra solución intermedia si verbose_level > 1
-            if self.verbose_level > 1:
-                try:
-                    solution_dict, current_value = self._get_basic_solution(maximize)
-                    solution_str = ", ".join(
-                        [f"{var}={val:.4f}" for var, val in solution_dict.items()]
-                    )
-                    logger.info(
-                        f"Iteración {iteration} - Solución básica: {solution_str}, Valor actual: {current_value:.4f}"
-                    )
-                except Exception as e:
-                    logger.debug(f"No se pudo registrar solución intermedia: {e}")
+            tab.pivot(entering_col, leaving_row)
+            logger.debug("Pivote completado: [%d, %d]", leaving_row, entering_col)
+
+            # Una base repetida sin pivoteos no degenerados intermedios es un ciclo: se
+            # activa la regla de Bland antes de que lo detecte el contador
+            if degenerate_count == 0:
+                recent_bases.clear()
+            basis_key = basic_vars.tobytes()
+            if degenerate_count and not tab.use_bland and basis_key in recent_bases:
+                logger.debug("Base repetida en una racha degenerada, activando regla de Bland")
+                tab.use_bland = True
+            recent_bases.append(basis_key)
+
+            # Registra solución intermedia (no-op salvo con verbose_level > 1)
+            self._log_iter(iteration, maximize)
+
+            if iteration == safety_limit:
+                logger.warning(
+                    f"La fase lleva {iteration} iteraciones; continuando hasta el máximo "
+                    f"de {self.max_iterations}"
+                )
+
+        logger.error(f"Se alcanzó el máximo de iteraciones: {self.max_iterations}")
+        return {
+            "status": "error",
+            "message": "Demasiadas iteraciones",
+            "iterations": iteration,
+        }
+
+    def _solve_phase_jit(self, maximize: bool) -> Dict[str, Any]:
+        """
+        Resuelve una fase con el bucle compilado ``kernels.run_phase`` (requiere Numba).
+
+        El kernel ejecuta bloques de iteraciones (optimalidad, variable entrante, prueba
+        del cociente, pivoteo, actualización de la base y detección de ciclado) sin
+        volver a Python; entre bloques solo se registran los pivoteos en el historial.
+        Aplica las mismas reglas que ``_solve_phase``, por lo que el resultado es idéntico.
+
+        Args:
+            maximize: True para maximización, False para minimización.
+
+        Returns:
+            dict: Un diccionario con el estado, número de iteraciones y mensajes opcionales.
+        """
+        tab = self.tableau
+        table = tab.tableau
+        basic_vars = tab.basic_vars
+        phase1 = tab.phase == 1
+        excluded = np.zeros(table.shape[1] - 1, dtype=np.bool_)
+        if phase1 and tab.artificial_vars:
+            excluded[tab.artificial_vars] = True
+        mode = kernels.select_pivot_mode(*table.shape)
+
+        max_iter = self.max_iterations - 1
+        safety_limit = AlgorithmConfig.SAFETY_ITERATION_LIMIT
+        pivot_tol = AlgorithmConfig.PIVOT_TOLERANCE
+        tile_size = AlgorithmConfig.TABLEAU_TILE_SIZE
+        chunk = max(1, min(AlgorithmConfig.COMPILED_PHASE_CHUNK, max_iter))
+
+        entering_cols = np.empty(chunk, dtype=np.intp)
+        leaving_rows = np.empty(chunk, dtype=np.intp)
+        leaving_vars = np.empty(chunk, dtype=np.intp)
+        # Anillo de bases visitadas en la racha degenerada actual y su estado
+        # (bases guardadas, próxima posición); empieza con la base inicial
+        window = AlgorithmConfig.CYCLE_DETECTION_WINDOW
+        recent_bases = np.empty((window, basic_vars.shape[0]), dtype=np.intp)
+        recent_state = np.zeros(2, dtype=np.intp)
+        if window > 0:
+            recent_bases[0] = basic_vars
+            recent_state[:] = (1, 1 % window)
 
-            if iteration > AlgorithmConfig.SAFETY_ITERATION_LIMIT:
+        iteration = 0
+        degenerate_count = 0
+        while iteration < max_iter:
+            limit = min(chunk, max_iter - iteration)
+            with kernels.limited_threads(mode == kernels.PIVOT_PARALLEL):
+                status, pivoted, tab.use_bland, degenerate_count, activations = kernels.run_phase(
+                    table,
+                    basic_vars,
+                    excluded,
+                    phase1,
+                    maximize,
+                    tab.use_bland,
+                    degenerate_count,
+                    tab.tol,
+                    pivot_tol,
+                    mode,
+                    tile_size,
+                    entering_cols[:limit],
+                    leaving_rows[:limit],
+                    leaving_vars[:limit],
+                    recent_bases,
+                    recent_state,
+                )
+
+            for k in range(pivoted if self.steps.enabled else 0):
+                self.steps.record(
+                    iteration + k + 1,
+                    entering_var=entering_cols[k],
+                    leaving_row=leaving_rows[k],
+                    leaving_var=leaving_vars[k],
+                )
+            if activations:
+                logger.debug(
+                    "Regla de Bland activada %d veces por pivoteos degenerados o bases repetidas",
+                    activations,
+                )
+            if iteration < safety_limit <= iteration + pivoted:
                 logger.warning(
-                    f"Demasiadas iteraciones ({iteration}), deteniendo en el límite de seguridad"
+                    f"La fase lleva {safety_limit} iteraciones; continuando hasta el máximo "
+                    f"de {self.max_iterations}"
                 )
-                return {"status": "error", "message": "Demasiadas iteraciones"}
+            iteration += pivoted
+
+            if status == kernels.STEP_PIVOTED:
+                continue
+
+            # La iteración que terminó la fase
+            iteration += 1
+            if status == kernels.STEP_OPTIMAL:
+                logger.info(f"Solución óptima encontrada en la iteración {iteration}")
+                return {"status": "optimal", "iterations": iteration}
+
+            if status == kernels.STEP_UNBOUNDED:
+                logger.warning(f"Problema no acotado detectado en la iteración {iteration}")
+                return {
+                    "status": "unbounded",
+                    "message": "El problema es no acotado",
+                    "iterations": iteration,
+                }
+
+            if status == kernels.STEP_NO_LEAVING:
+                logger.error(f"No se pudo encontrar variable saliente en la iteración {iteration}")
+                return {
+                    "status": "error",
+                    "message": "No se pudo encontrar variable saliente",
+                    "iterations": iteration,
+                }
+
+            pivot = table[leaving_rows[pivoted], entering_cols[pivoted]]
+            raise ZeroDivisionError(
+                f"Pivote casi nulo ({pivot:.2e}) detectado durante pivoteo. "
+                "Esto indica un problema mal condicionado en la formulación."
+            )
 
         logger.error(f"Se alcanzó el máximo de iteraciones: {self.max_iterations}")
         return {
@@ -189,36 +381,61 @@ class SimplexSolver:
         constraint_types: list,
         maximize: bool = True,
         verbose_level: int = 0,
+        include_sensitivity: bool = True,
+        record_steps: bool = True,
     ) -> Dict[str, Any]:
         """
         Resuelve un problema de programación lineal utilizando el método Simplex.
 
         Args:
             c: Coeficientes de la función objetivo.
-            A: Matriz de coeficientes de las restricciones.
+            A: Matriz de coeficientes de las restricciones. Puede ser una matriz dispersa
+                (con método ``tocoo``, como las de scipy.sparse); el tableau se construye
+                copiando solo sus elementos no nulos.
             b: Vector del lado derecho de las restricciones.
             constraint_types: Tipos de restricciones ('<=', '>=', '=').
             maximize: True para maximizar, False para minimizar.
             verbose_level: Nivel de verbosidad (0=silencioso, 1=información básica, 2=iteraciones detalladas).
+            include_sensitivity: Si es False no se adjunta el análisis de sensibilidad al
+                resultado (``result["sensitivity_analysis"]`` será None). Si es True se
+                adjunta un análisis perezoso que solo se calcula al consultarlo (None si
+                el tableau no tiene una columna de holgura por restricción).
+            record_steps: Si es False no se registra el historial de pasos (ni las copias
+                del tableau al inicio de cada fase); ``result["steps"]`` queda vacío, por lo
+                que el resultado no sirve para generar reportes paso a paso.
 
         Returns:
             dict: Un diccionario con la solución, valor óptimo, estado y número de iteraciones.
         """
         self.verbose_level = verbose_level
+        # El registro por iteración se elige una sola vez en lugar de comprobarlo en cada paso
+        self._log_iter = (
+            self._format_and_log_iter if verbose_level > 1 else self._skip_iteration_log
+        )
 
         logger.info(
-            f"Iniciando solver - Variables: {len(c)}, Restricciones: {len(A)}, "
+            f"Iniciando solver - Variables: {len(c)}, Restricciones: {len(b)}, "
             f"Tipo: {'MAX' if maximize else 'MIN'}"
         )
         self.steps.clear()  # Limpia el historial de pasos
-
-        # Almacena los datos originales para análisis de sensibilidad
-        self._original_c = np.array(c)
-        self._original_b = np.array(b)
+        self.steps.record_full_tableaux = self.record_full_tableaux
+        self.steps.enabled = record_steps
+
+        # Convierte una sola vez los datos originales (se reutilizan en ambas fases y en
+        # el análisis de sensibilidad)
+        c_arr = np.asarray(c, dtype=np.float64)
+        b_arr = np.asarray(b, dtype=np.float64)
+        self._original_c = c_arr
+        self._original_b = b_arr
+        self._num_constraints = b_arr.shape[0]
         self._maximize = maximize
 
         # Construye el tableau inicial
-        self.tableau.build_initial_tableau(c, A, b, constraint_types, maximize)
+        self.tableau.build_initial_tableau(c_arr, A, b_arr, constraint_types, maximize)
+        # Invariante: desde aquí el tableau existe durante todo el solve (las fases no
+        # vuelven a comprobarlo)
+        assert self.tableau.tableau is not None, "El tableau no se construyó"
+        self._var_names = tuple(f"x{i + 1}" for i in range(self.tableau.num_vars))
         logger.debug("Tableau inicial construido")
 
         total_iterations = 0
@@ -245,8 +462,7 @@ class SimplexSolver:
 
             # Verifica factibilidad
             if (
-                self.tableau.tableau is not None
-                and abs(self.tableau.tableau[-1, -1]) > 1e-10
+                abs(self.tableau.tableau[-1, -1]) > self.tableau.tol
                 or self.tableau.has_artificial_vars_in_basis()
             ):
                 logger.warning("Problema infactible detectado en la Fase 1")
@@ -267,7 +483,7 @@ class SimplexSolver:
             else:
                 logger.debug("Iniciando Fase 2")
 
-            self.tableau.setup_phase2(np.array(c), maximize)
+            self.tableau.setup_phase2(c_arr, maximize)
 
         # Fase 2 (o fase única)
         if not self.tableau.artificial_vars:
@@ -287,18 +503,7 @@ class SimplexSolver:
             )
 
             # Almacena el estado final para el reporte
-            self.steps.append(
-                {
-                    "iteration": total_iterations,
-                    "tableau": (
-                        self.tableau.tableau.copy() if self.tableau.tableau is not None else None
-                    ),
-                    "basic_vars": self.tableau.basic_vars.copy(),
-                    "entering_var": None,
-                    "leaving_var": None,
-                    "pivot_coords_next": None,
-                }
-            )
+            self.steps.record(total_iterations, self.tableau.tableau)
 
             # Buscar soluciones alternativas
             alternative_solutions = []
@@ -333,20 +538,64 @@ class SimplexSolver:
             # Almacena el resultado para análisis de sensibilidad
             self._last_result = result
 
-            # Incluir análisis de sensibilidad automáticamente
-            try:
-                logger.info("Calculando análisis de sensibilidad...")
-                sensitivity = self.get_sensitivity_analysis()
-                result["sensitivity_analysis"] = sensitivity
-                logger.info("Análisis de sensibilidad incluido en el resultado")
-            except Exception as e:
-                logger.warning(f"No se pudo calcular el análisis de sensibilidad: {e}")
+            # Incluir análisis de sensibilidad; se calcula recién cuando se consulta.
+            # Las básicas se copian porque la instancia de Tableau se reutiliza
+            # en el próximo solve; el tableau en cambio se reemplaza por uno nuevo.
+            # Sin una columna de holgura por restricción (por ejemplo, si todas son "=")
+            # el análisis no puede calcularse y queda en None, como antes
+            has_slack_columns = (
+                self.tableau.num_vars + self._num_constraints <= self.tableau.tableau.shape[1]
+            )
+            if include_sensitivity and not has_slack_columns:
+                logger.warning(
+                    "No se pudo calcular el análisis de sensibilidad: el tableau no tiene una "
+                    "columna de holgura por restricción"
+                )
+                result["sensitivity_analysis"] = None
+            elif include_sensitivity:
+                result["sensitivity_analysis"] = LazySensitivityAnalysis(
+                    tableau=self.tableau.tableau,
+                    basic_vars=self.tableau.basic_vars.copy(),
+                    num_vars=self.tableau.num_vars,
+                    num_constraints=self._num_constraints,
+                    original_c=c_arr,
+                    original_b=b_arr,
+                )
+            else:
                 result["sensitivity_analysis"] = None
 
             return result
         else:
             return {**phase2_result, "iterations": total_iterations}
 
+    def reconstruct_basic_vars(self, step_idx: int) -> List[int]:
+        """
+        Reconstruye las variables básicas de un paso del historial.
+
+        El historial solo guarda el cambio de base de cada pivoteo; este método aplica
+        esos cambios desde la base inicial de la fase correspondiente.
+
+        Args:
+            step_idx: Índice del paso en ``self.steps`` (se admiten índices negativos).
+
+        Returns:
+            list: Variables básicas antes del pivoteo de ese paso.
+        """
+        return self.steps.basic_vars_at(step_idx)
+
+    def replay_steps(self) -> StepHistory:
+        """
+        Reconstruye los tableaus de todos los pasos del historial.
+
+        Durante la resolución solo se registran los pivoteos; los tableaus intermedios se
+        reconstruyen al consultarlos. Este método los reconstruye todos de una vez, por
+        ejemplo antes de generar un reporte completo.
+
+        Returns:
+            StepHistory: El historial de pasos con todos sus tableaus disponibles.
+        """
+        return self.steps.replay()
+
     def get_sensitivity_analysis(self) -> Dict[str, Any]:
         """
         Realiza un análisis de sensibilidad sobre la solución óptima.
@@ -385,9 +634,9 @@ class SimplexSolver:
         # Crea el analizador de sensibilidad
         analyzer = SensitivityAnalyzer(
             tableau=self.tableau.tableau,
-            basic_vars=self.tableau.basic_vars,
+            basic_vars=self.tableau.basic_vars.copy(),
             num_vars=self.tableau.num_vars,
-            num_constraints=len(self._original_b),
+            num_constraints=self._num_constraints,
         )
 
         # Realiza el análisis
@@ -409,10 +658,10 @@ class SimplexSolver:
 
         El método funciona de la siguiente manera:
         1. Identifica todas las variables no básicas con costo reducido cero
-        2. Para cada una, guarda el estado actual del tableau
-        3. Realiza un pivoteo con esa variable como entrante
+        2. Para cada una, verifica sobre el tableau original que el pivoteo sea posible
+        3. Realiza el pivoteo sobre una copia en un buffer auxiliar reutilizado
         4. Extrae la nueva solución básica (que tendrá el mismo valor objetivo)
-        5. Restaura el tableau al estado original para probar la siguiente variable
+        5. Restaura la base original para probar la siguiente variable
 
         Args:
             maximize: True para maximización, False para minimización.
@@ -425,8 +674,8 @@ class SimplexSolver:
             La lista está vacía si no hay soluciones alternativas.
 
         Note:
-            Este método preserva el estado del tableau, restaurándolo después de
-            explorar cada alternativa.
+            Este método preserva el estado del tableau: el arreglo original nunca se
+            modifica y la base se restaura después de explorar cada alternativa.
         """
         alternative_solutions = []
 
@@ -446,113 +695,216 @@ class SimplexSolver:
             f"Encontradas {len(zero_cost_vars)} variables candidatas para soluciones alternativas"
         )
 
-        # Guardar el estado original del tableau
-        original_tableau = self.tableau.tableau.copy()
+        # Estado óptimo original: el arreglo no se modifica (los pivoteos se hacen sobre
+        # buffers auxiliares), por lo que no se copia; solo se guarda la base
+        original_tableau = self.tableau.tableau
         original_basic_vars = self.tableau.basic_vars.copy()
+        tol = self.tableau.tol
+
+        # Las soluciones se comparan como vectores: la primera y una matriz con una fila
+        # por alternativa encontrada (se convierten a diccionarios al final)
+        first_x = np.fromiter(first_solution.values(), dtype=np.float64, count=len(first_solution))
+        found = np.empty((len(zero_cost_vars), len(first_x)))
+        num_found = 0
+
+        # Cada candidata se pivotea de forma independiente desde el óptimo original; en
+        # tableaus grandes se exploran en paralelo, cada hilo con su propia copia ligera
+        # de la tabla y su propio buffer auxiliar (la tabla del solver no se toca)
+        explore_in_place = not self._use_parallel_alternatives(
+            len(zero_cost_vars), original_tableau.shape
+        )
+        if not explore_in_place:
+            outcomes = self._explore_alternatives_parallel(
+                zero_cost_vars, original_tableau, original_basic_vars
+            )
+        else:
+            # Un único buffer auxiliar que se rellena con np.copyto para cada candidata
+            scratch_tableau = np.empty_like(original_tableau)
+            outcomes = (
+                self._explore_alternative(
+                    self.tableau, col, original_tableau, original_basic_vars, scratch_tableau
+                )
+                for col in zero_cost_vars
+            )
 
-        for entering_col in zero_cost_vars:
-            try:
-                # Restaurar tableau al estado óptimo original antes de cada pivoteo
-                self.tableau.tableau = original_tableau.copy()
-                self.tableau.basic_vars = original_basic_vars.copy()
+        # Los resultados se procesan en el orden de las candidatas, por lo que las
+        # soluciones encontradas no dependen de si la exploración fue en paralelo
+        for entering_col, (status, alt_x, alt_value) in zip(zero_cost_vars, outcomes):
+            logger.debug(
+                "Explorando solución alternativa con variable entrante: columna %d", entering_col
+            )
 
-                logger.debug(
-                    f"Explorando solución alternativa con variable entrante: columna {entering_col}"
+            if status == "unbounded":
+                logger.debug("Variable %d produce problema no acotado, omitiendo", entering_col)
+                continue
+            if status == "no_leaving":
+                logger.debug("No se pudo encontrar variable saliente para columna %d", entering_col)
+                continue
+            if status == "error":
+                logger.warning(
+                    f"Error al explorar solución alternativa con variable {entering_col}: {alt_x}"
                 )
+                continue
 
-                # Verificar si el pivoteo es posible (no unbounded)
-                if self.tableau.is_unbounded(entering_col):
-                    logger.debug(f"Variable {entering_col} produce problema no acotado, omitiendo")
-                    continue
+            # Verificar que el valor objetivo se mantiene (dentro de tolerancia)
+            if abs(alt_value - optimal_value) < tol:
+                # Verificar que la solución es diferente de la primera y de las ya encontradas
+                if self._is_different_solution(alt_x, first_x) and not self._solution_exists(
+                    alt_x, found[:num_found]
+                ):
+                    found[num_found] = alt_x
+                    num_found += 1
+                    logger.info(
+                        f"Solución alternativa #{num_found} encontrada con valor {alt_value:.6f}"
+                    )
+                else:
+                    logger.debug("Solución duplicada o idéntica a la primera, omitiendo")
+            else:
+                logger.warning(
+                    f"Pivoteo produjo valor diferente: {alt_value:.6f} vs {optimal_value:.6f}"
+                )
 
-                # Encontrar variable saliente
-                leaving_row, pivot = self.tableau.get_leaving_variable(entering_col)
+        # Restaurar tableau al estado óptimo original (solo la exploración en el lugar
+        # lo cambia; se reasigna la referencia, sin copiar el arreglo)
+        if explore_in_place:
+            self.tableau.tableau = original_tableau
+            self.tableau.basic_vars[:] = original_basic_vars
 
-                if leaving_row == -1:
-                    logger.debug(
-                        f"No se pudo encontrar variable saliente para columna {entering_col}"
-                    )
-                    continue
+        alternative_solutions = [Tableau.solution_to_dict(x) for x in found[:num_found]]
+        return alternative_solutions
 
-                logger.debug(
-                    f"Pivoteando: entrante={entering_col}, saliente={self.tableau.basic_vars[leaving_row]}"
-                )
+    @staticmethod
+    def _use_parallel_alternatives(num_candidates: int, shape: tuple) -> bool:
+        """
+        Indica si conviene explorar las soluciones alternativas en paralelo.
 
-                # Realizar pivoteo
-                self.tableau.pivot(entering_col, leaving_row)
+        Args:
+            num_candidates: Número de variables candidatas a entrar.
+            shape: Dimensiones (filas, columnas) del tableau óptimo.
 
-                # Extraer la nueva solución
-                alt_solution, alt_value = self.tableau.get_solution(maximize)
+        Returns:
+            bool: True si hay suficientes candidatas y el tableau es grande.
+        """
+        return (
+            num_candidates >= AlgorithmConfig.PARALLEL_ALTERNATIVES_MIN_CANDIDATES
+            and shape[0] * shape[1] >= AlgorithmConfig.PARALLEL_ALTERNATIVES_MIN_CELLS
+            and (os.cpu_count() or 1) > 1
+        )
 
-                # Verificar que el valor objetivo se mantiene (dentro de tolerancia)
-                if abs(alt_value - optimal_value) < AlgorithmConfig.NUMERICAL_TOLERANCE:
-                    # Verificar que la solución es diferente de la primera y de las ya encontradas
-                    if self._is_different_solution(
-                        alt_solution, first_solution
-                    ) and not self._solution_exists(alt_solution, alternative_solutions):
-                        alternative_solutions.append(alt_solution)
-                        logger.info(
-                            f"Solución alternativa #{len(alternative_solutions)} encontrada con valor {alt_value:.6f}"
-                        )
-                    else:
-                        logger.debug("Solución duplicada o idéntica a la primera, omitiendo")
-                else:
-                    logger.warning(
-                        f"Pivoteo produjo valor diferente: {alt_value:.6f} vs {optimal_value:.6f}"
-                    )
+    @staticmethod
+    def _explore_alternative(
+        tab: Tableau,
+        entering_col: int,
+        original_tableau: np.ndarray,
+        original_basic_vars: np.ndarray,
+        scratch_tableau: np.ndarray,
+    ) -> tuple:
+        """
+        Pivotea la variable candidata desde el óptimo original y extrae la solución.
 
-            except Exception as e:
-                logger.warning(
-                    f"Error al explorar solución alternativa con variable {entering_col}: {e}"
-                )
-                continue
+        No registra nada en el log, para poder ejecutarse desde hilos de trabajo; el
+        resultado se informa con un estado.
 
-        # Restaurar tableau al estado óptimo original
-        self.tableau.tableau = original_tableau
-        self.tableau.basic_vars = original_basic_vars
+        Args:
+            tab: Tabla sobre la que se pivotea (se restaura al óptimo original al empezar).
+            entering_col: Columna de la variable candidata.
+            original_tableau: Tableau óptimo original (solo lectura).
+            original_basic_vars: Base óptima original.
+            scratch_tableau: Buffer auxiliar donde se realiza el pivoteo.
 
-        return alternative_solutions
+        Returns:
+            tuple: (estado, x, valor) con estado ``"pivoted"``, ``"unbounded"``,
+            ``"no_leaving"`` o ``"error"`` (en ese caso ``x`` es la excepción).
+        """
+        try:
+            # Restaurar el estado óptimo original; las comprobaciones previas al
+            # pivoteo solo leen el tableau, por lo que no necesitan una copia
+            tab.tableau = original_tableau
+            tab.basic_vars[:] = original_basic_vars
+
+            if tab.is_unbounded(entering_col):
+                return "unbounded", None, 0.0
+
+            leaving_row, _ = tab.get_leaving_variable(entering_col)
+            if leaving_row == -1:
+                return "no_leaving", None, 0.0
+
+            # Realizar pivoteo sobre el buffer auxiliar
+            np.copyto(scratch_tableau, original_tableau)
+            tab.tableau = scratch_tableau
+            tab.pivot(entering_col, leaving_row)
 
-    def _is_different_solution(
-        self, solution1: Dict[str, float], solution2: Dict[str, float]
-    ) -> bool:
+            alt_x, alt_value = tab.get_solution_vector()
+            return "pivoted", alt_x, alt_value
+        except Exception as e:
+            return "error", e, 0.0
+
+    def _explore_alternatives_parallel(
+        self,
+        zero_cost_vars: List[int],
+        original_tableau: np.ndarray,
+        original_basic_vars: np.ndarray,
+    ) -> List[tuple]:
+        """
+        Explora las variables candidatas en un pool de hilos.
+
+        Cada tarea usa una copia ligera de la tabla (``Tableau.fork``) y su propio buffer
+        auxiliar; el pivoteo compilado libera el GIL, por lo que los hilos avanzan en
+        paralelo sobre tableaus distintos.
+
+        Args:
+            zero_cost_vars: Columnas candidatas, en orden.
+            original_tableau: Tableau óptimo original (solo lectura).
+            original_basic_vars: Base óptima original.
+
+        Returns:
+            list: Un resultado de ``_explore_alternative`` por candidata, en el mismo orden.
+        """
+
+        def explore(entering_col: int) -> tuple:
+            return self._explore_alternative(
+                self.tableau.fork(),
+                entering_col,
+                original_tableau,
+                original_basic_vars,
+                np.empty_like(original_tableau),
+            )
+
+        max_workers = min(
+            len(zero_cost_vars), os.cpu_count() or 1, AlgorithmConfig.MAX_PIVOT_THREADS
+        )
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(explore, zero_cost_vars))
+
+    def _is_different_solution(self, solution1: np.ndarray, solution2: np.ndarray) -> bool:
         """
         Compara dos soluciones para determinar si son significativamente diferentes.
 
         Args:
-            solution1: Primera solución a comparar.
+            solution1: Primera solución a comparar (vector de variables originales).
             solution2: Segunda solución a comparar.
 
         Returns:
             True si las soluciones son diferentes (al menos una variable difiere
             más allá de la tolerancia numérica), False si son esencialmente iguales.
         """
-        # Verificar que tengan las mismas variables
-        if set(solution1.keys()) != set(solution2.keys()):
-            return True
-
-        # Comparar cada variable
-        for var in solution1:
-            diff = abs(solution1[var] - solution2[var])
-            if diff > AlgorithmConfig.NUMERICAL_TOLERANCE:
-                return True
-
-        return False
+        if solution1.size == 0:
+            return False
+        # Una sola reducción (máxima diferencia absoluta) en lugar de comparar variable a variable
+        return bool(np.max(np.abs(solution1 - solution2)) > self.tableau.tol)
 
-    def _solution_exists(
-        self, solution: Dict[str, float], solution_list: List[Dict[str, float]]
-    ) -> bool:
+    def _solution_exists(self, solution: np.ndarray, solution_list: np.ndarray) -> bool:
         """
         Verifica si una solución ya existe en una lista de soluciones.
 
         Args:
-            solution: Solución a buscar.
-            solution_list: Lista de soluciones donde buscar.
+            solution: Solución a buscar (vector de variables originales).
+            solution_list: Matriz con una solución por fila.
 
         Returns:
             True si la solución ya existe en la lista, False en caso contrario.
         """
-        for existing_solution in solution_list:
-            if not self._is_different_solution(solution, existing_solution):
-                return True
-        return False
+        if len(solution_list) == 0:
+            return False
+        close = np.abs(solution_list - solution) <= self.tableau.tol
+        return bool(np.any(np.all(close, axis=1)))
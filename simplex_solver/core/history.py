@@ -0,0 +1,315 @@
+"""
+Historial de pasos del método Simplex.
+
+Guarda la información de cada iteración para los reportes (PDF y consola) sin copiar el
+tableau ni la lista de variables básicas en cada paso. Al comenzar cada fase se guarda
+una copia de su tableau y su base iniciales; cada paso registra solo el pivoteo aplicado
+(fila, columna y cambio de base). La base y el tableau de un paso se reconstruyen bajo
+demanda repitiendo los pivoteos desde el inicio de su fase, solo cuando un reporte los
+consulta.
+"""
+
+from collections.abc import Mapping
+from typing import Any, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from simplex_solver.utils.tableau import pivot_array
+
+# (fila saliente, variable básica anterior, variable entrante)
+BasicVarsDelta = Tuple[int, int, int]
+
+# (índice del primer paso, base inicial, tableau inicial, tolerancia del pivoteo)
+PhaseCheckpoint = Tuple[int, Tuple[int, ...], Optional[np.ndarray], float]
+
+
+class SimplexStep(Mapping):
+    """
+    Paso del historial del método Simplex.
+
+    Se comporta como el diccionario que usaban los reportes, con las claves
+    ``iteration``, ``tableau``, ``basic_vars``, ``entering_var``, ``leaving_var`` y
+    ``pivot_coords_next``. La clave ``basic_vars`` (base antes del pivoteo del paso)
+    y la clave ``tableau`` (tableau antes del pivoteo) se reconstruyen desde el historial
+    al consultarlas; el tableau reconstruido se conserva para consultas posteriores.
+
+    Usa ``__slots__`` para que cada paso ocupe poca memoria en historiales largos.
+    """
+
+    __slots__ = (
+        "_history",
+        "_index",
+        "iteration",
+        "_tableau",
+        "entering_var",
+        "leaving_var",
+        "pivot_coords_next",
+        "basic_vars_delta",
+    )
+
+    _KEYS = (
+        "iteration",
+        "tableau",
+        "basic_vars",
+        "entering_var",
+        "leaving_var",
+        "pivot_coords_next",
+    )
+
+    def __init__(
+        self,
+        history: "StepHistory",
+        index: int,
+        iteration: int,
+        tableau: Any,
+        entering_var: Optional[int],
+        leaving_var: Optional[int],
+        pivot_coords_next: Optional[dict],
+        basic_vars_delta: Optional[BasicVarsDelta],
+    ):
+        """
+        Inicializa el paso.
+
+        Args:
+            history: Historial al que pertenece el paso.
+            index: Posición del paso dentro del historial.
+            iteration: Número de iteración dentro de la fase.
+            tableau: Copia del tableau, o None para reconstruirlo bajo demanda.
+            entering_var: Índice de la variable entrante, o None en el paso final.
+            leaving_var: Índice de la variable saliente, o None en el paso final.
+            pivot_coords_next: Coordenadas del pivote aplicado en este paso.
+            basic_vars_delta: Cambio de la base producido por el pivoteo de este paso.
+        """
+        self._history = history
+        self._index = index
+        self.iteration = iteration
+        self._tableau = tableau
+        self.entering_var = entering_var
+        self.leaving_var = leaving_var
+        self.pivot_coords_next = pivot_coords_next
+        self.basic_vars_delta = basic_vars_delta
+
+    @property
+    def tableau(self) -> Optional[np.ndarray]:
+        """Tableau antes del pivoteo de este paso (el tableau final en el último paso)."""
+        if self._tableau is None:
+            self._tableau = self._history.tableau_at(self._index)
+        return self._tableau
+
+    @property
+    def basic_vars(self) -> List[int]:
+        """Variables básicas antes del pivoteo de este paso."""
+        return self._history.basic_vars_at(self._index)
+
+    def to_dict(self) -> dict:
+        """
+        Convierte el paso en un diccionario independiente del historial.
+
+        Returns:
+            dict: Las claves del paso con sus valores (el tableau se reconstruye si hace falta).
+        """
+        return {key: getattr(self, key) for key in self._KEYS}
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._KEYS)
+
+    def __len__(self) -> int:
+        return len(self._KEYS)
+
+    def __repr__(self) -> str:
+        return (
+            f"SimplexStep(iteration={self.iteration}, entering_var={self.entering_var}, "
+            f"leaving_var={self.leaving_var})"
+        )
+
+
+class StepHistory(list):
+    """
+    Lista de pasos (``SimplexStep``) con el tableau y la base iniciales de cada fase.
+
+    La numeración de columnas cambia entre la Fase 1 y la Fase 2 (se eliminan las
+    artificiales), por lo que al comenzar cada fase se guarda su punto de partida; los
+    pasos posteriores solo registran su pivoteo.
+    """
+
+    def __init__(self, record_full_tableaux: bool = False, enabled: bool = True):
+        """
+        Inicializa un historial vacío.
+
+        Args:
+            record_full_tableaux: Si es True, cada paso guarda una copia de su tableau al
+                registrarse en lugar de reconstruirlo bajo demanda.
+            enabled: Si es False, ``start_phase`` y ``record`` no registran nada (para
+                resoluciones que no generan reportes).
+        """
+        super().__init__()
+        self.record_full_tableaux = record_full_tableaux
+        self.enabled = enabled
+        self._checkpoints: List[PhaseCheckpoint] = []  # Un punto de partida por fase
+        # Últimas reconstrucciones (índice, estado), para recorrer los pasos en orden en O(1)
+        self._basis_cursor: Optional[Tuple[int, List[int]]] = None
+        self._tableau_cursor: Optional[Tuple[int, np.ndarray]] = None
+
+    def start_phase(
+        self,
+        basic_vars: Sequence[int],
+        tableau: Optional[np.ndarray] = None,
+        tol: float = 0.0,
+    ) -> None:
+        """
+        Registra la base y el tableau iniciales de una fase; los pasos siguientes parten de ellos.
+
+        Args:
+            basic_vars: Variables básicas al comenzar la fase.
+            tableau: Tableau al comenzar la fase (se copia).
+            tol: Tolerancia del pivoteo, necesaria para repetirlo de forma idéntica.
+        """
+        if not self.enabled:
+            return
+        initial = tableau.copy() if tableau is not None else None
+        self._checkpoints.append((len(self), tuple(int(v) for v in basic_vars), initial, tol))
+
+    def record(
+        self,
+        iteration: int,
+        tableau: Optional[np.ndarray] = None,
+        entering_var: Optional[int] = None,
+        leaving_row: Optional[int] = None,
+        leaving_var: Optional[int] = None,
+    ) -> Optional[SimplexStep]:
+        """
+        Agrega un paso al historial.
+
+        Args:
+            iteration: Número de iteración.
+            tableau: Tableau vigente del paso; se copia solo si ``record_full_tableaux``
+                está activo o si es el paso final (sin pivoteo).
+            entering_var: Columna entrante (None para el paso final).
+            leaving_row: Fila del pivote (None para el paso final).
+            leaving_var: Variable básica que sale de la base (None para el paso final).
+
+        Returns:
+            SimplexStep: El paso agregado, o None si el historial está deshabilitado.
+        """
+        if not self.enabled:
+            return None
+        if entering_var is None:
+            delta = None
+            pivot_coords = None
+        else:
+            # Se guardan enteros de Python: la base de la tabla es un arreglo np.intp
+            leaving_row, leaving_var, entering_var = (
+                int(leaving_row),
+                int(leaving_var),
+                int(entering_var),
+            )
+            delta = (leaving_row, leaving_var, entering_var)
+            pivot_coords = {"entering_col": entering_var, "leaving_row": leaving_row}
+
+        snapshot = None
+        if tableau is not None and (self.record_full_tableaux or entering_var is None):
+            snapshot = tableau.copy()
+
+        step = SimplexStep(
+            self, len(self), iteration, snapshot, entering_var, leaving_var, pivot_coords, delta
+        )
+        self.append(step)
+        return step
+
+    def _checkpoint_for(self, index: int) -> PhaseCheckpoint:
+        """Devuelve el punto de partida de la fase a la que pertenece el paso ``index``."""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Índice de paso fuera del historial")
+        return next(cp for cp in reversed(self._checkpoints) if cp[0] <= index)
+
+    def basic_vars_at(self, index: int) -> List[int]:
+        """
+        Reconstruye las variables básicas vigentes antes del pivoteo del paso ``index``.
+
+        Args:
+            index: Posición del paso en el historial.
+
+        Returns:
+            list: Índices de las variables básicas.
+
+        Raises:
+            IndexError: Si el índice está fuera del historial.
+        """
+        start, initial, _, _ = self._checkpoint_for(index)
+        if index < 0:
+            index += len(self)
+
+        # Continuar desde la última reconstrucción si pertenece a la misma fase
+        if self._basis_cursor is not None and start <= self._basis_cursor[0] <= index:
+            position, basis = self._basis_cursor[0], list(self._basis_cursor[1])
+        else:
+            position, basis = start, list(initial)
+
+        for step in self[position:index]:
+            if step.basic_vars_delta is not None:
+                row, _, entering = step.basic_vars_delta
+                basis[row] = entering
+
+        self._basis_cursor = (index, basis)
+        return list(basis)
+
+    def tableau_at(self, index: int) -> Optional[np.ndarray]:
+        """
+        Reconstruye el tableau vigente antes del pivoteo del paso ``index``.
+
+        Repite sobre una copia del tableau inicial de la fase los pivoteos de los pasos
+        anteriores, con la misma rutina que usa el solver, por lo que el resultado es
+        idéntico al tableau que hubo durante la resolución.
+
+        Args:
+            index: Posición del paso en el historial.
+
+        Returns:
+            np.ndarray: Copia del tableau, o None si la fase no registró su tableau.
+
+        Raises:
+            IndexError: Si el índice está fuera del historial.
+        """
+        start, _, initial, tol = self._checkpoint_for(index)
+        if index < 0:
+            index += len(self)
+        if initial is None:
+            return None
+
+        if self._tableau_cursor is not None and start <= self._tableau_cursor[0] <= index:
+            position, current = self._tableau_cursor
+        else:
+            position, current = start, initial.copy()
+
+        for step in self[position:index]:
+            if step.basic_vars_delta is not None:
+                row, _, entering = step.basic_vars_delta
+                pivot_array(current, row, entering, tol)
+
+        self._tableau_cursor = (index, current)
+        return current.copy()
+
+    def replay(self) -> "StepHistory":
+        """
+        Reconstruye de una vez los tableaus de todos los pasos (recorrido en orden).
+
+        Returns:
+            StepHistory: El propio historial, con todos los tableaus ya disponibles.
+        """
+        for step in self:
+            step.tableau
+        return self
+
+    def clear(self) -> None:
+        """Vacía el historial y sus puntos de partida."""
+        super().clear()
+        self._checkpoints.clear()
+        self._basis_cursor = None
+        self._tableau_cursor = None
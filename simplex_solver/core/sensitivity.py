@@ -5,9 +5,28 @@ Calcula Precios Sombra, Rangos de Optimalidad y Rangos de Factibilidad
 después de encontrar una solución óptima.
 """
 
-from typing import Dict, Tuple, Optional, Any
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Dict, Tuple, Optional, Any, Iterator, Sequence, Union
 import numpy as np
-from simplex_solver.logging_system import logger
+from simplex_solver.logging_system import logger, LogLevel
+from simplex_solver.utils import kernels
+
+
+@dataclass
+class SensitivityArrays:
+    """
+    Resultados del análisis de sensibilidad como arreglos NumPy (float64).
+
+    Los arreglos de restricciones siguen el orden ``restriccion_1..m`` y los de variables
+    el orden ``x1..n``; ``SensitivityAnalyzer.analyze`` los convierte en diccionarios.
+    """
+
+    shadow_prices: np.ndarray  # Precio sombra de cada restricción
+    optimality_min: np.ndarray  # Límite inferior del coeficiente de cada variable
+    optimality_max: np.ndarray  # Límite superior del coeficiente de cada variable
+    feasibility_min: np.ndarray  # Límite inferior del RHS de cada restricción
+    feasibility_max: np.ndarray  # Límite superior del RHS de cada restricción
 
 
 class SensitivityAnalyzer:
@@ -20,22 +39,75 @@ class SensitivityAnalyzer:
     - Determinar rangos de factibilidad para los valores del lado derecho (RHS)
     """
 
-    def __init__(self, tableau: np.ndarray, basic_vars: list, num_vars: int, num_constraints: int):
+    # Columnas de holgura por bloque en el cálculo vectorizado de rangos de factibilidad
+    _RHS_BLOCK = 256
+
+    def __init__(
+        self,
+        tableau: np.ndarray,
+        basic_vars: Union[Sequence[int], np.ndarray],
+        num_vars: int,
+        num_constraints: int,
+        assume_clean: bool = False,
+    ):
         """
         Inicializa el analizador de sensibilidad.
 
         Args:
             tableau: El tableau óptimo del método Simplex.
-            basic_vars: Lista de índices de variables básicas.
+            basic_vars: Índices de variables básicas (lista o arreglo de enteros).
             num_vars: Número de variables de decisión originales.
             num_constraints: Número de restricciones (excluyendo no negatividad).
+            assume_clean: Si es True, el llamador garantiza que los coeficientes del
+                tableau menores que la tolerancia ya son exactamente cero, y las pruebas
+                del cociente solo descartan los ceros (``a != 0``) en lugar de comparar
+                ``|a|`` con 1e-10.
+
+        Raises:
+            ValueError: Si el tableau no es una matriz 2-D.
         """
-        self.tableau = tableau
-        self.basic_vars = basic_vars
+        # El análisis se hace sobre un tableau float64 en orden C aunque el del solver sea
+        # float32 (sin copia si ya lo es, como el del solver en la Fase 2) y una base
+        # np.intp, de modo que los cálculos y kernels no convierten tipos en cada llamada
+        self.tableau = np.ascontiguousarray(tableau, dtype=np.float64)
+        if self.tableau.ndim != 2:
+            raise ValueError(
+                f"El tableau debe ser una matriz 2-D; tiene {self.tableau.ndim} dimensiones"
+            )
+        self.basic_vars = np.asarray(basic_vars, dtype=np.intp).reshape(-1)
+        self.assume_clean = assume_clean
+        # Umbral de los coeficientes válidos en los kernels (|a| > 0 equivale a a != 0)
+        self._coef_eps = 0.0 if assume_clean else 1e-10
         self.num_vars = num_vars
         self.num_constraints = num_constraints
+        # Vistas de la fila objetivo (última fila) y de los costos reducidos de las
+        # variables de decisión, compartidas por todos los cálculos
+        self._obj_row = self.tableau[-1, :]
+        self._reduced_costs = self._obj_row[:num_vars]
+        # Vista de los coeficientes de las variables de decisión en las filas de restricción
+        self._body = self.tableau[:-1, :num_vars]
+        # Columnas de holgura y RHS en orden Fortran (se copian al primer uso)
+        self._slack_block: Optional[np.ndarray] = None
+        self._current_rhs: Optional[np.ndarray] = None
+        # Nombres de restricciones y variables de los resultados, formateados una sola vez
+        self._constraint_names = [f"restriccion_{i + 1}" for i in range(num_constraints)]
+        self._var_names = [f"x{j + 1}" for j in range(num_vars)]
+        # Fila de cada variable básica (la primera, como list.index), o -1 si la variable
+        # no es básica, e índices de las variables de decisión no básicas y básicas (para
+        # leer con ``take`` en lugar de máscaras); las básicas degeneradas pueden tener
+        # índice -1 y se ignoran
+        basis = self.basic_vars
+        self._row_of = np.full(max(self.tableau.shape[1] - 1, num_vars), -1, dtype=np.intp)
+        rows = np.flatnonzero((basis >= 0) & (basis < self._row_of.shape[0]))
+        variables, first = np.unique(basis[rows], return_index=True)
+        self._row_of[variables] = rows[first]
+        nonbasic = self._row_of[:num_vars] < 0
+        self._nonbasic_cols = np.flatnonzero(nonbasic)
+        self._basic_decision = np.flatnonzero(~nonbasic)
         logger.debug(
-            f"SensitivityAnalyzer inicializado: {num_vars} variables, {num_constraints} restricciones"
+            "SensitivityAnalyzer inicializado: %d variables, %d restricciones",
+            num_vars,
+            num_constraints,
         )
 
     def calculate_shadow_prices(self) -> Dict[str, float]:
@@ -49,21 +121,37 @@ class SensitivityAnalyzer:
             dict: Diccionario que mapea los nombres de las restricciones a sus precios sombra.
         """
         logger.debug("Calculando precios sombra...")
-        shadow_prices = {}
+        prices = self._shadow_price_array().tolist()
+        shadow_prices = dict(zip(self._constraint_names, prices))
+
+        if logger.is_enabled_for(LogLevel.DEBUG):
+            for constraint_name, shadow_price in shadow_prices.items():
+                logger.debug("Precio sombra para %s: %.6f", constraint_name, shadow_price)
 
+        return shadow_prices
+
+    def _shadow_price_array(self) -> np.ndarray:
+        """
+        Calcula los precios sombra de todas las restricciones como arreglo.
+
+        Returns:
+            np.ndarray: Precio sombra de cada restricción.
+
+        Raises:
+            IndexError: Si el tableau tiene menos columnas que las restricciones esperadas.
+        """
         # La fila de la función objetivo es la última fila del tableau
-        obj_row = self.tableau[-1, :]
+        obj_row = self._obj_row
 
         # Los precios sombra son los negativos de los coeficientes de las variables de holgura
         # en la fila objetivo. Las variables de holgura comienzan después de las variables de decisión.
-        for i in range(self.num_constraints):
-            slack_col = self.num_vars + i
-            shadow_price = -obj_row[slack_col]
-            constraint_name = f"restriccion_{i + 1}"
-            shadow_prices[constraint_name] = float(shadow_price)
-            logger.debug(f"Precio sombra para {constraint_name}: {shadow_price:.6f}")
-
-        return shadow_prices
+        start = self.num_vars
+        end = start + self.num_constraints
+        if end > obj_row.shape[0]:
+            raise IndexError(
+                f"El tableau tiene {obj_row.shape[0]} columnas; se esperaban al menos {end}"
+            )
+        return -obj_row[start:end]
 
     def calculate_optimality_ranges(self, original_c: np.ndarray) -> Dict[str, Tuple[float, float]]:
         """
@@ -79,27 +167,76 @@ class SensitivityAnalyzer:
             dict: Diccionario que mapea los nombres de las variables a tuplas (min, max).
         """
         logger.debug("Calculando rangos de optimalidad...")
-        opt_ranges = {}
+        c_min, c_max = self._optimality_bounds(original_c)
 
-        for j in range(self.num_vars):
-            var_name = f"x{j + 1}"
-            c_current = original_c[j]
+        opt_ranges = dict(zip(self._var_names, zip(c_min.tolist(), c_max.tolist())))
+        if logger.is_enabled_for(LogLevel.DEBUG):
+            for var_name, (low, high) in opt_ranges.items():
+                logger.debug("Rango de optimalidad para %s: [%.4f, %.4f]", var_name, low, high)
 
-            # Verifica si la variable está en la base
-            if j in self.basic_vars:
-                # Variable básica: calcula el rango a partir de los costos reducidos de las variables no básicas
-                min_delta, max_delta = self._calculate_basic_var_range(j)
-            else:
-                # Variable no básica: usa directamente el costo reducido
-                min_delta, max_delta = self._calculate_nonbasic_var_range(j)
+        return opt_ranges
 
-            c_min = c_current + min_delta
-            c_max = c_current + max_delta
+    def _optimality_bounds(self, original_c: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calcula los límites (c_min, c_max) del coeficiente de cada variable de decisión.
 
-            opt_ranges[var_name] = (float(c_min), float(c_max))
-            logger.debug(f"Rango de optimalidad para {var_name}: [{c_min:.4f}, {c_max:.4f}]")
+        Args:
+            original_c: Coeficientes originales de la función objetivo.
 
-        return opt_ranges
+        Returns:
+            tuple: Arreglos (c_min, c_max) de longitud ``num_vars``.
+        """
+        # Rangos de todas las variables a la vez: las básicas a partir de los costos
+        # reducidos de las no básicas, las no básicas directamente de su costo reducido
+        min_deltas, max_deltas = self._optimality_deltas()
+        c_current = np.asarray(original_c, dtype=np.float64)[: self.num_vars]
+        return c_current + min_deltas, c_current + max_deltas
+
+    def _optimality_deltas(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calcula (min_delta, max_delta) para el coeficiente de cada variable de decisión.
+
+        Equivale a llamar ``_calculate_basic_var_range`` o ``_calculate_nonbasic_var_range``
+        por variable, pero resuelve todas las básicas en una sola operación matricial
+        (filas de las básicas × columnas no básicas), o con el kernel paralelo de Numba
+        cuando hay muchas variables.
+
+        Returns:
+            tuple: Arreglos (min_delta, max_delta) de longitud ``num_vars``.
+        """
+        cols = self._nonbasic_cols
+        basic = self._basic_decision
+        min_deltas = np.full(self.num_vars, -np.inf)
+        max_deltas = np.full(self.num_vars, np.inf)
+
+        # Variable no básica: puede aumentar hasta su costo reducido antes de entrar en la
+        # base y disminuir indefinidamente
+        reduced_costs = self._reduced_costs.take(cols)
+        max_deltas[cols] = reduced_costs
+
+        if basic.size == 0:
+            return min_deltas, max_deltas
+
+        rows = self._row_of.take(basic)
+
+        if kernels.use_parallel_sensitivity(self.num_vars):
+            lo = np.empty(basic.size)
+            hi = np.empty(basic.size)
+            with kernels.limited_threads():
+                kernels.basic_var_deltas(self.tableau, rows, cols, self._coef_eps, lo, hi)
+        else:
+            # Coeficientes de las no básicas en la fila de cada básica; los cocientes
+            # con coeficiente despreciable se descartan con la máscara
+            a = self._body[np.ix_(rows, cols)]
+            valid = self._valid_coefficients(a)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                ratios = reduced_costs / a
+            hi = np.min(np.where(valid & (a > 0), ratios, np.inf), axis=1, initial=np.inf)
+            lo = np.max(np.where(valid & (a < 0), ratios, -np.inf), axis=1, initial=-np.inf)
+
+        min_deltas[basic] = lo
+        max_deltas[basic] = hi
+        return min_deltas, max_deltas
 
     def _calculate_basic_var_range(self, var_index: int) -> Tuple[float, float]:
         """
@@ -112,42 +249,30 @@ class SensitivityAnalyzer:
             tuple: (min_delta, max_delta) para el cambio del coeficiente.
         """
         # Encuentra en qué fila esta variable es básica
-        try:
-            row = self.basic_vars.index(var_index)
-        except ValueError:
-            logger.warning(f"Variable {var_index} no encontrada en las variables básicas")
+        row = self._row_of[var_index] if 0 <= var_index < self._row_of.shape[0] else -1
+        if row < 0:
+            logger.warning("Variable %s no encontrada en las variables básicas", var_index)
             return (float("-inf"), float("inf"))
 
-        # Obtiene la columna de esta variable en el tableau
-        var_column = self.tableau[:, var_index]
-
         # Para una variable básica, se analiza cómo cambiar su coeficiente
-        # afectaría los costos reducidos de las variables no básicas
-        obj_row = self.tableau[-1, :]
+        # afectaría los costos reducidos de las variables no básicas: coeficientes de
+        # las variables de decisión no básicas en la fila de la variable básica
+        cols = self._nonbasic_cols
+        a_row = self._body[row].take(cols)
+        reduced_costs = self._reduced_costs.take(cols)
 
-        min_delta = float("-inf")
-        max_delta = float("inf")
-
-        # Verifica cada columna de variable no básica
-        for j in range(self.num_vars):
-            if j not in self.basic_vars:
-                # Coeficiente en el tableau para esta variable no básica en la fila de la variable básica
-                a_ij = self.tableau[row, j]
-                reduced_cost = obj_row[j]
-
-                if abs(a_ij) > 1e-10:
-                    # Delta debe mantener el costo reducido >= 0 (para maximización)
-                    # reduced_cost - delta * a_ij >= 0
-                    # delta <= reduced_cost / a_ij (si a_ij > 0)
-                    # delta >= reduced_cost / a_ij (si a_ij < 0)
-                    ratio = reduced_cost / a_ij
-
-                    if a_ij > 0:
-                        max_delta = min(max_delta, ratio)
-                    else:
-                        min_delta = max(min_delta, ratio)
+        # Delta debe mantener el costo reducido >= 0 (para maximización)
+        # reduced_cost - delta * a_ij >= 0
+        # delta <= reduced_cost / a_ij (si a_ij > 0)
+        # delta >= reduced_cost / a_ij (si a_ij < 0)
+        valid = self._valid_coefficients(a_row)
+        a_valid = a_row[valid]
+        ratios = reduced_costs[valid] / a_valid
 
-        return (min_delta, max_delta)
+        max_delta = np.min(ratios[a_valid > 0], initial=np.inf)
+        min_delta = np.max(ratios[a_valid < 0], initial=-np.inf)
+
+        return (float(min_delta), float(max_delta))
 
     def _calculate_nonbasic_var_range(self, var_index: int) -> Tuple[float, float]:
         """
@@ -161,8 +286,7 @@ class SensitivityAnalyzer:
         """
         # Para una variable no básica, el costo reducido indica cuánto
         # debe cambiar el coeficiente para entrar en la base
-        obj_row = self.tableau[-1, :]
-        reduced_cost = obj_row[var_index]
+        reduced_cost = self._reduced_costs[var_index]
 
         # Para maximización: la variable puede aumentar en reduced_cost antes de entrar en la base
         # Puede disminuir indefinidamente sin afectar la optimalidad
@@ -187,30 +311,68 @@ class SensitivityAnalyzer:
             dict: Diccionario que mapea los nombres de las restricciones a tuplas (min, max).
         """
         logger.debug("Calculando rangos de factibilidad...")
-        feas_ranges = {}
+        b_min, b_max = self._feasibility_bounds(original_b)
 
-        # Extrae el RHS actual (valores de solución) del tableau
-        current_rhs = self.tableau[
-            :-1, -1
-        ]  # Todas las filas excepto la de la función objetivo, última columna
+        feas_ranges = dict(zip(self._constraint_names, zip(b_min.tolist(), b_max.tolist())))
+        if logger.is_enabled_for(LogLevel.DEBUG):
+            for constraint_name, (low, high) in feas_ranges.items():
+                logger.debug(
+                    "Rango de factibilidad para %s: [%.4f, %.4f]", constraint_name, low, high
+                )
 
-        for i in range(self.num_constraints):
-            constraint_name = f"restriccion_{i + 1}"
-            b_current = original_b[i]
+        return feas_ranges
 
-            # Calcula cuánto puede cambiar cada variable básica
-            # cuando perturbamos el valor RHS de la i-ésima restricción
-            min_delta, max_delta = self._calculate_rhs_range(i)
+    def _feasibility_bounds(self, original_b: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calcula los límites (b_min, b_max) del RHS de cada restricción.
 
-            b_min = b_current + min_delta
-            b_max = b_current + max_delta
+        Args:
+            original_b: Valores originales del RHS.
+
+        Returns:
+            tuple: Arreglos (b_min, b_max) de longitud ``num_constraints``.
+        """
+        min_deltas, max_deltas = self._feasibility_deltas()
+        b_current = np.asarray(original_b, dtype=np.float64)[: self.num_constraints]
+        return b_current + min_deltas, b_current + max_deltas
+
+    def _feasibility_deltas(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calcula (min_delta, max_delta) para el RHS de cada restricción.
 
-            feas_ranges[constraint_name] = (float(b_min), float(b_max))
-            logger.debug(
-                f"Rango de factibilidad para {constraint_name}: [{b_min:.4f}, {b_max:.4f}]"
+        Equivale a llamar ``_calculate_rhs_range`` por restricción, pero aplica la prueba
+        del cociente a bloques de columnas de holgura a la vez; los bloques limitan la
+        memoria temporal a ``m × _RHS_BLOCK`` elementos. Con muchas restricciones usa el
+        kernel paralelo de Numba, que no necesita arreglos temporales.
+
+        Returns:
+            tuple: Arreglos (min_delta, max_delta) de longitud ``num_constraints``.
+        """
+        slack_block, current_rhs = self._slack_columns()
+        min_deltas = np.empty(self.num_constraints)
+        max_deltas = np.empty(self.num_constraints)
+
+        if kernels.use_parallel_sensitivity(self.num_constraints):
+            with kernels.limited_threads():
+                kernels.rhs_deltas(slack_block, current_rhs, self._coef_eps, min_deltas, max_deltas)
+            return min_deltas, max_deltas
+
+        neg_rhs = -current_rhs[:, None]
+
+        for start in range(0, self.num_constraints, self._RHS_BLOCK):
+            end = min(start + self._RHS_BLOCK, self.num_constraints)
+            a = slack_block[:, start:end]
+            valid = self._valid_coefficients(a)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                ratios = neg_rhs / a
+            min_deltas[start:end] = np.max(
+                np.where(valid & (a > 0), ratios, -np.inf), axis=0, initial=-np.inf
+            )
+            max_deltas[start:end] = np.min(
+                np.where(valid & (a < 0), ratios, np.inf), axis=0, initial=np.inf
             )
 
-        return feas_ranges
+        return min_deltas, max_deltas
 
     def _calculate_rhs_range(self, constraint_index: int) -> Tuple[float, float]:
         """
@@ -223,43 +385,73 @@ class SensitivityAnalyzer:
             tuple: (min_delta, max_delta) para el cambio del RHS.
         """
         # El índice de la restricción corresponde a una columna de variable de holgura
-        slack_col = self.num_vars + constraint_index
+        # (sin la fila de la función objetivo)
+        slack_block, current_rhs = self._slack_columns()
+        slack_column = slack_block[:, constraint_index]
 
-        # Obtiene la columna para esta variable de holgura
-        slack_column = self.tableau[:-1, slack_col]  # Excluye la fila de la función objetivo
+        # Cuando aumentamos RHS en delta, cada variable básica cambia en delta * a_i
+        # Necesitamos: b_i + delta * a_i >= 0
+        # delta >= -b_i / a_i (si a_i > 0)
+        # delta <= -b_i / a_i (si a_i < 0)
+        valid = self._valid_coefficients(slack_column)
+        a_valid = slack_column[valid]
+        ratios = -current_rhs[valid] / a_valid
 
-        # Valores actuales del RHS (valores básicos de solución)
-        current_rhs = self.tableau[:-1, -1]
+        min_delta = np.max(ratios[a_valid > 0], initial=-np.inf)
+        max_delta = np.min(ratios[a_valid < 0], initial=np.inf)
 
-        min_delta = float("-inf")
-        max_delta = float("inf")
+        return (float(min_delta), float(max_delta))
 
-        # Para cada variable básica, calcula el ratio
-        for row in range(len(current_rhs)):
-            a_i = slack_column[row]
-            b_i = current_rhs[row]
+    def _valid_coefficients(self, a: np.ndarray) -> np.ndarray:
+        """
+        Máscara de los coeficientes que participan en una prueba del cociente.
 
-            if abs(a_i) > 1e-10:
-                # Cuando aumentamos RHS en delta, la variable básica cambia en delta * a_i
-                # Necesitamos: b_i + delta * a_i >= 0
-                # delta >= -b_i / a_i (si a_i > 0)
-                # delta <= -b_i / a_i (si a_i < 0)
-                ratio = -b_i / a_i
+        Args:
+            a: Coeficientes del tableau.
 
-                if a_i > 0:
-                    min_delta = max(min_delta, ratio)
-                else:
-                    max_delta = min(max_delta, ratio)
+        Returns:
+            np.ndarray: True donde el coeficiente no es despreciable.
+        """
+        if self.assume_clean:
+            return a != 0.0
+        return np.abs(a) > 1e-10
 
-        return (min_delta, max_delta)
+    def _slack_columns(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Devuelve las columnas de holgura y el RHS actual, sin la fila objetivo.
+
+        El tableau está en orden C (por filas, como conviene al pivoteo), por lo que sus
+        columnas tienen saltos de memoria; el bloque de columnas de holgura se copia una
+        sola vez en orden Fortran para que cada columna sea contigua.
+
+        Returns:
+            tuple: (bloque m × num_constraints de columnas de holgura, RHS actual).
 
-    def analyze(self, original_c: np.ndarray, original_b: np.ndarray) -> Dict[str, Dict[str, Any]]:
+        Raises:
+            IndexError: Si el tableau tiene menos columnas que las restricciones esperadas.
+        """
+        if self._slack_block is None:
+            start = self.num_vars
+            end = start + self.num_constraints
+            if end > self.tableau.shape[1]:
+                raise IndexError(
+                    f"El tableau tiene {self.tableau.shape[1]} columnas; se esperaban al menos {end}"
+                )
+            self._slack_block = np.asfortranarray(self.tableau[:-1, start:end])
+            self._current_rhs = np.ascontiguousarray(self.tableau[:-1, -1])
+        return self._slack_block, self._current_rhs
+
+    def analyze(
+        self, original_c: Optional[np.ndarray], original_b: Optional[np.ndarray]
+    ) -> Dict[str, Dict[str, Any]]:
         """
         Realiza un análisis completo de sensibilidad.
 
         Args:
-            original_c: Coeficientes originales de la función objetivo.
-            original_b: Valores originales del RHS.
+            original_c: Coeficientes originales de la función objetivo, o None para omitir
+                los rangos de optimalidad.
+            original_b: Valores originales del RHS, o None para omitir los rangos de
+                factibilidad.
 
         Returns:
             dict: Diccionario que contiene precios sombra, rangos de optimalidad y rangos de factibilidad.
@@ -267,10 +459,118 @@ class SensitivityAnalyzer:
         logger.info("Realizando análisis completo de sensibilidad...")
 
         analysis = {
-            "shadow_prices": self.calculate_shadow_prices(),
-            "optimality_ranges": self.calculate_optimality_ranges(original_c),
-            "feasibility_ranges": self.calculate_feasibility_ranges(original_b),
+            "shadow_prices": self.calculate_shadow_prices() if self.num_constraints else {},
+            "optimality_ranges": (
+                self.calculate_optimality_ranges(original_c) if original_c is not None else {}
+            ),
+            "feasibility_ranges": (
+                self.calculate_feasibility_ranges(original_b)
+                if original_b is not None and self.num_constraints
+                else {}
+            ),
         }
-
         logger.info("Análisis de sensibilidad completado exitosamente")
         return analysis
+
+    def analyze_arrays(self, original_c: np.ndarray, original_b: np.ndarray) -> SensitivityArrays:
+        """
+        Realiza el análisis completo de sensibilidad sin construir diccionarios.
+
+        Calcula lo mismo que ``analyze`` pero devuelve los valores como arreglos, para
+        consumidores que operan con ellos de forma vectorizada (barridos paramétricos,
+        comparaciones entre escenarios).
+
+        Args:
+            original_c: Coeficientes originales de la función objetivo.
+            original_b: Valores originales del RHS.
+
+        Returns:
+            SensitivityArrays: Precios sombra y límites de los rangos como arreglos.
+        """
+        c_min, c_max = self._optimality_bounds(original_c)
+        b_min, b_max = self._feasibility_bounds(original_b)
+        return SensitivityArrays(
+            shadow_prices=self._shadow_price_array(),
+            optimality_min=c_min,
+            optimality_max=c_max,
+            feasibility_min=b_min,
+            feasibility_max=b_max,
+        )
+
+
+class LazySensitivityAnalysis(Mapping):
+    """
+    Análisis de sensibilidad que se calcula recién en el primer acceso.
+
+    Se comporta como el diccionario devuelto por ``SensitivityAnalyzer.analyze``
+    (``analysis["shadow_prices"]``, ``"optimality_ranges" in analysis``, ``.items()``...),
+    pero no construye el analizador hasta que alguien consulta su contenido. El
+    resultado se memoriza, por lo que el cálculo se realiza como máximo una vez.
+
+    Si el cálculo falla se registra una advertencia y el análisis queda vacío (y por lo
+    tanto se evalúa como falso). ``solve`` no crea este objeto cuando el tableau no tiene
+    columnas de holgura para todas las restricciones; en ese caso deja None.
+    """
+
+    def __init__(
+        self,
+        tableau: np.ndarray,
+        basic_vars: Union[Sequence[int], np.ndarray],
+        num_vars: int,
+        num_constraints: int,
+        original_c: np.ndarray,
+        original_b: np.ndarray,
+    ):
+        """
+        Guarda las referencias necesarias para calcular el análisis más tarde.
+
+        Args:
+            tableau: El tableau óptimo (no se copia; no debe modificarse después).
+            basic_vars: Índices de variables básicas en el óptimo (no se copian).
+            num_vars: Número de variables de decisión originales.
+            num_constraints: Número de restricciones.
+            original_c: Coeficientes originales de la función objetivo.
+            original_b: Valores originales del RHS.
+        """
+        self._tableau = tableau
+        self._basic_vars = basic_vars
+        self._num_vars = num_vars
+        self._num_constraints = num_constraints
+        self._original_c = original_c
+        self._original_b = original_b
+        self._analysis: Optional[Dict[str, Dict[str, Any]]] = None
+
+    @property
+    def is_computed(self) -> bool:
+        """Indica si el análisis ya fue calculado."""
+        return self._analysis is not None
+
+    def _compute(self) -> Dict[str, Dict[str, Any]]:
+        """Calcula (una sola vez) y devuelve el análisis completo."""
+        if self._analysis is None:
+            try:
+                analyzer = SensitivityAnalyzer(
+                    tableau=self._tableau,
+                    basic_vars=self._basic_vars,
+                    num_vars=self._num_vars,
+                    num_constraints=self._num_constraints,
+                )
+                self._analysis = analyzer.analyze(self._original_c, self._original_b)
+            except Exception as e:
+                logger.warning("No se pudo calcular el análisis de sensibilidad: %s", e)
+                self._analysis = {}
+        return self._analysis
+
+    def __getitem__(self, key: str) -> Dict[str, Any]:
+        return self._compute()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._compute())
+
+    def __len__(self) -> int:
+        return len(self._compute())
+
+    def __repr__(self) -> str:
+        if self._analysis is None:
+            return "LazySensitivityAnalysis(<pendiente>)"
+        return f"LazySensitivityAnalysis({self._analysis!r})"
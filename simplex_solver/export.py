@@ -19,6 +19,7 @@ from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import mm
 from reportlab.lib.enums import TA_CENTER
 import re
+from typing import Iterator, List, Optional, Tuple
 
 try:
     from logging_system import logger
@@ -27,6 +28,371 @@ try:
 except ImportError:
     LOGGING_AVAILABLE = False
 
+# Patrones de ``_add_space``, compilados una sola vez
+_RE_COEF_VAR = re.compile(r"(\d)(x\d+)")
+_RE_PLUS = re.compile(r"\+")
+_RE_MINUS = re.compile(r"(?<!^)-")  # evita espacio al inicio si es negativo
+
+# Extremos abiertos de los rangos de sensibilidad
+_NEG_INF = float("-inf")
+_POS_INF = float("inf")
+
+# Estilos del reporte, creados una sola vez y compartidos entre exportaciones (solo se leen).
+# Los ParagraphStyle no se registran en la hoja de estilos, por lo que no hay choque de nombres.
+_STYLES = getSampleStyleSheet()
+
+# Colores propios del reporte, convertidos a Color una sola vez
+_TITLE_COLOR = colors.HexColor("#595959")
+_ARROW_COLOR = colors.HexColor("#7F7F7F")
+_SOLUTION_BG = colors.HexColor("#DDFBDF")  # fondo del recuadro de la solución
+
+_TITLE_STYLE = ParagraphStyle(
+    "CustomTitle",
+    parent=_STYLES["Title"],
+    textColor=_TITLE_COLOR,
+    alignment=2,  # TA_RIGHT
+    rightIndent=20,  # deja 20 puntos desde el borde derecho
+)
+_H2_STYLE = ParagraphStyle("CustomHeading2", parent=_STYLES["Heading2"], textColor=_TITLE_COLOR)
+_ARROW_STYLE = ParagraphStyle(name="ArrowStyle", alignment=TA_CENTER, textColor=_ARROW_COLOR)
+
+# Reglas comunes a todas las tablas de iteraciones; cada paso agrega las suyas
+_TABLEAU_BASE_STYLE = (
+    ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
+    ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),  # cabecera
+    ("ALIGN", (0, 0), (-1, 0), "CENTER"),  # centra fila superior
+    ("ALIGN", (0, 1), (0, -1), "CENTER"),  # centra columna VB
+    ("ALIGN", (1, 1), (-1, -1), "CENTER"),  # centra resto de celdas
+)
+
+# Tabla de 2 columnas que contiene la flecha y el tableau de cada iteración
+_WRAPPER_STYLE = TableStyle(
+    [
+        ("VALIGN", (0, 0), (0, -1), "MIDDLE"),  # Columna 0: flecha centrada verticalmente
+        ("VALIGN", (1, 0), (1, -1), "TOP"),  # Columna 1: tabla mantiene alineación superior
+        ("LEFTPADDING", (0, 0), (0, 0), 0),
+        ("RIGHTPADDING", (0, 0), (0, 0), 0),
+    ]
+)
+
+
+def _add_space(expr: str) -> str:
+    """
+    Agrega espacio entre coeficiente y variable y alrededor de los signos + y -.
+
+    Args:
+        expr: Expresión como "3x1+2x2".
+
+    Returns:
+        str: Expresión espaciada, como "3 x1 + 2 x2".
+    """
+    # Agregar espacio antes de cada variable
+    expr = _RE_COEF_VAR.sub(r"\1 \2", expr)
+    # Espaciado alrededor de + y -
+    expr = _RE_PLUS.sub(" + ", expr)
+    expr = _RE_MINUS.sub(" - ", expr)
+    # Quitar posibles espacios dobles y los espacios de los extremos
+    return " ".join(expr.split())
+
+
+class _FlowableStream(list):
+    """
+    Lista de flowables que se va completando desde un iterador mientras ReportLab la consume.
+
+    ``doc.build`` toma y borra los flowables desde el frente de la lista, por lo que basta con
+    mantener unos pocos pendientes: cada bloque se construye justo antes de maquetarse y se
+    libera después. Así la memoria de un reporte con miles de iteraciones queda acotada por
+    unos pocos bloques, no por la cantidad de pasos.
+    """
+
+    def __init__(self, head: list, pending: Iterator, lookahead: int = 4):
+        """
+        Inicializa la lista.
+
+        Args:
+            head: Flowables ya construidos (resumen, solución, sensibilidad).
+            pending: Iterador con los flowables restantes.
+            lookahead: Cantidad mínima de flowables disponibles mientras queden pendientes.
+        """
+        super().__init__(head)
+        self._pending = pending
+        self._lookahead = lookahead
+        self._refill()
+
+    def _refill(self) -> None:
+        """Toma flowables del iterador hasta tener ``lookahead`` disponibles."""
+        while len(self) < self._lookahead:
+            flowable = next(self._pending, None)
+            if flowable is None:
+                break
+            self.append(flowable)
+
+    def __delitem__(self, index) -> None:
+        super().__delitem__(index)
+        self._refill()
+
+
+class _MeasuredTable(Table):
+    """
+    Tabla que reutiliza su medición cuando se la vuelve a medir con el mismo ancho.
+
+    ``KeepTogether`` mide su contenido para decidir el salto de página y luego el frame lo
+    vuelve a medir al ubicarlo; además la tabla contenedora mide la tabla interna en cada
+    medición y al dibujarla. Las tablas de iteraciones no tienen filas de alto relativo, por
+    lo que su tamaño depende solo del ancho y la primera medición sirve para las siguientes.
+    """
+
+    _measured_width = None
+
+    def wrap(self, availWidth, availHeight):
+        if availWidth != self._measured_width:
+            super().wrap(availWidth, availHeight)
+            self._measured_width = availWidth
+        return self._width, self._height
+
+
+def _row_runs(rows: List[int]) -> List[Tuple[int, int]]:
+    """
+    Agrupa filas ordenadas en tramos de filas consecutivas.
+
+    Args:
+        rows: Índices de fila en orden creciente.
+
+    Returns:
+        list: Tramos (primera fila, última fila), por ejemplo [1, 2, 3, 5] -> [(1, 3), (5, 5)].
+    """
+    runs = []
+    for row in rows:
+        if runs and runs[-1][1] == row - 1:
+            runs[-1] = (runs[-1][0], row)
+        else:
+            runs.append((row, row))
+    return runs
+
+
+def _format_range(lower: float, upper: float) -> str:
+    """
+    Formatea un rango de sensibilidad como "[lower, upper]", con ±∞ para los extremos abiertos.
+
+    Args:
+        lower: Límite inferior del rango.
+        upper: Límite superior del rango.
+
+    Returns:
+        str: Rango con seis decimales, como "[-∞, 12.500000]".
+    """
+    lower_str = "-∞" if lower == _NEG_INF else f"{lower:.6f}"
+    upper_str = "+∞" if upper == _POS_INF else f"{upper:.6f}"
+    return f"[{lower_str}, {upper_str}]"
+
+
+def _format_var_name(var_idx, n_original_vars):
+    """Nombre de una variable para el reporte: x1, x2, ... o s1, s2, ... para las holguras."""
+    if isinstance(var_idx, int):
+        if var_idx < n_original_vars:
+            return f"x{var_idx+1}"
+        else:
+            holg_idx = var_idx - n_original_vars + 1
+            return f"s{holg_idx}"
+    else:
+        return str(var_idx)
+
+
+def _extend_var_names(var_names: list, count: int, n_original_vars: int) -> list:
+    """
+    Completa la tabla de nombres de variables hasta ``count`` columnas.
+
+    Args:
+        var_names: Nombres ya calculados (se amplía en el lugar).
+        count: Cantidad de columnas de variables necesarias.
+        n_original_vars: Número de variables de decisión del problema.
+
+    Returns:
+        list: La misma tabla ``var_names``, con al menos ``count`` nombres.
+    """
+    for i in range(len(var_names), count):
+        var_names.append(_format_var_name(i, n_original_vars))
+    return var_names
+
+
+def _build_iteration_block(
+    step,
+    idx: int,
+    last_idx: int,
+    n_original_vars: int,
+    available_width: float,
+    var_names: Optional[list] = None,
+) -> list:
+    """
+    Construye los elementos del PDF de una iteración: título, variables que entran y salen,
+    y el tableau con el pivote resaltado junto a la flecha con el número de iteración.
+
+    Args:
+        step: Paso del historial (con las claves ``iteration``, ``tableau``, ``basic_vars``,
+            ``entering_var``, ``leaving_var`` y ``pivot_coords_next``).
+        idx: Posición del paso en el historial.
+        last_idx: Posición del último paso (se resalta como tableau final).
+        n_original_vars: Número de variables de decisión del problema.
+        available_width: Ancho utilizable de la página.
+        var_names: Tabla de nombres de variables compartida entre los pasos (ver
+            ``_extend_var_names``); si es None se arma una para este paso.
+
+    Returns:
+        list: Elementos de la iteración, para agrupar con ``KeepTogether``.
+    """
+    iter_num = step["iteration"]
+
+    # Detectar título de la iteración
+    if step["entering_var"] is None:
+        iter_title = f"Iteración {iter_num} – Estado inicial (tableau inicial)"
+    elif idx == last_idx:
+        iter_title = f"Iteración {iter_num} – Estado final (tableau final)"
+    else:
+        iter_title = f"Iteración {iter_num}"
+
+    # Bloque de la iteración
+    iteration_block = []
+
+    # --- Título y subtítulo (a la izquierda) ---
+    iteration_block.append(Paragraph(iter_title, _STYLES["Heading3"]))
+    if step["entering_var"] is not None:
+        entering_name = _format_var_name(step["entering_var"], n_original_vars)
+        leaving_name = _format_var_name(step["leaving_var"], n_original_vars)
+        iteration_block.append(
+            Paragraph(
+                f"Variable que entra: {entering_name}, Variable que sale: {leaving_name}",
+                _STYLES["Normal"],
+            )
+        )
+
+    # 3- Espacio antes de la tabla
+    iteration_block.append(Spacer(1, 10))
+
+    # 4- Construcción de la tabla
+    tableau_to_show = step["tableau"]
+    m, n_plus = tableau_to_show.shape
+    n = n_plus - 1  # columnas de variables (RHS no incluida)
+
+    # Nombres de las columnas, calculados una sola vez para todos los pasos
+    names = _extend_var_names([] if var_names is None else var_names, n, n_original_vars)
+
+    # Cabecera: VB + nombres + b
+    header = ["VB", *names[:n], "b"]
+
+    # Variables básicas de la iteración; las filas sin variable básica (la fila z) van al final
+    basic_vars = step.get("basic_vars", [])
+    row_names = [
+        (
+            names[vb]
+            if isinstance(vb, int) and 0 <= vb < n
+            else _format_var_name(vb, n_original_vars)
+        )
+        for vb in basic_vars[:m]
+    ]
+    row_names += ["z"] * (m - len(row_names))
+
+    # Filas (tolist() da floats de Python, mucho más rápidos de formatear que
+    # los escalares de NumPy), armadas en una sola lista
+    data = [
+        header,
+        *[
+            [vb_name, *[f"{val:.2f}" for val in row]]
+            for vb_name, row in zip(row_names, tableau_to_show.tolist())
+        ],
+    ]
+
+    table = _MeasuredTable(data, repeatRows=1)
+
+    # Estilos de la tabla: base común más la línea superior de la última fila
+    styles_list = [*_TABLEAU_BASE_STYLE, ("LINEABOVE", (0, m), (-1, m), 1, colors.black)]
+
+    # Resaltar pivote si existe
+    pivot_info = step.get("pivot_coords_next")
+    if pivot_info:
+        entering_col = pivot_info["entering_col"] + 1  # +1 por columna VB
+        leaving_row = pivot_info["leaving_row"] + 1  # +1 por fila header
+        styles_list += [
+            (
+                "BACKGROUND",
+                (entering_col, 1),
+                (entering_col, m),
+                colors.lavender,
+            ),  # Columna pivote
+            (
+                "BACKGROUND",
+                (1, leaving_row),
+                (-1, leaving_row),
+                colors.lavender,
+            ),  # Fila pivote
+            (
+                "BACKGROUND",
+                (entering_col, leaving_row),
+                (entering_col, leaving_row),
+                colors.lightblue,
+            ),  # Celda pivote
+            (
+                "TEXTCOLOR",
+                (entering_col, leaving_row),
+                (entering_col, leaving_row),
+                colors.darkblue,
+            ),
+            ("BACKGROUND", (0, 1), (0, m - 1), colors.whitesmoke),  # VB
+            (
+                "BACKGROUND",
+                (0, m),
+                (0, m),
+                colors.lightgrey,
+            ),  # Última fila VB
+        ]
+
+    # Última iteración: resaltar z, VB y RHS
+    if idx == last_idx:
+        styles_list += [
+            ("BACKGROUND", (0, m), (0, m), colors.lightgrey),  # celda 'z'
+            ("BACKGROUND", (-1, m), (-1, m), colors.lightgrey),  # valor z
+            ("TEXTCOLOR", (0, m), (0, m), colors.black),
+            ("TEXTCOLOR", (-1, m), (-1, m), colors.black),
+            ("BACKGROUND", (0, 1), (0, m - 1), colors.whitesmoke),  # VB
+            ("BACKGROUND", (-1, 1), (-1, m - 1), colors.whitesmoke),  # RHS
+        ]
+
+        # Resaltar variables básicas de decisión (no de holgura), con un comando por cada
+        # tramo de filas consecutivas en lugar de uno por fila
+        decision_rows = [
+            row_idx + 1
+            for row_idx, vb in enumerate(basic_vars)
+            if isinstance(vb, int) and vb < n_original_vars  # Filtra VB reales
+        ]
+        for start, end in _row_runs(decision_rows):
+            styles_list.append(("BACKGROUND", (0, start), (0, end), colors.lavender))  # VB
+            styles_list.append(("BACKGROUND", (-1, start), (-1, end), colors.lavender))  # RHS
+
+    table.setStyle(TableStyle(styles_list))
+    # Centrar horizontalmente la tabla dentro de su columna
+    table.hAlign = "CENTER"
+
+    # Flecha con número de iteración
+    arrow_para = Paragraph(f"<font size=14>{iter_num}</font> <font size=14>➤</font>", _ARROW_STYLE)
+
+    # Ancho de columnas flecha y tabla
+    arrow_col_frac = 0.25  # % para la flecha
+    arrow_col_width = available_width * arrow_col_frac
+    table_col_width = available_width * (1 - arrow_col_frac)
+
+    # Encapsular flecha y bloque iteración en tabla de 2 columnas
+    wrapper_table = _MeasuredTable(
+        [[arrow_para, table]],  # tabla a la derecha dentro de la mini tabla
+        colWidths=[arrow_col_width, table_col_width],
+        hAlign="LEFT",  # alineación desde el margen izquierdo
+    )
+    wrapper_table.setStyle(_WRAPPER_STYLE)
+
+    # Agregar wrapper_table al bloque de iteración y mantener todo junto
+    iteration_block.append(wrapper_table)
+    iteration_block.append(Spacer(1, 6))
+
+    return iteration_block
+
 
 def export_to_pdf(result: dict, filename: str):
     """
@@ -35,27 +401,12 @@ def export_to_pdf(result: dict, filename: str):
     - Estado y solución final
     - Detalle de iteraciones (incluyendo tablas intermedias).
     """
-    if LOGGING_AVAILABLE:
-        logger.info(f"Iniciando exportación a PDF: {filename}")
-
     try:
         doc = SimpleDocTemplate(filename, pagesize=letter)
         elements = []
-        styles = getSampleStyleSheet()
-
-        # Color y estilo para títulos
-        title_color = colors.HexColor("#595959")
-        custom_title_style = ParagraphStyle(
-            "CustomTitle",
-            parent=styles["Title"],
-            textColor=title_color,
-            alignment=2,  # TA_RIGHT
-            rightIndent=20,  # deja 20 puntos desde el borde derecho
-        )
-
-        custom_heading2_style = ParagraphStyle(
-            "CustomHeading2", parent=styles["Heading2"], textColor=title_color
-        )
+        styles = _STYLES
+        custom_title_style = _TITLE_STYLE
+        custom_heading2_style = _H2_STYLE
 
         # --- Configuración inicial del layout ---
         left_margin = 30
@@ -77,17 +428,6 @@ def export_to_pdf(result: dict, filename: str):
             elements.append(Paragraph("Resumen del problema", custom_heading2_style))
             elements.append(Spacer(1, 4))
 
-            # --- Función auxiliar para agregar espacio entre coeficiente y variable ---
-            def add_space(expr: str) -> str:
-                # Agregar espacio antes de cada variable
-                expr = re.sub(r"(\d)(x\d+)", r"\1 \2", expr)
-                # Espaciado alrededor de + y -
-                expr = re.sub(r"\+", " + ", expr)
-                expr = re.sub(r"(?<!^)-", " - ", expr)  # evita espacio al inicio si es negativo
-                # Quitar posibles espacios dobles
-                expr = re.sub(r"\s+", " ", expr)
-                return expr.strip()
-
             # --- Construir contenido del resumen ---
             problem_content = []
 
@@ -95,7 +435,7 @@ def export_to_pdf(result: dict, filename: str):
             objective_str = result["problem"]["objective_str"]
             if objective_str.startswith("Maximizar"):
                 expr = objective_str[len("Maximizar ") :]
-                expr = add_space(expr)
+                expr = _add_space(expr)
                 problem_content.append(
                     Paragraph(
                         f"<b>Maximizar:</b> <b><font color='{highlight_color}'>{expr}</font></b>",
@@ -104,7 +444,7 @@ def export_to_pdf(result: dict, filename: str):
                 )
             elif objective_str.startswith("Minimizar"):
                 expr = objective_str[len("Minimizar ") :]
-                expr = add_space(expr)
+                expr = _add_space(expr)
                 problem_content.append(
                     Paragraph(
                         f"<b>Minimizar:</b> <b><font color='{highlight_color}'>{expr}</font></b>",
@@ -112,7 +452,7 @@ def export_to_pdf(result: dict, filename: str):
                     )
                 )
             else:
-                expr = add_space(objective_str)
+                expr = _add_space(objective_str)
                 problem_content.append(
                     Paragraph(
                         f"<font color='{highlight_color}'>{objective_str}</font>",
@@ -126,7 +466,7 @@ def export_to_pdf(result: dict, filename: str):
             problem_content.append(Paragraph("<b>Sujeto a:</b>", styles["Normal"]))
             problem_content.append(Spacer(1, 4))
             for constr in problem["constraints_str"]:
-                constr_fmt = add_space(constr)
+                constr_fmt = _add_space(constr)
                 problem_content.append(
                     Paragraph(
                         f"<b><font color='{highlight_color}'>{constr_fmt}</font></b>",
@@ -173,11 +513,14 @@ def export_to_pdf(result: dict, filename: str):
             )
             solution_content.append(Spacer(1, 4))  # Espaciado extra antes de las variables
 
+            # Marcado de cada valor resaltado, armado una sola vez para todas las soluciones
+            value_open = f"<b><font color='{highlight_color}'>"
+            value_close = "</font></b>"
+
             solution = result.get("solution", {})
             if solution:
                 vars_str = ", ".join(
-                    f"<b><font color='{highlight_color}'>{var}={val:.2f}</font></b>"
-                    for var, val in solution.items()
+                    [f"{value_open}{var}={val:.2f}{value_close}" for var, val in solution.items()]
                 )
                 solution_content.append(Paragraph(f"<b>Para</b> {vars_str}", styles["Normal"]))
 
@@ -197,8 +540,10 @@ def export_to_pdf(result: dict, filename: str):
                     for idx, alt_solution in enumerate(result["solutions"][1:], start=2):
                         solution_content.append(Spacer(1, 4))
                         alt_vars_str = ", ".join(
-                            f"<b><font color='{highlight_color}'>{var}={val:.2f}</font></b>"
-                            for var, val in alt_solution.items()
+                            [
+                                f"{value_open}{var}={val:.2f}{value_close}"
+                                for var, val in alt_solution.items()
+                            ]
                         )
                         solution_content.append(
                             Paragraph(
@@ -223,7 +568,7 @@ def export_to_pdf(result: dict, filename: str):
             solution_table.setStyle(
                 TableStyle(
                     [
-                        ("BACKGROUND", (0, 0), (-1, -1), "#DDFBDF"),  # fondo
+                        ("BACKGROUND", (0, 0), (-1, -1), _SOLUTION_BG),  # fondo
                         ("BOX", (0, 0), (-1, -1), 1, colors.grey),  # borde gris
                         ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
                         ("ALIGN", (0, 0), (-1, -1), "CENTER"),  # centra contenido
@@ -284,18 +629,10 @@ def export_to_pdf(result: dict, filename: str):
 
                 opt_ranges = analysis["optimality_ranges"]
                 for var, (lower, upper) in sorted(opt_ranges.items()):
-                    if lower == float("-inf"):
-                        lower_str = "-∞"
-                    else:
-                        lower_str = f"{lower:.6f}"
-                    if upper == float("inf"):
-                        upper_str = "+∞"
-                    else:
-                        upper_str = f"{upper:.6f}"
-
                     sensitivity_content.append(
                         Paragraph(
-                            f"<b><font color='{highlight_color}'>{var}:</font></b> [{lower_str}, {upper_str}]",
+                            f"<b><font color='{highlight_color}'>{var}:</font></b> "
+                            f"{_format_range(lower, upper)}",
                             styles["Normal"],
                         )
                     )
@@ -316,18 +653,10 @@ def export_to_pdf(result: dict, filename: str):
 
                 feas_ranges = analysis["feasibility_ranges"]
                 for constraint, (lower, upper) in sorted(feas_ranges.items()):
-                    if lower == float("-inf"):
-                        lower_str = "-∞"
-                    else:
-                        lower_str = f"{lower:.6f}"
-                    if upper == float("inf"):
-                        upper_str = "+∞"
-                    else:
-                        upper_str = f"{upper:.6f}"
-
                     sensitivity_content.append(
                         Paragraph(
-                            f"<b><font color='{highlight_color}'>{constraint}:</font></b> [{lower_str}, {upper_str}]",
+                            f"<b><font color='{highlight_color}'>{constraint}:</font></b> "
+                            f"{_format_range(lower, upper)}",
                             styles["Normal"],
                         )
                     )
@@ -354,17 +683,6 @@ def export_to_pdf(result: dict, filename: str):
                 elements.append(sensitivity_table)
                 elements.append(Spacer(1, 8))
 
-        # Función auxiliar para formatear nombres de variables
-        def format_var_name(var_idx, n_original_vars):
-            if isinstance(var_idx, int):
-                if var_idx < n_original_vars:
-                    return f"x{var_idx+1}"
-                else:
-                    holg_idx = var_idx - n_original_vars + 1
-                    return f"s{holg_idx}"
-            else:
-                return str(var_idx)
-
         # Mostrar pasos iterativos (Detalle de iteraciones)
         if "steps" in result:
 
@@ -374,209 +692,24 @@ def export_to_pdf(result: dict, filename: str):
             steps = result["steps"]
             n_original_vars = result.get("n_original_vars", 0)  # Número de variables originales
 
-            for idx, step in enumerate(steps):
-                iter_num = step["iteration"]
-
-                # Detectar título de la iteración
-                if step["entering_var"] is None:
-                    iter_title = f"Iteración {iter_num} – Estado inicial (tableau inicial)"
-                elif idx == len(steps) - 1:
-                    iter_title = f"Iteración {iter_num} – Estado final (tableau final)"
-                else:
-                    iter_title = f"Iteración {iter_num}"
-
-                # Bloque de la iteración
-                iteration_block = []
-
-                # --- Título y subtítulo (a la izquierda) ---
-                iteration_block.append(Paragraph(iter_title, styles["Heading3"]))
-                if step["entering_var"] is not None:
-                    entering_name = format_var_name(step["entering_var"], n_original_vars)
-                    leaving_name = format_var_name(step["leaving_var"], n_original_vars)
-                    iteration_block.append(
-                        Paragraph(
-                            f"Variable que entra: {entering_name}, Variable que sale: {leaving_name}",
-                            styles["Normal"],
-                        )
+            # Los bloques de las iteraciones se construyen a medida que ReportLab los maqueta
+            last_idx = len(steps) - 1
+            var_names = []
+            iteration_blocks = (
+                KeepTogether(
+                    _build_iteration_block(
+                        step, idx, last_idx, n_original_vars, available_width, var_names
                     )
-
-                # 3- Espacio antes de la tabla
-                iteration_block.append(Spacer(1, 10))
-
-                # 4- Construcción de la tabla
-                tableau_to_show = step["tableau"]
-                m, n_plus = tableau_to_show.shape
-                n = n_plus - 1  # columnas de variables (RHS no incluida)
-
-                # Cabecera: VB + nombres (usando format_var_name para consistencia) + b
-                header = ["VB"] + [format_var_name(i, n_original_vars) for i in range(n)] + ["b"]
-                data = [header]
-
-                # Variables básicas de la iteración
-                basic_vars = step.get("basic_vars", [])
-                # Filas
-                for row_idx, row in enumerate(tableau_to_show):
-                    vb_name = (
-                        format_var_name(basic_vars[row_idx], n_original_vars)
-                        if row_idx < len(basic_vars)
-                        else "z"
-                    )
-                    data_row = [vb_name] + [f"{val:.2f}" for val in row]
-                    data.append(data_row)
-
-                table = Table(data, repeatRows=1)
-
-                # Estilos de la tabla
-                styles_list = [
-                    ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
-                    ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),  # cabecera
-                    ("ALIGN", (0, 0), (-1, 0), "CENTER"),  # centra fila superior
-                    ("ALIGN", (0, 1), (0, -1), "CENTER"),  # centra columna VB
-                    ("ALIGN", (1, 1), (-1, -1), "CENTER"),  # centra resto de celdas
-                    (
-                        "LINEABOVE",
-                        (0, m),
-                        (-1, m),
-                        1,
-                        colors.black,
-                    ),  # línea superior de la última fila
-                ]
-
-                # Resaltar pivote si existe
-                pivot_info = step.get("pivot_coords_next")
-                if pivot_info:
-                    entering_col = pivot_info["entering_col"] + 1  # +1 por columna VB
-                    leaving_row = pivot_info["leaving_row"] + 1  # +1 por fila header
-                    styles_list += [
-                        (
-                            "BACKGROUND",
-                            (entering_col, 1),
-                            (entering_col, m),
-                            colors.lavender,
-                        ),  # Columna pivote
-                        (
-                            "BACKGROUND",
-                            (1, leaving_row),
-                            (-1, leaving_row),
-                            colors.lavender,
-                        ),  # Fila pivote
-                        (
-                            "BACKGROUND",
-                            (entering_col, leaving_row),
-                            (entering_col, leaving_row),
-                            colors.lightblue,
-                        ),  # Celda pivote
-                        (
-                            "TEXTCOLOR",
-                            (entering_col, leaving_row),
-                            (entering_col, leaving_row),
-                            colors.darkblue,
-                        ),
-                        ("BACKGROUND", (0, 1), (0, m - 1), colors.whitesmoke),  # VB
-                        (
-                            "BACKGROUND",
-                            (0, m),
-                            (0, m),
-                            colors.lightgrey,
-                        ),  # Última fila VB
-                    ]
-
-                # Última iteración: resaltar z, VB y RHS
-                if idx == len(steps) - 1:
-                    styles_list += [
-                        ("BACKGROUND", (0, m), (0, m), colors.lightgrey),  # celda 'z'
-                        ("BACKGROUND", (-1, m), (-1, m), colors.lightgrey),  # valor z
-                        ("TEXTCOLOR", (0, m), (0, m), colors.black),
-                        ("TEXTCOLOR", (-1, m), (-1, m), colors.black),
-                        ("BACKGROUND", (0, 1), (0, m - 1), colors.whitesmoke),  # VB
-                        ("BACKGROUND", (-1, 1), (-1, m - 1), colors.whitesmoke),  # RHS
-                    ]
-
-                    # Resaltar variables básicas de decisión (no de holgura)
-                    for row_idx, vb in enumerate(basic_vars):
-                        if isinstance(vb, int) and vb < n_original_vars:  # Filtra VB reales
-                            styles_list.append(
-                                (
-                                    "BACKGROUND",
-                                    (0, row_idx + 1),
-                                    (0, row_idx + 1),
-                                    colors.lavender,
-                                )
-                            )  # VB
-                            styles_list.append(
-                                (
-                                    "BACKGROUND",
-                                    (-1, row_idx + 1),
-                                    (-1, row_idx + 1),
-                                    colors.lavender,
-                                )
-                            )  # RHS
-
-                table.setStyle(TableStyle(styles_list))
-                # Centrar horizontalmente la tabla dentro de su columna
-                table.hAlign = "CENTER"
-
-                # Flecha con número de iteración
-                arrow_text = f"{iter_num} ➤"
-                arrow_para = Paragraph(
-                    arrow_text,
-                    ParagraphStyle(
-                        name="ArrowStyle",
-                        fontSize=14,
-                        alignment=TA_CENTER,
-                        textColor=colors.darkblue,
-                    ),
                 )
-                arrow_para = Paragraph(
-                    f"<font size=14>{iter_num}</font> <font size=14>➤</font>",
-                    ParagraphStyle(
-                        name="ArrowStyle", alignment=TA_CENTER, textColor=colors.HexColor("#7F7F7F")
-                    ),
-                )
-
-                # Ancho de columnas flecha y tabla
-                arrow_col_frac = 0.25  # % para la flecha
-                arrow_col_width = available_width * arrow_col_frac
-                table_col_width = available_width * (1 - arrow_col_frac)
-
-                # Encapsular flecha y bloque iteración en tabla de 2 columnas
-                wrapper_table = Table(
-                    [[arrow_para, table]],  # tabla a la derecha dentro de la mini tabla
-                    colWidths=[arrow_col_width, table_col_width],
-                    hAlign="LEFT",  # alineación desde el margen izquierdo
-                )
-                wrapper_table.setStyle(
-                    TableStyle(
-                        [
-                            (
-                                "VALIGN",
-                                (0, 0),
-                                (0, -1),
-                                "MIDDLE",
-                            ),  # Columna 0: flecha centrada verticalmente
-                            (
-                                "VALIGN",
-                                (1, 0),
-                                (1, -1),
-                                "TOP",
-                            ),  # Columna 1: tabla mantiene alineación superior
-                            ("LEFTPADDING", (0, 0), (0, 0), 0),
-                            ("RIGHTPADDING", (0, 0), (0, 0), 0),
-                        ]
-                    )
-                )
-
-                # Agregar wrapper_table al bloque de iteración y mantener todo junto
-                iteration_block.append(wrapper_table)
-                iteration_block.append(Spacer(1, 6))
-
-                elements.append(KeepTogether(iteration_block))
+                for idx, step in enumerate(steps)
+            )
 
             # Generar PDF
-            doc.build(elements)
+            doc.build(_FlowableStream(elements, iteration_blocks))
             print(f"PDF generado exitosamente: {filename}")
+            # Un solo registro por exportación exitosa (cada registro es una escritura en la
+            # base de logs); el inicio y el éxito ya los registra `reporting_pdf.generate_pdf`
             if LOGGING_AVAILABLE:
-                logger.info(f"PDF exportado exitosamente: {filename}")
                 logger.log_file_operation("export_pdf", filename, True)
 
     except Exception as e:
@@ -39,8 +39,18 @@ class FileParser:
             file_size = os.path.getsize(filename)
             logger.debug(f"Tamaño del archivo: {file_size} bytes")
 
-            with open(filename, "r", encoding=FileConfig.DEFAULT_ENCODING) as f:
-                lines = [line.strip() for line in f.readlines() if line.strip()]
+            # Se recorre el archivo línea a línea: solo las líneas no vacías quedan en memoria
+            lines = []
+            with open(
+                filename,
+                "r",
+                encoding=FileConfig.DEFAULT_ENCODING,
+                buffering=FileConfig.READ_BUFFER_SIZE,
+            ) as f:
+                for raw_line in f:
+                    line = raw_line.strip()
+                    if line:
+                        lines.append(line)
 
             logger.log_file_operation("read", filename, True)
 
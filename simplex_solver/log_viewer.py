@@ -26,6 +26,15 @@ class LogViewer:
         self.db_path = db_path
         if not os.path.exists(db_path):
             raise FileNotFoundError(f"Base de datos no encontrada: {db_path}")
+        # Una sola conexión para todas las consultas del visor, en modo autocommit para que
+        # cada consulta vea los logs registrados mientras el visor está abierto
+        self._conn = sqlite3.connect(db_path, isolation_level=None)
+
+    def close(self):
+        """
+        Cierra la conexión con la base de datos de logs.
+        """
+        self._conn.close()
 
     def show_menu(self):
         """
@@ -90,8 +99,7 @@ class LogViewer:
         """
         limit = int(input("Cantidad de logs a mostrar (default: 50): ") or "50")
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._conn.cursor()
 
         cursor.execute(
             """
@@ -104,7 +112,7 @@ class LogViewer:
         )
 
         logs = cursor.fetchall()
-        conn.close()
+        cursor.close()
 
         if logs:
             print(f"\n📋 Últimos {len(logs)} logs:")
@@ -154,8 +162,7 @@ class LogViewer:
 
         limit = int(input("Cantidad de logs a mostrar (default: 50): ") or "50")
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._conn.cursor()
 
         cursor.execute(
             """
@@ -169,7 +176,7 @@ class LogViewer:
         )
 
         logs = cursor.fetchall()
-        conn.close()
+        cursor.close()
 
         if logs:
             print(f"\n📋 Logs nivel {level}:")
@@ -196,8 +203,7 @@ class LogViewer:
         Permite al usuario seleccionar una sesión específica y muestra los logs asociados a ella.
         """
         # Primero mostrar sesiones disponibles
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._conn.cursor()
 
         cursor.execute(
             """
@@ -212,7 +218,7 @@ class LogViewer:
 
         if not sessions:
             print("\n⚠️  No hay sesiones disponibles.")
-            conn.close()
+            cursor.close()
             return
 
         print("\n📋 Últimas 10 sesiones:")
@@ -261,14 +267,13 @@ class LogViewer:
         except ValueError:
             print("Entrada inválida.")
         finally:
-            conn.close()
+            cursor.close()
 
         input("\nPresione Enter para continuar...")
 
     def view_statistics(self):
         """Muestra estadísticas generales del sistema."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._conn.cursor()
 
         print("\n" + "=" * 60)
         print("ESTADÍSTICAS DEL SISTEMA")
@@ -347,15 +352,14 @@ class LogViewer:
         db_size = os.path.getsize(self.db_path) / (1024 * 1024)  # MB
         print(f"\n💾 Tamaño de la base de datos: {db_size:.2f} MB")
 
-        conn.close()
+        cursor.close()
         input("\nPresione Enter para continuar...")
 
     def view_solver_events(self):
         """Muestra eventos específicos del solver."""
         limit = int(input("Cantidad de eventos a mostrar (default: 20): ") or "20")
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._conn.cursor()
 
         cursor.execute(
             """
@@ -369,7 +373,7 @@ class LogViewer:
         )
 
         events = cursor.fetchall()
-        conn.close()
+        cursor.close()
 
         if events:
             print(f"\n📋 Últimos {len(events)} eventos del solver:")
@@ -407,8 +411,7 @@ class LogViewer:
         """Muestra operaciones con archivos."""
         limit = int(input("Cantidad de operaciones a mostrar (default: 20): ") or "20")
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._conn.cursor()
 
         cursor.execute(
             """
@@ -421,7 +424,7 @@ class LogViewer:
         )
 
         operations = cursor.fetchall()
-        conn.close()
+        cursor.close()
 
         if operations:
             print(f"\n📋 Últimas {len(operations)} operaciones con archivos:")
@@ -453,8 +456,7 @@ class LogViewer:
 
         limit = int(input("Cantidad máxima de resultados (default: 50): ") or "50")
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._conn.cursor()
 
         cursor.execute(
             """
@@ -468,7 +470,7 @@ class LogViewer:
         )
 
         results = cursor.fetchall()
-        conn.close()
+        cursor.close()
 
         if results:
             print(f"\n🔍 Resultados de búsqueda para '{search_term}':")
@@ -494,8 +496,7 @@ class LogViewer:
         """Muestra información detallada de las sesiones."""
         limit = int(input("Cantidad de sesiones a mostrar (default: 10): ") or "10")
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._conn.cursor()
 
         cursor.execute(
             """
@@ -509,7 +510,7 @@ class LogViewer:
         )
 
         sessions = cursor.fetchall()
-        conn.close()
+        cursor.close()
 
         if sessions:
             print(f"\n📋 Últimas {len(sessions)} sesiones:")
@@ -542,8 +543,7 @@ class LogViewer:
         days = int(input("Días de logs a exportar (default: 7): ") or "7")
         cutoff_date = (datetime.now() - timedelta(days=days)).isoformat()
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._conn.cursor()
 
         cursor.execute(
             """
@@ -556,7 +556,7 @@ class LogViewer:
         )
 
         logs = cursor.fetchall()
-        conn.close()
+        cursor.close()
 
         if logs:
             try:
@@ -601,10 +601,11 @@ class LogViewer:
 
         cutoff_date = (datetime.now() - timedelta(days=days)).isoformat()
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._conn.cursor()
 
         try:
+            # Las eliminaciones se confirman juntas en una sola transacción
+            cursor.execute("BEGIN")
             cursor.execute("DELETE FROM logs WHERE timestamp < ?", (cutoff_date,))
             logs_deleted = cursor.rowcount
 
@@ -617,7 +618,7 @@ class LogViewer:
             cursor.execute("DELETE FROM sessions WHERE start_time < ?", (cutoff_date,))
             sessions_deleted = cursor.rowcount
 
-            conn.commit()
+            self._conn.commit()
 
             print(f"\n✓ Limpieza completada:")
             print(f"  - Logs eliminados: {logs_deleted}")
@@ -630,9 +631,10 @@ class LogViewer:
             print("  - Base de datos compactada")
 
         except Exception as e:
+            self._conn.rollback()
             print(f"\n❌ Error durante la limpieza: {e}")
         finally:
-            conn.close()
+            cursor.close()
 
         input("\nPresione Enter para continuar...")
 
@@ -661,7 +663,10 @@ def main():
 
     try:
         viewer = LogViewer(db_path)
-        viewer.show_menu()
+        try:
+            viewer.show_menu()
+        finally:
+            viewer.close()
     except Exception as e:
         print(f"❌ Error al iniciar el visor de logs: {e}")
         import traceback
@@ -13,6 +13,8 @@ from typing import Optional, List, Dict, Any, Union
 from pathlib import Path
 import threading
 
+from simplex_solver.config import LoggingConfig
+
 
 class LogLevel:
     """
@@ -25,6 +27,9 @@ class LogLevel:
     ERROR = "ERROR"
     CRITICAL = "CRITICAL"
 
+    # Orden de severidad, para filtrar por nivel mínimo
+    SEVERITY = {DEBUG: 10, INFO: 20, WARNING: 30, ERROR: 40, CRITICAL: 50}
+
 
 class LoggingSystem:
     """
@@ -52,6 +57,13 @@ class LoggingSystem:
         if not hasattr(self, "initialized"):
             self.db_path = self._get_db_path()
             self.retention_days = 180  # Período de retención de logs en días
+            # Nivel mínimo que se registra (INFO si la configuración no es un nivel válido)
+            self.min_level = (
+                LoggingConfig.MIN_LEVEL
+                if LoggingConfig.MIN_LEVEL in LogLevel.SEVERITY
+                else LogLevel.INFO
+            )
+            self._min_severity = LogLevel.SEVERITY[self.min_level]
             self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
             self._init_database()
             self._log_system_info()
@@ -190,16 +202,21 @@ class LoggingSystem:
             ON logs(timestamp)
         """
         )
+        # Índices compuestos: el visor filtra por nivel o sesión y ordena por fecha, así
+        # que se recorre el índice en orden sin ordenar los resultados en memoria. Reemplazan
+        # a los índices de una sola columna de versiones anteriores.
+        cursor.execute("DROP INDEX IF EXISTS idx_logs_level")
+        cursor.execute("DROP INDEX IF EXISTS idx_logs_session")
         cursor.execute(
             """
-            CREATE INDEX IF NOT EXISTS idx_logs_level 
-            ON logs(level)
+            CREATE INDEX IF NOT EXISTS idx_logs_level_timestamp
+            ON logs(level, timestamp)
         """
         )
         cursor.execute(
             """
-            CREATE INDEX IF NOT EXISTS idx_logs_session 
-            ON logs(session_id)
+            CREATE INDEX IF NOT EXISTS idx_logs_session_timestamp
+            ON logs(session_id, timestamp)
         """
         )
         cursor.execute(
@@ -208,6 +225,18 @@ class LoggingSystem:
             ON sessions(start_time)
         """
         )
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_solver_events_timestamp
+            ON solver_events(timestamp)
+        """
+        )
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_file_operations_timestamp
+            ON file_operations(timestamp)
+        """
+        )
 
         conn.commit()
         conn.close()
@@ -249,10 +278,38 @@ class LoggingSystem:
         finally:
             conn.close()
 
+    def set_level(self, level: str):
+        """
+        Establece el nivel mínimo de los eventos que se registran.
+
+        Args:
+            level: Nivel mínimo (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        """
+        if level not in LogLevel.SEVERITY:
+            raise ValueError(f"Nivel de log desconocido: {level}")
+        self.min_level = level
+        self._min_severity = LogLevel.SEVERITY[level]
+
+    def is_enabled_for(self, level: str) -> bool:
+        """
+        Indica si un evento del nivel dado se registraría.
+
+        Permite evitar construir mensajes costosos (por ejemplo, dentro de bucles) cuando
+        el nivel está deshabilitado.
+
+        Args:
+            level: Nivel a consultar.
+
+        Returns:
+            bool: True si el nivel es igual o más severo que el mínimo configurado.
+        """
+        return LogLevel.SEVERITY.get(level, 0) >= self._min_severity
+
     def log(
         self,
         level: str,
         message: str,
+        *args: Any,
         module: Optional[str] = None,
         function: Optional[str] = None,
         exception: Optional[Exception] = None,
@@ -263,12 +320,19 @@ class LoggingSystem:
 
         Args:
             level: Nivel del log (DEBUG, INFO, WARNING, ERROR, CRITICAL)
-            message: Mensaje del log
+            message: Mensaje del log; si se pasan ``args`` se formatea con ``message % args``
+                solo cuando el nivel está habilitado
+            *args: Argumentos del mensaje (formato diferido)
             module: Nombre del módulo que genera el log
             function: Nombre de la función que genera el log
             exception: Excepción capturada (opcional)
             user_data: Datos adicionales del usuario (opcional)
         """
+        if not self.is_enabled_for(level):
+            return
+        if args:
+            message = message % args
+
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
 
@@ -561,25 +625,25 @@ class LoggingSystem:
         return self.db_path
 
     # Métodos de conveniencia para diferentes niveles
-    def debug(self, message: str, **kwargs):
+    def debug(self, message: str, *args: Any, **kwargs):
         """Log nivel DEBUG."""
-        self.log(LogLevel.DEBUG, message, **kwargs)
+        self.log(LogLevel.DEBUG, message, *args, **kwargs)
 
-    def info(self, message: str, **kwargs):
+    def info(self, message: str, *args: Any, **kwargs):
         """Log nivel INFO."""
-        self.log(LogLevel.INFO, message, **kwargs)
+        self.log(LogLevel.INFO, message, *args, **kwargs)
 
-    def warning(self, message: str, **kwargs):
+    def warning(self, message: str, *args: Any, **kwargs):
         """Log nivel WARNING."""
-        self.log(LogLevel.WARNING, message, **kwargs)
+        self.log(LogLevel.WARNING, message, *args, **kwargs)
 
-    def error(self, message: str, **kwargs):
+    def error(self, message: str, *args: Any, **kwargs):
         """Log nivel ERROR."""
-        self.log(LogLevel.ERROR, message, **kwargs)
+        self.log(LogLevel.ERROR, message, *args, **kwargs)
 
-    def critical(self, message: str, **kwargs):
+    def critical(self, message: str, *args: Any, **kwargs):
         """Log nivel CRITICAL."""
-        self.log(LogLevel.CRITICAL, message, **kwargs)
+        self.log(LogLevel.CRITICAL, message, *args, **kwargs)
 
 
 # Instancia global del logger
@@ -6,6 +6,7 @@ Coordina los módulos para resolver problemas de programación lineal.
 import sys
 import argparse
 import os
+import threading
 import time
 import json
 from typing import Tuple, List, Dict, Any, Optional
@@ -17,6 +18,7 @@ from simplex_solver.reporting_pdf import generate_pdf
 from simplex_solver.logging_system import logger, LogLevel
 from simplex_solver.problem_history import show_history_menu
 from simplex_solver.config import Messages, Defaults
+from simplex_solver.utils import kernels
 
 
 class ProblemData:
@@ -553,6 +555,18 @@ class ApplicationOrchestrator:
             print(f"\nNo se pudieron mostrar las tablas intermedias: {e}")
 
 
+def _start_kernel_warmup() -> None:
+    """
+    Compila (o carga desde la caché de Numba) los kernels en un hilo en segundo plano.
+
+    Se usa al abrir el menú interactivo: la carga se solapa con el tiempo en que el
+    usuario elige una opción, y la primera resolución no paga la compilación. No hace
+    nada si Numba no está instalado.
+    """
+    if kernels.NUMBA_AVAILABLE:
+        threading.Thread(target=kernels.warmup, name="kernel-warmup", daemon=True).start()
+
+
 def main():
     """
     Punto de entrada principal del programa.
@@ -565,6 +579,7 @@ def main():
     if len(sys.argv) == 1:
         from simplex_solver.menu import show_menu
 
+        _start_kernel_warmup()
         show_menu()
         return
 
@@ -543,7 +543,10 @@ class SimplexMenu:
                 return
 
             viewer = LogViewer(logs_path)
-            viewer.show_menu()
+            try:
+                viewer.show_menu()
+            finally:
+                viewer.close()
         except ImportError as e:
             self.ui.print_error(f"Error al importar el visor de logs: {e}")
         except FileNotFoundError as e:
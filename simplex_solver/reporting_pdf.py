@@ -8,12 +8,24 @@ from typing import Dict, Optional
 from simplex_solver.logging_system import logger
 from simplex_solver.config import ReportConfig
 
-try:
-    from simplex_solver.export import export_to_pdf
-except Exception as e:
-    # Manejo de errores al importar el módulo export
-    logger.error(f"Error al importar módulo export: {str(e)}", exception=e)
-    raise
+
+def export_to_pdf(result: Dict, filename: str) -> None:
+    """Delega en `export.export_to_pdf`, importando el módulo (y ReportLab) en el primer uso.
+
+    Así importar este módulo (por ejemplo desde `main`) no carga ReportLab si nunca se
+    genera un reporte.
+
+    Args:
+        result: Diccionario con la información del problema y los pasos de resolución.
+        filename: Ruta completa del archivo PDF a generar.
+    """
+    try:
+        from simplex_solver.export import export_to_pdf as _export_to_pdf
+    except Exception as e:
+        # Manejo de errores al importar el módulo export
+        logger.error(f"Error al importar módulo export: {str(e)}", exception=e)
+        raise
+    _export_to_pdf(result, filename)
 
 
 def generate_pdf(result: Dict, filename: str, reports_dir: Optional[str] = None) -> str:
@@ -0,0 +1,526 @@
+"""
+Kernels numéricos compilados para el método Simplex.
+
+Contiene las operaciones de bajo nivel sobre el tableau que se compilan con Numba
+cuando la dependencia opcional está instalada (``pip install simplex-solver[performance]``).
+Si Numba no está disponible, ``NUMBA_AVAILABLE`` es False y la clase Tableau utiliza
+su implementación en NumPy.
+"""
+
+import os
+from contextlib import contextmanager
+from typing import Iterator
+
+import numpy as np
+
+from simplex_solver.config import AlgorithmConfig
+
+try:
+    import numba
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+# Estrategias de pivoteo disponibles en los kernels
+PIVOT_SERIAL = 0
+PIVOT_PARALLEL = 1
+PIVOT_TILED = 2
+
+# Resultados de ``simplex_step``
+STEP_PIVOTED = 0
+STEP_OPTIMAL = 1
+STEP_UNBOUNDED = 2
+STEP_NO_LEAVING = 3
+STEP_SINGULAR_PIVOT = 4
+
+
+def use_parallel_pivot(nrows: int, ncols: int) -> bool:
+    """
+    Indica si conviene usar el kernel de pivoteo paralelo para un tableau de este tamaño.
+
+    En tableaus pequeños el costo de repartir las filas entre hilos supera la ganancia,
+    por lo que solo se usa el kernel paralelo por encima de los umbrales configurados.
+
+    Args:
+        nrows: Número de filas del tableau (restricciones + fila objetivo).
+        ncols: Número de columnas del tableau (variables + RHS).
+
+    Returns:
+        bool: True si debe usarse el kernel paralelo.
+    """
+    return (
+        NUMBA_AVAILABLE
+        and nrows * ncols > AlgorithmConfig.PARALLEL_PIVOT_MIN_CELLS
+        and nrows > AlgorithmConfig.PARALLEL_PIVOT_MIN_ROWS
+    )
+
+
+def select_pivot_mode(nrows: int, ncols: int, allow_parallel: bool = True) -> int:
+    """
+    Elige la estrategia de pivoteo para un tableau de este tamaño.
+
+    Args:
+        nrows: Número de filas del tableau.
+        ncols: Número de columnas del tableau.
+        allow_parallel: False para no usar el kernel paralelo (por ejemplo, cuando el
+            pivoteo ya se ejecuta dentro de un hilo de trabajo).
+
+    Returns:
+        int: ``PIVOT_TILED``, ``PIVOT_PARALLEL`` o ``PIVOT_SERIAL``.
+    """
+    if AlgorithmConfig.TILED_TABLEAU:
+        return PIVOT_TILED
+    if allow_parallel and use_parallel_pivot(nrows, ncols):
+        return PIVOT_PARALLEL
+    return PIVOT_SERIAL
+
+
+def use_parallel_sensitivity(count: int) -> bool:
+    """
+    Indica si conviene calcular rangos de sensibilidad con los kernels paralelos.
+
+    Args:
+        count: Número de rangos a calcular (variables de decisión o restricciones).
+
+    Returns:
+        bool: True si Numba está disponible y hay suficientes rangos.
+    """
+    return NUMBA_AVAILABLE and count >= AlgorithmConfig.PARALLEL_SENSITIVITY_MIN_VARS
+
+
+def use_compiled_phase(nrows: int, ncols: int) -> bool:
+    """
+    Indica si conviene resolver una fase con el bucle compilado ``run_phase``.
+
+    Args:
+        nrows: Número de filas del tableau.
+        ncols: Número de columnas del tableau.
+
+    Returns:
+        bool: True si Numba está disponible y el tableau supera el umbral configurado.
+    """
+    return NUMBA_AVAILABLE and nrows * ncols >= AlgorithmConfig.COMPILED_PHASE_MIN_CELLS
+
+
+@contextmanager
+def limited_threads(active: bool = True) -> Iterator[None]:
+    """
+    Limita a ``MAX_PIVOT_THREADS`` los hilos de los kernels paralelos lanzados en el bloque.
+
+    Numba guarda el número de hilos por cada hilo de Python, por lo que el límite se
+    aplica en el hilo que lanza el kernel y al salir se restaura el valor anterior, sin
+    cambiar la configuración de Numba del resto del proceso.
+
+    Args:
+        active: False para no cambiar nada (por ejemplo, si el kernel no es paralelo).
+    """
+    if not (active and NUMBA_AVAILABLE):
+        yield
+        return
+    previous = numba.get_num_threads()
+    numba.set_num_threads(min(previous, os.cpu_count() or 1, AlgorithmConfig.MAX_PIVOT_THREADS))
+    try:
+        yield
+    finally:
+        numba.set_num_threads(previous)
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True, nogil=True)
+    def pivot_serial(tableau, leaving_row, entering_col, tol):
+        """
+        Pivotea el tableau en el lugar sobre (leaving_row, entering_col).
+
+        Normaliza la fila pivote y resta a cada una de las demás filas su múltiplo
+        correspondiente. Las filas cuyo factor es menor que ``tol`` no se modifican.
+        """
+        nrows, ncols = tableau.shape
+        pivot = tableau[leaving_row, entering_col]
+        for j in range(ncols):
+            tableau[leaving_row, j] /= pivot
+
+        for i in range(nrows):
+            if i == leaving_row:
+                continue
+            factor = tableau[i, entering_col]
+            if abs(factor) > tol:
+                for j in range(ncols):
+                    tableau[i, j] -= factor * tableau[leaving_row, j]
+
+    @njit(cache=True, parallel=True)
+    def pivot_parallel(tableau, leaving_row, entering_col, tol):
+        """
+        Versión multihilo de ``pivot_serial``: reparte las filas no pivote entre hilos.
+
+        Cada hilo solo escribe sus propias filas y lee la fila pivote, que ya fue
+        normalizada antes del bucle paralelo, por lo que no hay condiciones de carrera.
+        """
+        nrows, ncols = tableau.shape
+        pivot = tableau[leaving_row, entering_col]
+        for j in range(ncols):
+            tableau[leaving_row, j] /= pivot
+
+        for i in prange(nrows):
+            if i != leaving_row:
+                factor = tableau[i, entering_col]
+                if abs(factor) > tol:
+                    for j in range(ncols):
+                        tableau[i, j] -= factor * tableau[leaving_row, j]
+
+    @njit(cache=True, nogil=True)
+    def pivot_tiled(tableau, leaving_row, entering_col, tol, tile_size):
+        """
+        Variante de ``pivot_serial`` que recorre el tableau por bloques de columnas.
+
+        Para cada bloque de ``tile_size`` columnas se actualizan todas las filas no pivote
+        mientras el tramo correspondiente de la fila pivote permanece en caché. Los factores
+        se leen antes de empezar, ya que la columna entrante se modifica al procesar su
+        bloque. Cada elemento recibe la misma operación que en ``pivot_serial``, por lo que
+        el resultado es idéntico.
+        """
+        nrows, ncols = tableau.shape
+        pivot = tableau[leaving_row, entering_col]
+        for j in range(ncols):
+            tableau[leaving_row, j] /= pivot
+
+        factors = np.empty(nrows)
+        for i in range(nrows):
+            factors[i] = tableau[i, entering_col]
+
+        for j0 in range(0, ncols, tile_size):
+            j1 = min(j0 + tile_size, ncols)
+            for i in range(nrows):
+                factor = factors[i]
+                if i != leaving_row and abs(factor) > tol:
+                    for j in range(j0, j1):
+                        tableau[i, j] -= factor * tableau[leaving_row, j]
+
+    @njit(cache=True, nogil=True)
+    def pivot(tableau, leaving_row, entering_col, tol, mode, tile_size):
+        """
+        Pivotea el tableau en el lugar con la estrategia indicada por ``mode``.
+
+        Libera el GIL, por lo que varios hilos pueden pivotear tableaus distintos a la
+        vez; en ese caso no debe usarse ``PIVOT_PARALLEL``.
+        """
+        if mode == PIVOT_TILED:
+            pivot_tiled(tableau, leaving_row, entering_col, tol, tile_size)
+        elif mode == PIVOT_PARALLEL:
+            pivot_parallel(tableau, leaving_row, entering_col, tol)
+        else:
+            pivot_serial(tableau, leaving_row, entering_col, tol)
+
+    @njit(cache=True)
+    def find_entering(tableau, excluded, phase1, maximize, use_bland, tol):
+        """
+        Columna entrante con las mismas reglas que ``Tableau.get_entering_variable``.
+
+        En Fase 1 se elige el costo reducido más negativo (ignorando las columnas marcadas
+        en ``excluded``); en Fase 2 el mejor costo reducido con empates dentro de 1e-12
+        resueltos por menor índice. Con ``use_bland`` se toma el primer candidato.
+        Devuelve -1 si no hay columna candidata.
+        """
+        ncols = tableau.shape[1] - 1
+        obj = tableau.shape[0] - 1
+        best = -1
+        best_val = 0.0
+
+        if phase1:
+            for j in range(ncols):
+                val = tableau[obj, j]
+                if val < -tol and not excluded[j]:
+                    if use_bland:
+                        return j
+                    if best == -1 or val < best_val:
+                        best = j
+                        best_val = val
+            return best
+
+        for j in range(ncols):
+            val = tableau[obj, j] if maximize else -tableau[obj, j]
+            if val > tol:
+                if use_bland:
+                    return j
+                if best == -1 or val > best_val:
+                    best_val = val
+                    best = j
+        if best == -1:
+            return -1
+        for j in range(ncols):
+            val = tableau[obj, j] if maximize else -tableau[obj, j]
+            if val > tol and best_val - val < 1e-12:
+                return j
+        return best
+
+    @njit(cache=True)
+    def find_leaving(tableau, basic_vars, entering_col, use_bland, tol):
+        """
+        Fila saliente por la prueba del cociente mínimo, en una sola pasada.
+
+        Los empates se resuelven por menor índice de fila o, con ``use_bland``, por la
+        variable básica de menor índice (regla de Bland). Devuelve -1 si ninguna fila
+        tiene coeficiente positivo con cociente válido.
+        """
+        m = tableau.shape[0] - 1
+        rhs_col = tableau.shape[1] - 1
+        best = -1
+        best_ratio = np.inf
+        for i in range(m):
+            a_ij = tableau[i, entering_col]
+            if a_ij > tol:
+                ratio = tableau[i, rhs_col] / a_ij
+                if ratio >= -tol:
+                    if ratio < best_ratio:
+                        best_ratio = ratio
+                        best = i
+                    elif use_bland and ratio == best_ratio and basic_vars[i] < basic_vars[best]:
+                        best = i
+        return best
+
+    @njit(cache=True)
+    def simplex_step(
+        tableau, basic_vars, excluded, phase1, maximize, use_bland, tol, pivot_tol, mode, tile_size
+    ):
+        """
+        Ejecuta una iteración completa del Simplex sobre el tableau (en el lugar).
+
+        Reúne en una sola llamada la prueba de optimalidad, la elección de la variable
+        entrante, la detección de no acotamiento, la prueba del cociente y el pivoteo.
+
+        Returns:
+            tuple: (estado, fila saliente, columna entrante, RHS de la fila saliente antes
+            del pivoteo), donde estado es una de las constantes ``STEP_*``.
+        """
+        entering_col = find_entering(tableau, excluded, phase1, maximize, use_bland, tol)
+        if entering_col == -1:
+            return STEP_OPTIMAL, -1, -1, 0.0
+
+        unbounded = True
+        for i in range(tableau.shape[0] - 1):
+            if tableau[i, entering_col] > tol:
+                unbounded = False
+                break
+        if unbounded:
+            return STEP_UNBOUNDED, -1, entering_col, 0.0
+
+        leaving_row = find_leaving(tableau, basic_vars, entering_col, use_bland, tol)
+        if leaving_row == -1:
+            return STEP_NO_LEAVING, -1, entering_col, 0.0
+
+        if abs(tableau[leaving_row, entering_col]) < pivot_tol:
+            return STEP_SINGULAR_PIVOT, leaving_row, entering_col, 0.0
+
+        rhs_before = tableau[leaving_row, tableau.shape[1] - 1]
+        pivot(tableau, leaving_row, entering_col, tol, mode, tile_size)
+        return STEP_PIVOTED, leaving_row, entering_col, rhs_before
+
+    @njit(cache=True)
+    def basis_seen(recent_bases, count, basic_vars):
+        """Indica si ``basic_vars`` coincide con alguna de las ``count`` bases guardadas."""
+        for r in range(count):
+            same = True
+            for i in range(basic_vars.shape[0]):
+                if recent_bases[r, i] != basic_vars[i]:
+                    same = False
+                    break
+            if same:
+                return True
+        return False
+
+    @njit(cache=True)
+    def run_phase(
+        tableau,
+        basic_vars,
+        excluded,
+        phase1,
+        maximize,
+        use_bland,
+        degenerate_count,
+        tol,
+        pivot_tol,
+        mode,
+        tile_size,
+        entering_cols,
+        leaving_rows,
+        leaving_vars,
+        recent_bases,
+        recent_state,
+    ):
+        """
+        Ejecuta hasta ``len(entering_cols)`` iteraciones del Simplex sin volver a Python.
+
+        Aplica ``simplex_step`` en un bucle compilado, actualiza la base en el lugar y
+        mantiene la detección de ciclado de ``SimplexSolver._solve_phase`` (la regla de
+        Bland se activa tras más pivoteos degenerados consecutivos que variables básicas
+        y se desactiva con un pivoteo no degenerado, y también se activa si una base se
+        repite dentro de una racha degenerada). ``recent_bases`` es el anillo de bases de
+        la racha actual y ``recent_state`` su (número de bases, próxima posición); ambos
+        se actualizan en el lugar para continuar en la llamada siguiente. Cada pivoteo
+        se anota en los arreglos de salida para que el llamador registre los pasos.
+
+        Returns:
+            tuple: (estado, pivoteos realizados, use_bland, pivoteos degenerados
+            consecutivos, activaciones de la regla de Bland). Si el estado es
+            ``STEP_PIVOTED`` se agotaron los arreglos de salida; en otro caso la posición
+            ``pivoteos`` de ``entering_cols``/``leaving_rows`` contiene la columna y fila
+            de la iteración que terminó la fase.
+        """
+        nbasic = basic_vars.shape[0]
+        activations = 0
+        for k in range(entering_cols.shape[0]):
+            status, leaving_row, entering_col, rhs_before = simplex_step(
+                tableau,
+                basic_vars,
+                excluded,
+                phase1,
+                maximize,
+                use_bland,
+                tol,
+                pivot_tol,
+                mode,
+                tile_size,
+            )
+            entering_cols[k] = entering_col
+            leaving_rows[k] = leaving_row
+            if status != STEP_PIVOTED:
+                return status, k, use_bland, degenerate_count, activations
+
+            if rhs_before < tol:
+                degenerate_count += 1
+                if degenerate_count > nbasic and not use_bland:
+                    use_bland = True
+                    activations += 1
+            else:
+                degenerate_count = 0
+                use_bland = False
+
+            leaving_vars[k] = basic_vars[leaving_row]
+            basic_vars[leaving_row] = entering_col
+
+            window = recent_bases.shape[0]
+            if window > 0:
+                if degenerate_count == 0:
+                    recent_state[0] = 0
+                    recent_state[1] = 0
+                elif not use_bland and basis_seen(recent_bases, recent_state[0], basic_vars):
+                    use_bland = True
+                    activations += 1
+                recent_bases[recent_state[1], :] = basic_vars
+                recent_state[1] = (recent_state[1] + 1) % window
+                recent_state[0] = min(recent_state[0] + 1, window)
+
+        return STEP_PIVOTED, entering_cols.shape[0], use_bland, degenerate_count, activations
+
+    @njit(cache=True, parallel=True)
+    def basic_var_deltas(tableau, rows, nonbasic_cols, eps, min_out, max_out):
+        """
+        Rangos de variación (min_delta, max_delta) del costo de cada variable básica.
+
+        Para la variable básica de la fila ``rows[k]`` recorre las columnas no básicas
+        con coeficiente de valor absoluto mayor que ``eps``: los cocientes costo reducido
+        / coeficiente acotan max_delta (coeficiente positivo) o min_delta (negativo). Las
+        variables se reparten entre hilos con ``prange``; el resultado es el mismo que el
+        de ``SensitivityAnalyzer._calculate_basic_var_range``.
+        """
+        obj = tableau.shape[0] - 1
+        for k in prange(rows.shape[0]):
+            row = rows[k]
+            lo = -np.inf
+            hi = np.inf
+            for idx in range(nonbasic_cols.shape[0]):
+                j = nonbasic_cols[idx]
+                a = tableau[row, j]
+                if abs(a) > eps:
+                    ratio = tableau[obj, j] / a
+                    if a > 0:
+                        if ratio < hi:
+                            hi = ratio
+                    elif ratio > lo:
+                        lo = ratio
+            min_out[k] = lo
+            max_out[k] = hi
+
+    @njit(cache=True, parallel=True)
+    def rhs_deltas(slack_block, rhs, eps, min_out, max_out):
+        """
+        Rangos de variación (min_delta, max_delta) del RHS de cada restricción.
+
+        Para la columna de holgura ``k`` aplica la prueba del cociente -rhs / coeficiente
+        sobre las filas con coeficiente de valor absoluto mayor que ``eps``: los cocientes
+        con coeficiente positivo acotan min_delta y los de coeficiente negativo max_delta.
+        Divide, enmascara y reduce en un solo recorrido, sin arreglos temporales; las
+        restricciones se reparten entre hilos con ``prange``. El resultado es el mismo
+        que el de ``SensitivityAnalyzer._calculate_rhs_range``.
+        """
+        for k in prange(slack_block.shape[1]):
+            lo = -np.inf
+            hi = np.inf
+            for i in range(slack_block.shape[0]):
+                a = slack_block[i, k]
+                if abs(a) > eps:
+                    ratio = -rhs[i] / a
+                    if a > 0:
+                        if ratio > lo:
+                            lo = ratio
+                    elif ratio < hi:
+                        hi = ratio
+            min_out[k] = lo
+            max_out[k] = hi
+
+
+def warmup() -> None:
+    """
+    Compila los kernels para los tipos de argumentos que usa el solver.
+
+    Numba compila cada kernel en su primera llamada (y con ``cache=True`` guarda el
+    resultado en disco para los procesos siguientes); esta función fuerza esa
+    compilación o carga resolviendo un tableau mínimo, en float64 y en el tipo de dato
+    configurado. No hace nada si Numba no está disponible.
+    """
+    if not NUMBA_AVAILABLE:
+        return
+
+    tol = AlgorithmConfig.NUMERICAL_TOLERANCE
+    tile_size = AlgorithmConfig.TABLEAU_TILE_SIZE
+    for dtype in {np.dtype(np.float64), np.dtype(AlgorithmConfig.TABLEAU_DTYPE)}:
+        # max x1 + x2 sujeto a x1 + x2 <= 4 (una restricción de holgura)
+        tableau = np.array([[1.0, 1.0, 1.0, 4.0], [1.0, 1.0, 0.0, 0.0]], dtype=dtype)
+        excluded = np.zeros(tableau.shape[1] - 1, dtype=np.bool_)
+        for mode in (PIVOT_SERIAL, PIVOT_PARALLEL, PIVOT_TILED):
+            pivot(tableau.copy(), 0, 0, tol, mode, tile_size)
+        basic_vars = np.array([2], dtype=np.intp)
+        simplex_step(
+            tableau.copy(),
+            basic_vars.copy(),
+            excluded,
+            False,
+            True,
+            False,
+            tol,
+            tol,
+            PIVOT_SERIAL,
+            tile_size,
+        )
+        steps = np.empty(1, dtype=np.intp)
+        run_phase(
+            tableau.copy(),
+            basic_vars.copy(),
+            excluded,
+            False,
+            True,
+            False,
+            0,
+            tol,
+            tol,
+            PIVOT_SERIAL,
+            tile_size,
+            steps,
+            steps.copy(),
+            steps.copy(),
+            np.empty((AlgorithmConfig.CYCLE_DETECTION_WINDOW, 1), dtype=np.intp),
+            np.zeros(2, dtype=np.intp),
+        )
@@ -18,9 +18,12 @@ Método de Dos Fases:
     Fase 2: Resuelve el problema original después de eliminar las variables artificiales.
 """
 
+import copy
+
 import numpy as np
-from typing import List, Tuple, Optional, Dict
+from typing import List, Tuple, Optional, Dict, Union
 from simplex_solver.config import AlgorithmConfig
+from simplex_solver.utils import kernels
 
 
 class Tableau:
@@ -36,7 +39,7 @@ class Tableau:
                  - 1 fila adicional para la función objetivo
                  - n columnas para variables (originales + holgura + exceso + artificiales)
                  - 1 columna adicional para el lado derecho (RHS)
-        basic_vars: Lista de índices de variables básicas (una por restricción)
+        basic_vars: Arreglo np.intp con los índices de las variables básicas (una por restricción)
         artificial_vars: Lista de índices de variables artificiales añadidas
         num_vars: Número de variables originales del problema
         num_constraints: Número de restricciones del problema
@@ -54,20 +57,23 @@ class Tableau:
     def __init__(self):
         """Inicializa un tableau vacío."""
         self.tableau: Optional[np.ndarray] = None
-        self.basic_vars: List[int] = []
+        self.basic_vars: np.ndarray = np.empty(0, dtype=np.intp)
         self.artificial_vars: List[int] = []
         self.num_vars: int = 0
         self.num_constraints: int = 0
         self.constraint_types: List[str] = []  # '<=', '>=', '='
         self.phase: int = 1  # 1 para Fase 1, 2 para Fase 2
         self.original_c: Optional[np.ndarray] = None  # Coeficientes originales guardados
+        self.dtype: np.dtype = np.dtype(np.float64)  # Tipo de dato del tableau
         self.tol: float = AlgorithmConfig.NUMERICAL_TOLERANCE
+        self.use_bland: bool = False  # Regla de Bland (anticiclado) para la variable entrante
+        self.allow_parallel_pivot: bool = True  # False en copias usadas desde hilos de trabajo
 
     def build_initial_tableau(
         self,
-        c: List[float],
-        A: List[List[float]],
-        b: List[float],
+        c: Union[List[float], np.ndarray],
+        A: Union[List[List[float]], np.ndarray],
+        b: Union[List[float], np.ndarray],
         constraint_types: List[str],
         maximize: bool = True,
     ) -> None:
@@ -81,9 +87,10 @@ class Tableau:
         - Variables artificiales para restricciones =
 
         Args:
-            c: Coeficientes de la función objetivo (n elementos)
-            A: Matriz de coeficientes de restricciones (m × n)
-            b: Vector de términos independientes (m elementos)
+            c: Coeficientes de la función objetivo (n elementos, lista o ndarray)
+            A: Matriz de coeficientes de restricciones (m × n, lista o ndarray, o matriz
+                dispersa con método ``tocoo`` como las de scipy.sparse)
+            b: Vector de términos independientes (m elementos, lista o ndarray)
             constraint_types: Lista de tipos ('<=', '>=', '=') para cada restricción
             maximize: True para maximización, False para minimización
 
@@ -99,6 +106,8 @@ class Tableau:
 
         Note:
             - Restricciones con b[i] < 0 se multiplican por -1 e invierten su tipo
+            - Los arreglos recibidos no se modifican; si ya son float64 no se copian
+            - Una matriz A dispersa no se densifica: solo sus no nulos se copian al tableau
             - Para >=: añade variable de exceso (-1) y artificial (+1)
             - Para =: añade solo variable artificial (+1)
             - Para <=: añade solo variable de holgura (+1)
@@ -106,27 +115,35 @@ class Tableau:
         # Normalizar entradas
         constraint_types = [s.strip() for s in constraint_types]
 
-        c_arr = np.array(c, dtype=float)
-        A_arr = np.array(A, dtype=float)
-        b_arr = np.array(b, dtype=float)
+        # asarray no copia si el llamador ya pasa arreglos float64 (caso de solve)
+        c_arr = np.asarray(c, dtype=np.float64)
+        b_arr = np.asarray(b, dtype=np.float64)
         self.constraint_types = constraint_types
         self.original_c = c_arr.copy()
 
-        m, n = A_arr.shape
+        if hasattr(A, "tocoo"):
+            # Matriz dispersa: se evita la copia densa intermedia de A
+            A_coo = A.tocoo()
+            A_arr = None
+            m, n = A_coo.shape
+        else:
+            A_arr = np.asarray(A, dtype=np.float64)
+            m, n = A_arr.shape
         self.num_vars = n
         self.num_constraints = m
 
-        # Si hay RHS negativo, multiplicar fila por -1 y voltear el tipo de restricción
-        for i in range(m):
-            if b_arr[i] < -self.tol:
-                A_arr[i, :] *= -1
-                b_arr[i] *= -1
-                # invertir el tipo de restricción cuando sea <= o >=
-                if constraint_types[i] == "<=":
-                    constraint_types[i] = ">="
-                elif constraint_types[i] == ">=":
-                    constraint_types[i] = "<="
-                # '=' queda igual
+        # Filas con RHS negativo: se invierten más abajo, ya dentro del tableau, para no
+        # modificar los arreglos del llamador
+        negative_rows = [i for i in range(m) if b_arr[i] < -self.tol]
+
+        # Si hay RHS negativo, voltear el tipo de restricción
+        for i in negative_rows:
+            # invertir el tipo de restricción cuando sea <= o >=
+            if constraint_types[i] == "<=":
+                constraint_types[i] = ">="
+            elif constraint_types[i] == ">=":
+                constraint_types[i] = "<="
+            # '=' queda igual
 
         # Recontar variables necesarias (usar los tipos ya normalizados)
         num_slack = constraint_types.count("<=")
@@ -135,15 +152,24 @@ class Tableau:
 
         total_vars = n + num_slack + num_surplus + num_artificial
 
-        # Inicializar tableau (m restricciones + 1 fila objetivo)
-        self.tableau = np.zeros((m + 1, total_vars + 1))
-        self.tableau[:-1, :n] = A_arr  # Coeficientes originales
+        # Inicializar tableau (m restricciones + 1 fila objetivo) con el tipo de dato
+        # configurado y su tolerancia
+        self.dtype = np.dtype(AlgorithmConfig.TABLEAU_DTYPE)
+        self.tol = tolerance_for_dtype(self.dtype)
+        self.tableau = np.zeros((m + 1, total_vars + 1), dtype=self.dtype)
+        if A_arr is not None:
+            self.tableau[:-1, :n] = A_arr  # Coeficientes originales
+        else:
+            # Coeficientes originales no nulos (add.at suma las entradas repetidas del
+            # formato COO, igual que al densificar la matriz)
+            np.add.at(self.tableau, (A_coo.row, A_coo.col), A_coo.data)
         self.tableau[:-1, -1] = b_arr  # Lado derecho
+        self.tableau[negative_rows, :] *= -1  # Multiplicar por -1 las filas con RHS negativo
 
         # Configurar variables de holgura, exceso y artificiales
         slack_idx = n
         artificial_idx = n + num_slack + num_surplus
-        self.basic_vars = []
+        self.basic_vars = np.empty(m, dtype=np.intp)
         self.artificial_vars = []
 
         # Insertar columnas en orden: [originals | slack(s) for <= | surplus(s) for >= | artificial]
@@ -151,7 +177,7 @@ class Tableau:
             if const_type == "<=":
                 # Variable de holgura +1
                 self.tableau[i, slack_idx] = 1.0
-                self.basic_vars.append(slack_idx)
+                self.basic_vars[i] = slack_idx
                 slack_idx += 1
 
             elif const_type == ">=":
@@ -160,7 +186,7 @@ class Tableau:
                 self.tableau[i, slack_idx] = -1.0
                 # artificial column
                 self.tableau[i, artificial_idx] = 1.0
-                self.basic_vars.append(artificial_idx)
+                self.basic_vars[i] = artificial_idx
                 self.artificial_vars.append(artificial_idx)
                 slack_idx += 1
                 artificial_idx += 1
@@ -168,7 +194,7 @@ class Tableau:
             elif const_type == "=":
                 # Variable artificial
                 self.tableau[i, artificial_idx] = 1.0
-                self.basic_vars.append(artificial_idx)
+                self.basic_vars[i] = artificial_idx
                 self.artificial_vars.append(artificial_idx)
                 artificial_idx += 1
 
@@ -279,8 +305,10 @@ class Tableau:
         cols_to_keep = [i for i in range(self.tableau.shape[1]) if i not in self.artificial_vars]
         old_to_new = {old: new for new, old in enumerate(cols_to_keep)}
 
-        # Filtrar la matriz
-        self.tableau = self.tableau[:, cols_to_keep]
+        # Filtrar la matriz; take devuelve un arreglo C-contiguo (la indexación avanzada
+        # por columnas lo dejaría en orden Fortran y los recorridos por fila de la Fase 2
+        # y los kernels de pivoteo trabajarían con saltos de memoria)
+        self.tableau = self.tableau.take(cols_to_keep, axis=1)
 
         # Recalcular índices de variables básicas (convertir índices viejos a nuevos)
         new_basic_vars = []
@@ -290,7 +318,7 @@ class Tableau:
             else:
                 # variable básica era artificial y fue eliminada -> situación degenerada
                 new_basic_vars.append(-1)
-        self.basic_vars = new_basic_vars
+        self.basic_vars = np.array(new_basic_vars, dtype=np.intp)
 
         # Si alguna básica quedó -1 (posición eliminada), buscaremos una columna que sea
         # una columna identidad en esa fila para poner como básica (heurística simple).
@@ -392,40 +420,53 @@ class Tableau:
         Para fase 2:
           - maximize: elegir columna con r_j > tol (máximo r_j)
           - minimize: elegir columna con r_j < -tol (mínimo r_j)
-        Se aplica regla de Bland en empates (elegir índice menor).
+        Se aplica regla de Bland en empates (elegir índice menor). Si ``use_bland`` está
+        activo se elige directamente el menor índice con costo reducido favorable.
+        """
+        return self.optimality_and_entering(maximize)[0]
+
+    def optimality_and_entering(self, maximize: bool) -> Tuple[int, bool]:
+        """
+        Combina ``is_optimal`` y ``get_entering_variable`` en una sola lectura de la fila objetivo.
+
+        Args:
+            maximize: True para maximización, False para minimización.
+
+        Returns:
+            tuple: (columna entrante o -1, True si el tableau es óptimo). En Fase 1 puede
+            no haber columna entrante sin que el tableau sea óptimo, si los únicos
+            coeficientes negativos corresponden a variables artificiales.
         """
         if self.tableau is None:
-            return -1
+            return -1, False
         last_row = self.tableau[-1, :-1]
 
         if self.phase == 1:
-            candidates = [
-                (i, val)
-                for i, val in enumerate(last_row)
-                if val < -self.tol and i not in self.artificial_vars
-            ]
-            if not candidates:
-                return -1
-            # elegir el más negativo
-            chosen = min(candidates, key=lambda x: (x[1], x[0]))
-            return chosen[0]
+            eligible = last_row < -self.tol
+            if not eligible.any():
+                return -1, True
+            if self.artificial_vars:
+                eligible[self.artificial_vars] = False
+            candidates = np.flatnonzero(eligible)
+            if candidates.size == 0:
+                return -1, False
+            if self.use_bland:
+                return int(candidates[0]), False
+            # elegir el más negativo (argmin devuelve el menor índice en empates)
+            return int(candidates[np.argmin(last_row[candidates])]), False
         else:
-            if maximize:
-                candidates = [(i, val) for i, val in enumerate(last_row) if val > self.tol]
-                if not candidates:
-                    return -1
-                # elegir el más grande; en empates Bland (menor índice)
-                max_val = max(val for _, val in candidates)
-                best = [i for i, v in candidates if abs(v - max_val) < 1e-12]
-                return min(best)
-            else:
-                # minimización: buscamos coeficientes negativos r_j < 0
-                candidates = [(i, val) for i, val in enumerate(last_row) if val < -self.tol]
-                if not candidates:
-                    return -1
-                min_val = min(val for _, val in candidates)
-                best = [i for i, v in candidates if abs(v - min_val) < 1e-12]
-                return min(best)
+            # En minimización se buscan r_j < 0: se niega la fila para tratar ambos casos
+            # como la búsqueda del mayor costo reducido positivo
+            scores = last_row if maximize else -last_row
+            candidates = np.flatnonzero(scores > self.tol)
+            if candidates.size == 0:
+                return -1, True
+            if self.use_bland:
+                return int(candidates[0]), False
+            # elegir el mejor; en empates Bland (menor índice)
+            candidate_scores = scores[candidates]
+            best_val = candidate_scores.max()
+            return int(candidates[np.argmax(best_val - candidate_scores < 1e-12)]), False
 
     def is_unbounded(self, entering_col: int) -> bool:
         """Verifica si el problema es no acotado (todas las entradas de la columna <= 0)."""
@@ -440,19 +481,23 @@ class Tableau:
         """
         if self.tableau is None:
             return -1, 0.0
-        ratios = [float("inf")] * self.num_constraints
-        for i in range(self.num_constraints):
-            a_ij = self.tableau[i, entering_col]
-            if a_ij > self.tol:
-                ratio = self.tableau[i, -1] / a_ij
-                if ratio >= -self.tol:
-                    ratios[i] = ratio
-
-        if all(r == float("inf") for r in ratios):
+        column = self.tableau[:-1, entering_col]
+        rhs = self.tableau[:-1, -1]
+        eligible = column > self.tol
+        ratios = np.full(self.num_constraints, np.inf)
+        ratios[eligible] = rhs[eligible] / column[eligible]
+        ratios[ratios < -self.tol] = np.inf
+
+        if np.all(ratios == np.inf):
             return -1, 0.0
 
-        # elegir la fila con ratio mínimo (si empates, regla de Bland: menor índice)
+        # elegir la fila con ratio mínimo (si empates, menor índice de fila; con
+        # ``use_bland``, la variable básica de menor índice según la regla de Bland)
         leaving_row = int(np.argmin(ratios))
+        if self.use_bland:
+            ties = np.flatnonzero(ratios == ratios[leaving_row])
+            if ties.size > 1:
+                leaving_row = int(ties[np.argmin(self.basic_vars[ties])])
         pivot = self.tableau[leaving_row, entering_col]
         return leaving_row, pivot
 
@@ -472,33 +517,32 @@ class Tableau:
         # Actualizar variables básicas
         self.basic_vars[leaving_row] = entering_col
 
-        # Normalizar fila pivote
-        self.tableau[leaving_row, :] /= pivot
-
-        # Actualizar otras filas
-        for i in range(self.num_constraints + 1):
-            if i != leaving_row:
-                factor = self.tableau[i, entering_col]
-                if abs(factor) > self.tol:
-                    self.tableau[i, :] -= factor * self.tableau[leaving_row, :]
+        pivot_array(self.tableau, leaving_row, entering_col, self.tol, self.allow_parallel_pivot)
 
     def get_solution(self, maximize: bool) -> Tuple[dict, float]:
         """Extrae la solución del tableau actual y calcula el valor óptimo con c^T x."""
         if self.tableau is None:
             return {}, 0.0
 
-        solution = {}
+        x, optimal_value = self.get_solution_vector()
+        return self.solution_to_dict(x), optimal_value
 
-        # Inicializar todas las variables originales en cero
-        for i in range(self.num_vars):
-            solution[f"x{i+1}"] = 0.0
+    def get_solution_vector(self) -> Tuple[np.ndarray, float]:
+        """
+        Extrae los valores de las variables originales como vector y el valor c^T x.
 
-        # Asignar valores de variables básicas
+        Returns:
+            tuple: (x, valor) donde x tiene un elemento por variable original.
+        """
         x = np.zeros(self.num_vars)
-        for i, var in enumerate(self.basic_vars):
-            if 0 <= var < self.num_vars:  # Solo variables originales
-                x[var] = float(self.tableau[i, -1])
-                solution[f"x{var+1}"] = float(self.tableau[i, -1])
+        if self.tableau is None:
+            return x, 0.0
+
+        # Asignar valores de variables básicas (solo variables originales): filas cuya
+        # básica es una variable original, en una sola asignación indexada
+        basic_vars = np.asarray(self.basic_vars)
+        rows = np.flatnonzero((basic_vars >= 0) & (basic_vars < self.num_vars))
+        x[basic_vars[rows]] = self.tableau[rows, -1]
 
         # Calcular valor óptimo con el c original guardado
         if self.original_c is None:
@@ -506,7 +550,36 @@ class Tableau:
         else:
             optimal_value = float(np.dot(self.original_c, x))
 
-        return solution, optimal_value
+        return x, optimal_value
+
+    @staticmethod
+    def solution_to_dict(x: np.ndarray) -> Dict[str, float]:
+        """
+        Convierte un vector de solución en el diccionario {"x1": ..., "xn": ...}.
+
+        Args:
+            x: Valores de las variables originales.
+
+        Returns:
+            dict: Valor de cada variable original, en orden.
+        """
+        return {f"x{i + 1}": float(value) for i, value in enumerate(x)}
+
+    def fork(self) -> "Tableau":
+        """
+        Crea una copia ligera para explorar pivoteos sin modificar esta instancia.
+
+        La copia comparte el arreglo del tableau (que debe tratarse como de solo lectura
+        hasta reemplazarlo) pero tiene su propia base, y no usa el pivoteo multihilo
+        porque está pensada para ejecutarse dentro de un hilo de trabajo.
+
+        Returns:
+            Tableau: La copia.
+        """
+        clone = copy.copy(self)
+        clone.basic_vars = self.basic_vars.copy()
+        clone.allow_parallel_pivot = False
+        return clone
 
     def print_tableau(self) -> None:
         """Imprime el tableau actual de forma legible."""
@@ -516,3 +589,61 @@ class Tableau:
             for row in self.tableau:
                 print("  " + "  ".join(f"{val:8.2f}" for val in row))
             print()
+
+
+def tolerance_for_dtype(dtype: np.dtype) -> float:
+    """
+    Devuelve la tolerancia numérica adecuada para un tableau del tipo de dato indicado.
+
+    Args:
+        dtype: Tipo de dato del tableau.
+
+    Returns:
+        float: ``FLOAT32_TOLERANCE`` para float32; ``NUMERICAL_TOLERANCE`` en otro caso.
+    """
+    if np.dtype(dtype) == np.float32:
+        return AlgorithmConfig.FLOAT32_TOLERANCE
+    return AlgorithmConfig.NUMERICAL_TOLERANCE
+
+
+def pivot_array(
+    tableau: np.ndarray,
+    leaving_row: int,
+    entering_col: int,
+    tol: float,
+    allow_parallel: bool = True,
+) -> None:
+    """
+    Pivotea un arreglo de tableau en el lugar sobre (leaving_row, entering_col).
+
+    Es la operación numérica de ``Tableau.pivot`` sin validaciones ni actualización de
+    la base; también la usa el historial de pasos para reconstruir tableaus.
+
+    Args:
+        tableau: Arreglo (m+1) x (n+1) a modificar.
+        leaving_row: Fila del pivote.
+        entering_col: Columna del pivote.
+        tol: Los factores con valor absoluto menor o igual a ``tol`` no modifican su fila.
+        allow_parallel: False para no usar el kernel multihilo de Numba.
+    """
+    # Con Numba disponible el pivoteo se hace en un kernel compilado; el paralelo
+    # solo compensa en tableaus grandes
+    if kernels.NUMBA_AVAILABLE:
+        mode = kernels.select_pivot_mode(*tableau.shape, allow_parallel)
+        with kernels.limited_threads(mode == kernels.PIVOT_PARALLEL):
+            kernels.pivot(
+                tableau, leaving_row, entering_col, tol, mode, AlgorithmConfig.TABLEAU_TILE_SIZE
+            )
+        return
+
+    # Normalizar fila pivote
+    pivot_row = tableau[leaving_row]
+    pivot_row /= pivot_row[entering_col]
+
+    # Actualizar las demás filas con una única actualización de rango 1 (producto
+    # externo) restringida a las filas con factor no despreciable
+    factors = tableau[:, entering_col].copy()
+    factors[leaving_row] = 0.0
+    rows = np.flatnonzero(np.abs(factors) > tol)
+    if rows.size:
+        tableau[rows] -= np.outer(factors[rows], pivot_row)
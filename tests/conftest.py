@@ -154,6 +154,36 @@ def diet_problem():
     }
 
 
+@pytest.fixture
+def beale_cycling_problem():
+    """
+    Ejemplo de ciclado de Beale (minimización) con restricciones redundantes.
+
+    Con la regla de Dantzig, 6 pivoteos degenerados vuelven a la base inicial antes de
+    que el contador de pivoteos degenerados supere las 9 variables básicas.
+
+    Retorna:
+        Un diccionario con los datos del problema.
+    """
+    return {
+        "c": [-0.75, 20, -0.5, 6],
+        "A": [
+            [0.25, -8, -1, 9],
+            [0.5, -12, -0.5, 3],
+            [0, 0, 1, 0],
+            [0, 1, 0, 0],
+            [0, 0, 0, 1],
+            [0, 1, 0, 1],
+            [1, 0, 0, 0],
+            [1, 0, 0, 1],
+            [1, 1, 0, 0],
+        ],
+        "b": [0, 0, 1, 10, 10, 10, 10, 10, 10],
+        "constraint_types": ["<="] * 9,
+        "maximize": False,
+    }
+
+
 # ==================== Funciones Auxiliares ====================
 
 
@@ -14,6 +14,14 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from simplex_solver.solver import SimplexSolver
 from simplex_solver.reporting_pdf import generate_pdf
+from simplex_solver.export import (
+    _FlowableStream,
+    _build_iteration_block,
+    _extend_var_names,
+    _format_range,
+    _format_var_name,
+    _row_runs,
+)
 
 
 class TestPDFExport(unittest.TestCase):
@@ -138,6 +146,71 @@ class TestPDFExport(unittest.TestCase):
             self.assertIn("optimality_ranges", analysis)
             self.assertIn("feasibility_ranges", analysis)
 
+    def test_iteration_block_per_step(self):
+        """
+        Verifica que cada paso produzca su bloque (título, tabla y espaciado) sin el documento.
+        """
+        steps = self.result["steps"]
+        last_idx = len(steps) - 1
+        for idx, step in enumerate(steps):
+            block = _build_iteration_block(
+                step, idx, last_idx, self.result.get("n_original_vars", 0), 480
+            )
+            title = block[0].getPlainText()
+            self.assertTrue(title.startswith(f"Iteración {step['iteration']}"))
+            # Con pivoteo se agrega la línea de variables que entran y salen
+            expected_len = 4 if step["entering_var"] is None else 5
+            self.assertEqual(len(block), expected_len)
+
+    def test_flowable_stream_builds_blocks_on_demand(self):
+        """
+        Verifica que los bloques pendientes se tomen del iterador solo a medida que se consumen.
+        """
+        produced = []
+
+        def blocks():
+            for i in range(10):
+                produced.append(i)
+                yield i
+
+        stream = _FlowableStream(["a", "b"], blocks(), lookahead=3)
+        self.assertEqual(produced, [0])
+        self.assertEqual(list(stream), ["a", "b", 0])
+
+        consumed = []
+        while len(stream):
+            consumed.append(stream[0])
+            del stream[0]
+            self.assertLessEqual(len(stream), 3)
+        self.assertEqual(consumed, ["a", "b", *range(10)])
+
+    def test_var_names_table_matches_formatter(self):
+        """
+        Verifica que la tabla de nombres coincida con el formateo por variable y crezca a demanda.
+        """
+        names = _extend_var_names([], 3, 2)
+        self.assertEqual(names, ["x1", "x2", "s1"])
+        self.assertIs(_extend_var_names(names, 2, 2), names)
+        self.assertEqual(len(names), 3)
+        _extend_var_names(names, 6, 2)
+        self.assertEqual(names, [_format_var_name(i, 2) for i in range(6)])
+
+    def test_format_range_open_ends(self):
+        """
+        Verifica el formato de los rangos de sensibilidad, con ±∞ en los extremos abiertos.
+        """
+        self.assertEqual(_format_range(float("-inf"), 2.5), "[-∞, 2.500000]")
+        self.assertEqual(_format_range(1.0, float("inf")), "[1.000000, +∞]")
+        self.assertEqual(_format_range(-1.25, 3.0), "[-1.250000, 3.000000]")
+
+    def test_row_runs_groups_consecutive_rows(self):
+        """
+        Verifica que las filas consecutivas se agrupen en un solo tramo.
+        """
+        self.assertEqual(_row_runs([]), [])
+        self.assertEqual(_row_runs([4]), [(4, 4)])
+        self.assertEqual(_row_runs([1, 2, 3, 5, 7, 8]), [(1, 3), (5, 5), (7, 8)])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -3,12 +3,17 @@ Test básico del sistema de logging.
 Verifica que el sistema se inicializa correctamente y registra eventos.
 """
 
+import sqlite3
+import subprocess
 import sys
 import os
 
+import pytest
+
 # Agregar el directorio raíz al path para permitir importaciones
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
+from simplex_solver.log_viewer import LogViewer
 from simplex_solver.logging_system import logger, LogLevel
 
 
@@ -87,5 +92,92 @@ def test_logging_system():
     print("O ejecuta: python view_logs.py")
 
 
+def test_min_level_filters_and_defers_formatting(monkeypatch):
+    """
+    Con un nivel mínimo mayor, los eventos inferiores no se registran ni se formatean.
+    """
+    written = []
+    monkeypatch.setattr(logger, "_print_log", lambda level, message, *a: written.append(message))
+
+    class Explodes:
+        def __str__(self):
+            raise AssertionError("no debe formatearse")
+
+    previous = logger.min_level
+    try:
+        logger.set_level(LogLevel.WARNING)
+        assert not logger.is_enabled_for(LogLevel.DEBUG)
+        assert logger.is_enabled_for(LogLevel.ERROR)
+
+        logger.debug("Valor: %s", Explodes())
+        logger.warning("Iteración %d de %d", 3, 10)
+    finally:
+        logger.set_level(previous)
+
+    assert written == ["Iteración 3 de 10"]
+
+
+def test_min_level_read_from_configuration():
+    """
+    El nivel mínimo se toma de SIMPLEX_LOG_LEVEL al iniciar; por defecto no se registra DEBUG.
+    """
+    code = "from simplex_solver.logging_system import logger; print(logger.min_level)"
+    root = os.path.join(os.path.dirname(__file__), "..")
+
+    def min_level(env_level):
+        env = {k: v for k, v in os.environ.items() if k != "SIMPLEX_LOG_LEVEL"}
+        if env_level is not None:
+            env["SIMPLEX_LOG_LEVEL"] = env_level
+        output = subprocess.run(
+            [sys.executable, "-c", code], cwd=root, env=env, capture_output=True, text=True
+        )
+        return output.stdout.split()[-1]
+
+    assert min_level(None) == LogLevel.INFO
+    assert min_level("debug") == LogLevel.DEBUG
+    assert min_level("desconocido") == LogLevel.INFO
+
+
+def test_viewer_queries_use_timestamp_indexes():
+    """
+    Las consultas del visor (filtrar y ordenar por fecha) recorren un índice sin ordenar en memoria.
+    """
+    conn = sqlite3.connect(logger.db_path)
+    try:
+        queries = [
+            ("SELECT * FROM logs WHERE level = ? ORDER BY timestamp DESC LIMIT 50", ("ERROR",)),
+            ("SELECT * FROM logs WHERE session_id = ? ORDER BY timestamp DESC", ("x",)),
+            ("SELECT * FROM solver_events ORDER BY timestamp DESC LIMIT 20", ()),
+            ("SELECT * FROM file_operations ORDER BY timestamp DESC LIMIT 20", ()),
+        ]
+        for query, params in queries:
+            plan = " ".join(row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + query, params))
+            assert "USING INDEX" in plan, plan
+            assert "TEMP B-TREE" not in plan, plan
+    finally:
+        conn.close()
+
+
+def test_log_viewer_reuses_one_connection(monkeypatch, capsys):
+    """
+    El visor hace todas sus consultas sobre una misma conexión y la libera al cerrarse.
+    """
+    logger.info("Mensaje para el visor de logs")
+    viewer = LogViewer(logger.db_path)
+    monkeypatch.setattr(
+        sqlite3, "connect", lambda *a, **k: pytest.fail("no debe abrir otra conexión")
+    )
+    answers = iter(["5", "", "visor de logs", "5", ""])
+    monkeypatch.setattr("builtins.input", lambda *a: next(answers))
+
+    viewer.view_recent_logs()
+    viewer.search_logs()
+    viewer.close()
+
+    assert "Mensaje para el visor de logs" in capsys.readouterr().out
+    with pytest.raises(sqlite3.ProgrammingError):
+        viewer._conn.execute("SELECT 1")
+
+
 if __name__ == "__main__":
     test_logging_system()
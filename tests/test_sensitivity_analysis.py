@@ -203,3 +203,167 @@ class TestSensitivityAnalysis:
         assert "restriccion_2" in analysis["shadow_prices"]
         assert abs(analysis["shadow_prices"]["restriccion_1"] - 15.0) < 1e-6
         assert abs(analysis["shadow_prices"]["restriccion_2"] - 20.0) < 1e-6
+
+    def test_sensitivity_in_result_is_lazy(self):
+        """
+        Prueba que el análisis incluido en el resultado solo se calcule al consultarlo.
+        """
+        solver = SimplexSolver()
+        result = solver.solve([80, 50], [[4, 2], [1, 1]], [200, 60], ["<=", "<="], True)
+
+        analysis = result["sensitivity_analysis"]
+        assert not analysis.is_computed
+
+        assert abs(analysis["shadow_prices"]["restriccion_1"] - 15.0) < 1e-6
+        assert analysis.is_computed
+        assert dict(analysis) == solver.get_sensitivity_analysis()
+
+    def test_sensitivity_can_be_skipped(self):
+        """
+        Prueba que include_sensitivity=False omita el análisis de sensibilidad.
+        """
+        solver = SimplexSolver()
+        result = solver.solve(
+            [80, 50], [[4, 2], [1, 1]], [200, 60], ["<=", "<="], True, include_sensitivity=False
+        )
+
+        assert result["status"] == "optimal"
+        assert result["sensitivity_analysis"] is None
+
+    def test_sensitivity_is_none_without_slack_columns(self):
+        """
+        Prueba que con todas las restricciones de igualdad el análisis quede en None.
+        """
+        solver = SimplexSolver()
+        result = solver.solve([3, 2], [[1, 1], [1, -1]], [4, 2], ["=", "="], True)
+
+        assert result["status"] == "optimal"
+        assert result["sensitivity_analysis"] is None
+
+    def test_lazy_sensitivity_survives_new_solve(self):
+        """
+        Prueba que un nuevo solve no altere el análisis perezoso de un resultado anterior.
+        """
+        solver = SimplexSolver()
+        first = solver.solve([80, 50], [[4, 2], [1, 1]], [200, 60], ["<=", "<="], True)
+        solver.solve([3, 5], [[1, 0], [0, 2]], [4, 12], ["<=", "<="], True)
+
+        analysis = first["sensitivity_analysis"]
+        assert abs(analysis["shadow_prices"]["restriccion_1"] - 15.0) < 1e-6
+        assert abs(analysis["shadow_prices"]["restriccion_2"] - 20.0) < 1e-6
+
+    def test_basic_var_range_uses_basis_row_lookup(self):
+        """Las básicas degeneradas (-1) se ignoran y cada básica usa su propia fila."""
+        import numpy as np
+        from simplex_solver.core.sensitivity import SensitivityAnalyzer
+
+        # x2 básica en la fila 0, una básica degenerada (-1) en la fila 1; x1 no básica
+        tableau = np.array(
+            [
+                [2.0, 1.0, 0.0, 4.0],
+                [-1.0, 0.0, 1.0, 3.0],
+                [6.0, 0.0, 0.0, 12.0],
+            ]
+        )
+        analyzer = SensitivityAnalyzer(tableau, [1, -1], num_vars=2, num_constraints=2)
+
+        assert analyzer._calculate_basic_var_range(1) == (float("-inf"), 3.0)
+        assert analyzer._calculate_basic_var_range(0) == (float("-inf"), float("inf"))
+
+    def test_feasibility_ranges_match_per_constraint_helper(self, monkeypatch):
+        """Los rangos calculados por bloques deben coincidir con la prueba por restricción."""
+        from simplex_solver.core.sensitivity import SensitivityAnalyzer
+
+        c = [5, 4, 3, 7]
+        A = [[2, 3, 1, 4], [4, 1, 2, 1], [3, 4, 2, 2], [1, 1, 1, 1], [0, 2, 1, 3]]
+        b = [40, 50, 60, 20, 30]
+        solver = SimplexSolver()
+        solver.solve(c, A, b, ["<="] * 5, True)
+
+        monkeypatch.setattr(SensitivityAnalyzer, "_RHS_BLOCK", 2)
+        analyzer = SensitivityAnalyzer(
+            solver.tableau.tableau, solver.tableau.basic_vars.tolist(), 4, 5
+        )
+        ranges = analyzer.calculate_feasibility_ranges(b)
+
+        for i, (b_min, b_max) in enumerate(ranges.values()):
+            min_delta, max_delta = analyzer._calculate_rhs_range(i)
+            assert (b_min, b_max) == (b[i] + min_delta, b[i] + max_delta)
+
+    def test_analyze_arrays_matches_analyze(self):
+        """analyze_arrays debe devolver los mismos valores que analyze, como arreglos."""
+        from simplex_solver.core.sensitivity import SensitivityAnalyzer
+
+        c = [80, 50]
+        b = [200, 60]
+        solver = SimplexSolver()
+        solver.solve(c, [[4, 2], [1, 1]], b, ["<=", "<="], True)
+        analyzer = SensitivityAnalyzer(
+            solver.tableau.tableau, solver.tableau.basic_vars.tolist(), 2, 2
+        )
+
+        analysis = analyzer.analyze(c, b)
+        arrays = analyzer.analyze_arrays(c, b)
+
+        assert arrays.shadow_prices.tolist() == list(analysis["shadow_prices"].values())
+        assert list(zip(arrays.optimality_min.tolist(), arrays.optimality_max.tolist())) == list(
+            analysis["optimality_ranges"].values()
+        )
+        assert list(zip(arrays.feasibility_min.tolist(), arrays.feasibility_max.tolist())) == list(
+            analysis["feasibility_ranges"].values()
+        )
+
+    def test_analyze_skips_missing_inputs(self):
+        """analyze devuelve un resultado nuevo en cada llamada y omite los rangos sin datos."""
+        import numpy as np
+        from simplex_solver.core.sensitivity import SensitivityAnalyzer
+
+        c = np.array([80.0, 50.0])
+        b = np.array([200.0, 60.0])
+        solver = SimplexSolver()
+        solver.solve(c, [[4, 2], [1, 1]], b, ["<=", "<="], True)
+        analyzer = SensitivityAnalyzer(
+            solver.tableau.tableau, solver.tableau.basic_vars.tolist(), 2, 2
+        )
+
+        analysis = analyzer.analyze(c, b)
+        again = analyzer.analyze(c, b)
+        assert again == analysis and again is not analysis
+
+        partial = analyzer.analyze(None, b)
+        assert partial["optimality_ranges"] == {}
+        assert partial["feasibility_ranges"] == analysis["feasibility_ranges"]
+        assert partial["shadow_prices"] == analysis["shadow_prices"]
+
+    def test_analyzer_normalizes_inputs(self):
+        """El analizador trabaja con un tableau float64 en orden C y una base np.intp."""
+        import numpy as np
+        from simplex_solver.core.sensitivity import SensitivityAnalyzer
+
+        tableau = np.asfortranarray(np.arange(12, dtype=np.float32).reshape(3, 4))
+        analyzer = SensitivityAnalyzer(tableau, [1, 2], num_vars=1, num_constraints=2)
+
+        assert analyzer.tableau.dtype == np.float64
+        assert analyzer.tableau.flags.c_contiguous
+        assert analyzer.basic_vars.dtype == np.intp
+
+        with pytest.raises(ValueError):
+            SensitivityAnalyzer(np.zeros(4), [0], num_vars=1, num_constraints=1)
+
+    def test_assume_clean_matches_default_on_clean_tableau(self):
+        """Con un tableau sin residuos, assume_clean da el mismo análisis."""
+        import numpy as np
+        from simplex_solver.core.sensitivity import SensitivityAnalyzer
+
+        c = [5, 4, 3]
+        b = [5, 11, 8]
+        solver = SimplexSolver()
+        solver.solve(c, [[2, 3, 1], [4, 1, 2], [3, 4, 2]], b, ["<="] * 3, True)
+        tableau = solver.tableau.tableau.copy()
+        tableau[np.abs(tableau) <= 1e-10] = 0.0
+        basic_vars = solver.tableau.basic_vars.copy()
+
+        expected = SensitivityAnalyzer(tableau, basic_vars, 3, 3).analyze(c, b)
+        clean = SensitivityAnalyzer(tableau, basic_vars, 3, 3, assume_clean=True)
+
+        assert clean.analyze(c, b) == expected
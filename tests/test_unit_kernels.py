@@ -0,0 +1,247 @@
+"""
+Pruebas unitarias de los kernels numéricos compilados con Numba.
+Se omiten automáticamente si Numba no está instalado.
+"""
+
+import threading
+
+import numpy as np
+import pytest
+
+numba = pytest.importorskip("numba")
+
+from simplex_solver import main as app_main
+from simplex_solver.config import AlgorithmConfig
+from simplex_solver.core.algorithm import SimplexSolver
+from simplex_solver.logging_system import logger
+from simplex_solver.utils import kernels
+from simplex_solver.utils.tableau import Tableau
+
+
+def _reference_pivot(tableau, leaving_row, entering_col, tol):
+    """Pivoteo de referencia fila por fila (implementación original en NumPy)."""
+    tableau[leaving_row, :] /= tableau[leaving_row, entering_col]
+    for i in range(tableau.shape[0]):
+        if i != leaving_row:
+            factor = tableau[i, entering_col]
+            if abs(factor) > tol:
+                tableau[i, :] -= factor * tableau[leaving_row, :]
+
+
+@pytest.fixture
+def random_tableau():
+    """Tableau aleatorio con ceros dispersos y un pivote no nulo en (2, 3)."""
+    rng = np.random.default_rng(0)
+    tableau = rng.normal(size=(40, 60))
+    tableau[rng.random(tableau.shape) < 0.3] = 0.0
+    tableau[2, 3] = 1.7
+    return tableau
+
+
+@pytest.mark.parametrize("kernel_name", ["pivot_serial", "pivot_parallel"])
+def test_pivot_kernel_matches_reference(random_tableau, kernel_name):
+    """Los kernels de pivoteo deben producir exactamente el mismo tableau que NumPy."""
+    expected = random_tableau.copy()
+    _reference_pivot(expected, 2, 3, 1e-10)
+
+    getattr(kernels, kernel_name)(random_tableau, 2, 3, 1e-10)
+
+    assert np.array_equal(random_tableau, expected)
+
+
+@pytest.mark.parametrize("tile_size", [1, 7, 64])
+def test_tiled_pivot_matches_reference(random_tableau, tile_size):
+    """El pivoteo por bloques debe coincidir con la referencia para cualquier ancho de bloque."""
+    expected = random_tableau.copy()
+    _reference_pivot(expected, 2, 3, 1e-10)
+
+    kernels.pivot_tiled(random_tableau, 2, 3, 1e-10, tile_size)
+
+    assert np.array_equal(random_tableau, expected)
+
+
+def test_parallel_pivot_only_for_large_tableaus():
+    """El kernel paralelo solo se selecciona por encima de los umbrales configurados."""
+    assert not kernels.use_parallel_pivot(4, 7)
+    assert not kernels.use_parallel_pivot(32, 5000)
+    assert kernels.use_parallel_pivot(300, 400)
+
+
+@pytest.mark.parametrize("record_full_tableaux, chunk", [(True, 256), (False, 256), (False, 2)])
+def test_compiled_phase_matches_python_loop(monkeypatch, record_full_tableaux, chunk):
+    """
+    Resolver las fases con el bucle compilado run_phase (en bloques de ``chunk``
+    iteraciones) debe dar el mismo resultado y pasos; con copias del tableau por paso
+    se usa el bucle en Python.
+    """
+    rng = np.random.default_rng(1)
+    c = rng.integers(1, 10, size=8).tolist()
+    A = rng.integers(0, 6, size=(12, 8)).tolist()
+    b = rng.integers(5, 40, size=12).tolist()
+    A[0] = [1] * 8
+    b[0] = 3
+    constraint_types = [">="] + ["<="] * 11
+
+    monkeypatch.setattr(AlgorithmConfig, "COMPILED_PHASE_MIN_CELLS", 10**9)
+    expected = SimplexSolver().solve(c, A, b, constraint_types, maximize=True)
+    monkeypatch.setattr(AlgorithmConfig, "COMPILED_PHASE_MIN_CELLS", 0)
+    monkeypatch.setattr(AlgorithmConfig, "COMPILED_PHASE_CHUNK", chunk)
+    solver = SimplexSolver()
+    solver.record_full_tableaux = record_full_tableaux
+    result = solver.solve(c, A, b, constraint_types, maximize=True)
+
+    assert result["status"] == expected["status"] == "optimal"
+    assert expected["phase1_iterations"] > 0
+    assert result["iterations"] == expected["iterations"]
+    assert result.get("optimal_value") == expected.get("optimal_value")
+    assert len(result["steps"]) == len(expected["steps"])
+    for step, expected_step in zip(result["steps"], expected["steps"]):
+        assert step["basic_vars"] == expected_step["basic_vars"]
+        assert np.array_equal(step["tableau"], expected_step["tableau"])
+
+
+def test_run_phase_applies_bland_rule_on_cycling_example(monkeypatch):
+    """El bucle compilado debe activar la regla de Bland igual que el bucle en Python."""
+    c = [-0.75, 20, -0.5, 6]
+    A = [[0.25, -8, -1, 9], [0.5, -12, -0.5, 3], [0, 0, 1, 0]]
+    b = [0, 0, 1]
+
+    expected = SimplexSolver().solve(c, A, b, ["<=", "<=", "<="], maximize=False)
+    monkeypatch.setattr(AlgorithmConfig, "COMPILED_PHASE_MIN_CELLS", 0)
+    monkeypatch.setattr(AlgorithmConfig, "COMPILED_PHASE_CHUNK", 3)
+    result = SimplexSolver().solve(c, A, b, ["<=", "<=", "<="], maximize=False)
+
+    assert result["status"] == "optimal"
+    assert result["optimal_value"] == pytest.approx(-1.25)
+    assert result["iterations"] == expected["iterations"]
+    assert [s["entering_var"] for s in result["steps"]] == [
+        s["entering_var"] for s in expected["steps"]
+    ]
+
+
+def test_verbose_solve_uses_python_loop(monkeypatch):
+    """Con verbose_level > 0 la fase se resuelve en Python y registra la condición de optimalidad."""
+    messages = []
+    monkeypatch.setattr(AlgorithmConfig, "COMPILED_PHASE_MIN_CELLS", 0)
+    monkeypatch.setattr(logger, "info", lambda message, *args, **kwargs: messages.append(message))
+    monkeypatch.setattr(
+        kernels, "run_phase", lambda *a: pytest.fail("no debe usarse el bucle compilado")
+    )
+    SimplexSolver().solve([3, 5], [[1, 0], [0, 2]], [4, 12], ["<=", "<="], verbose_level=1)
+
+    assert any(m.startswith("Condición de optimalidad alcanzada") for m in messages)
+
+
+def test_limited_threads_caps_and_restores_calling_thread(monkeypatch):
+    """El límite de hilos se aplica solo dentro del bloque y luego se restaura."""
+    current = [16]
+    monkeypatch.setattr(numba, "get_num_threads", lambda: current[0])
+    monkeypatch.setattr(numba, "set_num_threads", lambda n: current.__setitem__(0, n))
+    monkeypatch.setattr(kernels.os, "cpu_count", lambda: 32)
+    monkeypatch.setattr(AlgorithmConfig, "MAX_PIVOT_THREADS", 4)
+
+    with kernels.limited_threads():
+        assert current[0] == 4
+    assert current[0] == 16
+
+    with kernels.limited_threads(active=False):
+        assert current[0] == 16
+
+
+def test_interactive_startup_warms_up_kernels_in_background(monkeypatch):
+    """Al abrir el menú, warmup() se ejecuta en un hilo aparte y no en el hilo principal."""
+    done = threading.Event()
+    callers = []
+
+    def fake_warmup():
+        callers.append(threading.current_thread())
+        done.set()
+
+    monkeypatch.setattr(kernels, "warmup", fake_warmup)
+    app_main._start_kernel_warmup()
+
+    assert done.wait(5)
+    assert callers[0] is not threading.main_thread()
+
+
+def test_warmup_compiles_solver_kernels():
+    """warmup() debe dejar compilados los kernels que usan las fases del solver."""
+    kernels.warmup()
+
+    for kernel in (kernels.pivot, kernels.simplex_step, kernels.run_phase):
+        assert kernel.signatures
+
+
+def test_parallel_optimality_ranges_match_numpy(monkeypatch):
+    """El kernel paralelo de rangos de optimalidad debe coincidir con la versión NumPy."""
+    rng = np.random.default_rng(3)
+    c = rng.integers(1, 20, size=12).tolist()
+    A = rng.integers(0, 10, size=(8, 12)).tolist()
+    b = rng.integers(10, 50, size=8).tolist()
+
+    expected = SimplexSolver().solve(c, A, b, ["<="] * 8, maximize=True)
+    monkeypatch.setattr(AlgorithmConfig, "PARALLEL_SENSITIVITY_MIN_VARS", 0)
+    result = SimplexSolver().solve(c, A, b, ["<="] * 8, maximize=True)
+
+    assert (
+        result["sensitivity_analysis"]["optimality_ranges"]
+        == expected["sensitivity_analysis"]["optimality_ranges"]
+    )
+    assert kernels.basic_var_deltas.signatures
+
+
+@pytest.mark.parametrize("window, expected_bland", [(0, False), (64, True)])
+def test_run_phase_detects_repeated_basis(window, expected_bland, beale_cycling_problem):
+    """run_phase debe activar la regla de Bland al repetirse una base, como _solve_phase."""
+    tab = Tableau()
+    tab.build_initial_tableau(**beale_cycling_problem)
+    basic_vars = tab.basic_vars
+    recent_bases = np.empty((window, basic_vars.shape[0]), dtype=np.intp)
+    recent_state = np.zeros(2, dtype=np.intp)
+    if window:
+        recent_bases[0] = basic_vars
+        recent_state[:] = (1, 1)
+    steps = np.empty(6, dtype=np.intp)
+    initial_basis = basic_vars.copy()
+
+    # Los 6 pivoteos del ciclo de Beale vuelven a la base inicial
+    status, pivoted, use_bland, degenerate_count, activations = kernels.run_phase(
+        tab.tableau,
+        basic_vars,
+        np.zeros(tab.tableau.shape[1] - 1, dtype=np.bool_),
+        False,
+        False,
+        False,
+        0,
+        tab.tol,
+        tab.tol,
+        kernels.PIVOT_SERIAL,
+        64,
+        steps,
+        steps.copy(),
+        steps.copy(),
+        recent_bases,
+        recent_state,
+    )
+
+    assert status == kernels.STEP_PIVOTED and pivoted == 6
+    assert degenerate_count == 6
+    assert np.array_equal(basic_vars, initial_basis)
+    assert use_bland is expected_bland
+    assert activations == int(expected_bland)
+
+
+def test_parallel_feasibility_ranges_match_numpy(monkeypatch):
+    """El kernel de rangos de factibilidad debe coincidir con la versión NumPy."""
+    rng = np.random.default_rng(4)
+    c = rng.integers(1, 20, size=6).tolist()
+    A = rng.integers(0, 10, size=(10, 6)).tolist()
+    b = rng.integers(10, 50, size=10).tolist()
+
+    expected = SimplexSolver().solve(c, A, b, ["<="] * 10, maximize=True)
+    expected_ranges = expected["sensitivity_analysis"]["feasibility_ranges"]
+    monkeypatch.setattr(AlgorithmConfig, "PARALLEL_SENSITIVITY_MIN_VARS", 0)
+    result = SimplexSolver().solve(c, A, b, ["<="] * 10, maximize=True)
+
+    assert result["sensitivity_analysis"]["feasibility_ranges"] == expected_ranges
+    assert kernels.rhs_deltas.signatures
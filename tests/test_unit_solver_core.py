@@ -1,8 +1,12 @@
+import numpy as np
 import pytest
 from unittest import mock
 
+from simplex_solver.config import AlgorithmConfig
+from simplex_solver.core import algorithm
 from simplex_solver.core.algorithm import SimplexSolver
-from simplex_solver.utils.tableau import Tableau
+from simplex_solver.utils import kernels
+from simplex_solver.utils.tableau import Tableau, pivot_array
 
 
 def test_simple_optimal_solution():
@@ -33,8 +37,7 @@ def test_unbounded_detected_via_mock(monkeypatch):
     constraint_types = ["<="]
 
     # Parchear métodos de Tableau utilizados por _solve_phase para forzar un resultado no acotado
-    monkeypatch.setattr(Tableau, "is_optimal", lambda self, maximize: False)
-    monkeypatch.setattr(Tableau, "get_entering_variable", lambda self, maximize: 0)
+    monkeypatch.setattr(Tableau, "optimality_and_entering", lambda self, maximize: (0, False))
     monkeypatch.setattr(Tableau, "is_unbounded", lambda self, col: True)
 
     result = solver.solve(c, A, b, constraint_types, maximize=True)
@@ -53,8 +56,13 @@ def test_infeasible_detected_via_mock(monkeypatch):
     b = [10]
     constraint_types = ["="]  # La igualdad causa variables artificiales
 
-    # Asegurar que phase1 se ejecute: is_optimal False para phase1 y phase2
-    monkeypatch.setattr(Tableau, "is_optimal", lambda self, maximize: False)
+    # Asegurar que phase1 se ejecute: sin óptimo detectado para phase1 y phase2
+    original = Tableau.optimality_and_entering
+    monkeypatch.setattr(
+        Tableau,
+        "optimality_and_entering",
+        lambda self, maximize: (original(self, maximize)[0], False),
+    )
     # Simular que phase1 termina pero las variables artificiales permanecen
     monkeypatch.setattr(Tableau, "has_artificial_vars_in_basis", lambda self: True)
 
@@ -62,3 +70,286 @@ def test_infeasible_detected_via_mock(monkeypatch):
 
     # Verificar que el estado detectado es "infeasible"
     assert result["status"] == "infeasible"
+
+
+def test_solve_does_not_mutate_array_inputs():
+    """Los arreglos NumPy recibidos no deben modificarse al normalizar filas con RHS negativo."""
+    solver = SimplexSolver()
+
+    c = np.array([2.0, 3.0])
+    A = np.array([[1.0, 1.0], [-1.0, -2.0]])
+    b = np.array([10.0, -4.0])
+    A_before, b_before = A.copy(), b.copy()
+
+    result = solver.solve(c, A, b, ["<=", "<="], maximize=True)
+
+    assert result["status"] == "optimal"
+    assert np.array_equal(A, A_before)
+    assert np.array_equal(b, b_before)
+
+
+def test_bland_rule_prevents_cycling():
+    """El ejemplo clásico de ciclado de Beale debe terminar en el óptimo gracias a la regla de Bland."""
+    solver = SimplexSolver()
+
+    c = [-0.75, 20, -0.5, 6]
+    A = [[0.25, -8, -1, 9], [0.5, -12, -0.5, 3], [0, 0, 1, 0]]
+    b = [0, 0, 1]
+
+    result = solver.solve(c, A, b, ["<=", "<=", "<="], maximize=False)
+
+    assert result["status"] == "optimal"
+    assert result["optimal_value"] == pytest.approx(-1.25)
+
+
+def test_reconstruct_basic_vars_matches_final_basis():
+    """La base reconstruida desde los cambios registrados debe coincidir con la base real."""
+    solver = SimplexSolver()
+
+    # Problema de dos fases: el historial cruza el cambio de numeración de columnas
+    c = [4, 3]
+    A = [[2, 1], [1, 3]]
+    b = [10, 15]
+    result = solver.solve(c, A, b, [">=", ">="], maximize=False)
+
+    assert result["status"] == "optimal"
+    steps = result["steps"]
+    assert solver.reconstruct_basic_vars(-1) == solver.tableau.basic_vars.tolist()
+    for idx, step in enumerate(steps):
+        assert step["basic_vars"] == solver.reconstruct_basic_vars(idx)
+        if step["entering_var"] is not None:
+            row = step["pivot_coords_next"]["leaving_row"]
+            assert step["basic_vars"][row] == step["leaving_var"]
+
+
+def test_lazy_step_tableaux_match_full_recording():
+    """Los tableaus reconstruidos desde los pivoteos deben ser idénticos a las copias completas."""
+    c = [4, 3]
+    A = [[2, 1], [1, 3]]
+    b = [10, 15]
+
+    eager = SimplexSolver()
+    eager.record_full_tableaux = True
+    expected = eager.solve(c, A, b, [">=", ">="], maximize=False)["steps"]
+
+    lazy = SimplexSolver()
+    steps = lazy.solve(c, A, b, [">=", ">="], maximize=False)["steps"]
+
+    assert len(steps) == len(expected)
+    for idx in reversed(range(len(steps))):
+        assert np.array_equal(steps[idx]["tableau"], expected[idx]["tableau"])
+    assert lazy.replay_steps() is steps
+
+
+def test_alternative_optimal_solutions_are_distinct():
+    """Con costos reducidos nulos se deben reportar todas las soluciones óptimas distintas."""
+    solver = SimplexSolver()
+
+    result = solver.solve([1, 1, 1], [[1, 1, 1]], [5], ["<="], maximize=True)
+
+    assert result["status"] == "optimal"
+    assert result["has_alternative_solutions"]
+    assert result["solutions"] == [
+        {"x1": 5.0, "x2": 0.0, "x3": 0.0},
+        {"x1": 0.0, "x2": 5.0, "x3": 0.0},
+        {"x1": 0.0, "x2": 0.0, "x3": 5.0},
+    ]
+    # La búsqueda de alternativas no debe alterar el tableau óptimo ni su base
+    final_step = result["steps"][-1]
+    assert (solver.tableau.tableau == final_step["tableau"]).all()
+    assert solver.tableau.basic_vars.tolist() == final_step["basic_vars"]
+
+
+def test_parallel_alternative_search_matches_serial(monkeypatch):
+    """La exploración de alternativas en paralelo debe dar las mismas soluciones y estado."""
+    c = [1, 1, 1, 1]
+    A = [[1, 1, 1, 1], [1, 0, 0, 0]]
+    b = [6, 4]
+
+    serial_solver = SimplexSolver()
+    serial = serial_solver.solve(c, A, b, ["<=", "<="], maximize=True)
+
+    monkeypatch.setattr(
+        SimplexSolver, "_use_parallel_alternatives", staticmethod(lambda n, s: True)
+    )
+    parallel_solver = SimplexSolver()
+    parallel = parallel_solver.solve(c, A, b, ["<=", "<="], maximize=True)
+
+    assert parallel["has_alternative_solutions"]
+    assert parallel["solutions"] == serial["solutions"]
+    assert (parallel_solver.tableau.tableau == serial_solver.tableau.tableau).all()
+    assert parallel_solver.tableau.basic_vars.tolist() == serial_solver.tableau.basic_vars.tolist()
+
+
+def test_steps_are_slotted_records_convertible_to_dict():
+    """Los pasos no usan un __dict__ por instancia y se pueden exportar como diccionarios."""
+    solver = SimplexSolver()
+    result = solver.solve([3, 2], [[1, 1], [1, 0]], [4, 3], ["<=", "<="], maximize=True)
+
+    step = result["steps"][0]
+    assert not hasattr(step, "__dict__")
+    as_dict = step.to_dict()
+    assert set(as_dict) == set(step)
+    assert (as_dict["tableau"] == step["tableau"]).all()
+    assert as_dict["basic_vars"] == step["basic_vars"]
+    assert as_dict["pivot_coords_next"] == step["pivot_coords_next"]
+
+
+def test_numpy_pivot_matches_row_by_row_update(monkeypatch):
+    """El pivoteo NumPy (producto externo) debe coincidir exactamente con el de fila por fila."""
+    monkeypatch.setattr(kernels, "NUMBA_AVAILABLE", False)
+    rng = np.random.default_rng(1)
+    tableau = rng.normal(size=(30, 45))
+    tableau[rng.random(tableau.shape) < 0.3] = 0.0
+    tableau[4, 7] = -2.3
+
+    expected = tableau.copy()
+    expected[4, :] /= expected[4, 7]
+    for i in range(expected.shape[0]):
+        if i != 4 and abs(expected[i, 7]) > 1e-10:
+            expected[i, :] -= expected[i, 7] * expected[4, :]
+
+    pivot_array(tableau, 4, 7, 1e-10)
+
+    assert np.array_equal(tableau, expected)
+
+
+def test_non_verbose_solve_skips_basic_solution_extraction():
+    """Sin modo verbose no se construyen las soluciones intermedias de cada iteración."""
+    solver = SimplexSolver()
+    solver.verbose_level = 0
+
+    with mock.patch.object(
+        SimplexSolver, "_get_basic_solution", side_effect=AssertionError("no debe llamarse")
+    ):
+        result = solver.solve([3, 2], [[1, 1], [1, 0]], [4, 3], ["<=", "<="], maximize=True)
+
+    assert result["status"] == "optimal"
+    assert result["solution"] == {"x1": 3.0, "x2": 1.0}
+
+
+def test_phase2_tableau_is_c_contiguous():
+    """Al eliminar las columnas artificiales el tableau debe seguir en orden C (por filas)."""
+    solver = SimplexSolver()
+    result = solver.solve([4, 3], [[2, 1], [1, 3]], [10, 15], [">=", ">="], maximize=False)
+
+    assert result["status"] == "optimal"
+    assert solver.tableau.phase == 2
+    assert solver.tableau.tableau.flags["C_CONTIGUOUS"]
+    assert solver.tableau.tableau.dtype == np.float64
+
+
+def test_float64_array_inputs_are_not_copied():
+    """c y b en float64 se guardan sin copiar; las listas se convierten una sola vez."""
+    c = np.array([3.0, 2.0])
+    b = np.array([4.0, 3.0])
+    solver = SimplexSolver()
+
+    solver.solve(c, [[1, 1], [1, 0]], b, ["<=", "<="], maximize=True)
+
+    assert np.shares_memory(solver._original_c, c)
+    assert np.shares_memory(solver._original_b, b)
+
+    solver.solve([3, 2], [[1, 1], [1, 0]], [4, 3], ["<=", "<="], maximize=True)
+    assert solver._original_c.dtype == np.float64
+    assert solver._original_b.dtype == np.float64
+
+
+def test_solve_without_step_history():
+    """Con record_steps=False se obtiene la misma solución sin registrar pasos."""
+    args = ([4, 3], [[2, 1], [1, 3]], [10, 15], [">=", ">="])
+    expected = SimplexSolver().solve(*args, maximize=False)
+
+    solver = SimplexSolver()
+    result = solver.solve(*args, maximize=False, record_steps=False)
+
+    assert result["status"] == "optimal"
+    assert result["solution"] == expected["solution"]
+    assert result["iterations"] == expected["iterations"]
+    assert len(result["steps"]) == 0
+    assert solver.steps._checkpoints == []
+
+    # El historial vuelve a registrarse en la siguiente resolución
+    assert len(solver.solve(*args, maximize=False)["steps"]) == len(expected["steps"])
+
+
+def test_float32_tableau_is_opt_in(monkeypatch):
+    """Con TABLEAU_DTYPE="float32" se pivotea en float32 y se reporta en float64."""
+    args = ([80, 50], [[4, 2], [1, 1]], [200, 60], ["<=", "<="])
+    expected = SimplexSolver().solve(*args, maximize=True)
+
+    monkeypatch.setattr(AlgorithmConfig, "TABLEAU_DTYPE", "float32")
+    solver = SimplexSolver()
+    result = solver.solve(*args, maximize=True)
+
+    assert solver.tableau.tableau.dtype == np.float32
+    assert solver.tableau.tol == AlgorithmConfig.FLOAT32_TOLERANCE
+    assert result["status"] == "optimal"
+    assert result["optimal_value"] == pytest.approx(expected["optimal_value"], rel=1e-5)
+    assert result["solution"] == pytest.approx(expected["solution"], rel=1e-5)
+    shadow_prices = result["sensitivity_analysis"]["shadow_prices"]
+    assert shadow_prices == pytest.approx(
+        expected["sensitivity_analysis"]["shadow_prices"], rel=1e-5
+    )
+
+
+def test_bland_leaving_row_breaks_ties_by_basic_variable_index():
+    """Con la regla de Bland, un empate en el cociente sale la básica de menor índice."""
+    tab = Tableau()
+    # Filas 0 y 1 empatan en el cociente (2 / 1 = 4 / 2); sus básicas son x4 y x3
+    tab.tableau = np.array(
+        [[1.0, 0.0, 0.0, 1.0, 2.0], [2.0, 0.0, 1.0, 0.0, 4.0], [-1.0, 0, 0, 0, 0]]
+    )
+    tab.basic_vars = np.array([3, 2], dtype=np.intp)
+    tab.num_constraints = 2
+
+    assert tab.get_leaving_variable(0)[0] == 0
+    tab.use_bland = True
+    assert tab.get_leaving_variable(0)[0] == 1
+
+    if kernels.NUMBA_AVAILABLE:
+        for use_bland, expected in ((False, 0), (True, 1)):
+            row = kernels.find_leaving(tab.tableau, tab.basic_vars, 0, use_bland, tab.tol)
+            assert row == expected
+
+
+class _CooMatrix:
+    """Matriz dispersa mínima en formato COO (la interfaz que usa el solver de scipy.sparse)."""
+
+    def __init__(self, dense):
+        dense = np.asarray(dense, dtype=float)
+        self.shape = dense.shape
+        self.row, self.col = np.nonzero(dense)
+        self.data = dense[self.row, self.col]
+
+    def tocoo(self):
+        return self
+
+
+def test_sparse_constraint_matrix_matches_dense():
+    """Una matriz A dispersa debe dar el mismo tableau y resultado que la densa."""
+    c = [3, 5, 0, 2]
+    A = [[1, 0, 0, 1], [0, 2, 0, 0], [3, 2, 1, 0], [0, 0, 1, 1]]
+    b = [4, 12, 18, 6]
+    types = ["<=", "<=", "<=", ">="]
+
+    expected = SimplexSolver().solve(c, A, b, types)
+    result = SimplexSolver().solve(c, _CooMatrix(A), b, types)
+
+    assert result["status"] == expected["status"]
+    assert result["solution"] == expected["solution"]
+    assert result["optimal_value"] == expected["optimal_value"]
+    assert np.array_equal(result["steps"][0]["tableau"], expected["steps"][0]["tableau"])
+
+
+def test_repeated_basis_activates_bland_rule(monkeypatch, beale_cycling_problem):
+    """Una base repetida en una racha degenerada debe activar la regla de Bland."""
+    monkeypatch.setattr(AlgorithmConfig, "COMPILED_PHASE_MIN_CELLS", 10**9)
+    with mock.patch.object(algorithm.logger, "debug") as debug:
+        result = SimplexSolver().solve(**beale_cycling_problem)
+
+    assert result["status"] == "optimal"
+    assert result["optimal_value"] == pytest.approx(-1.25)
+    messages = [call.args[0] for call in debug.call_args_list]
+    assert "Base repetida en una racha degenerada, activando regla de Bland" in messages
+    assert not any("pivoteos degenerados consecutivos" in message for message in messages)
@@ -232,7 +232,10 @@ def launch_viewer() -> int:
             return 1
 
         viewer = LogViewer(str(db_path))
-        viewer.show_menu()
+        try:
+            viewer.show_menu()
+        finally:
+            viewer.close()
         return 0
     except Exception as e:
         print(f"[ERROR] Error al lanzar el visor: {e}")